@@ -4,8 +4,8 @@ MT_BallTracking.py - interactive color-calibrated ball tracker
 Real-time orange/red ball tracker using the MacBook camera and OpenCV.
 
 Author: MT & GitHub Copilot
-Version: 1.3.4
-Date: 2025-11-08
+Version: 1.3.5
+Date: 2026-10-17
 
 Purpose
 - Capture video from a local camera, detect and track an orange/red ball,
@@ -45,6 +45,7 @@ Revision History (major changes)
 - 1.3.3  2025-11-08  64x64 ROI square, thumbnail alignment, ΔHSV overlay baseline.
 - 1.3.4  2025-11-08  Terminal cursor + status logs, robust calibration stats load/save,
                      temporal consistency and adaptive S/V, mask debug overlay.
+- 1.3.5  2026-10-17 23:56  Median HSV from per-channel calcHist (no per-frame pixel sort).
 """
 
 import os, json, math, time, argparse
@@ -136,10 +137,26 @@ calib_hsv_median = None
 # -----------------------------------------------------------------------------
 # Calibration load/save (reference only; does not affect mask thresholds)
 # -----------------------------------------------------------------------------
+def hist_median_hsv(hsv_img, mask=None):
+    """Per-channel median of an HSV image (optionally masked) from 256-bin histograms.
+
+    Same ints as np.median(pixels, axis=0).astype(int), without gathering or sorting
+    pixels. Returns None when no pixel is selected.
+    """
+    hists = [cv2.calcHist([hsv_img], [ch], mask, [256], [0, 256]).ravel() for ch in range(3)]
+    n = int(hists[0].sum())
+    if n == 0:
+        return None
+    ranks = np.array([(n - 1) // 2, n // 2])
+    med = []
+    for hist in hists:
+        lo_v, hi_v = np.searchsorted(np.cumsum(hist), ranks, side="right")
+        med.append((int(lo_v) + int(hi_v)) // 2)
+    return tuple(med)
+
 def _median_hsv_of_bgr(img_bgr):
     hsv = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2HSV)
-    med = np.median(hsv.reshape(-1, 3), axis=0).astype(int)
-    return (int(med[0]), int(med[1]), int(med[2]))
+    return hist_median_hsv(hsv)
 
 def try_load_calibration():
     global calibrated_img, calibrated, sampled_hsv, calib_sample_point, show_calib_alert, calib_hsv_median
@@ -217,10 +234,7 @@ def roi_rect_around(cx, cy, size, img_w, img_h):
 def contour_median_hsv(hsv_img, contour):
     mask_c = np.zeros(hsv_img.shape[:2], dtype=np.uint8)
     cv2.drawContours(mask_c, [contour], -1, 255, -1)
-    pixels = hsv_img[mask_c==255]
-    if pixels.size < 3: return None
-    med = np.median(pixels, axis=0).astype(int)
-    return tuple(int(x) for x in med)
+    return hist_median_hsv(hsv_img, mask_c)
 
 def hue_distance(h1, h2):
     d = abs(h1 - h2)
@@ -541,8 +555,7 @@ def main(camera_index=0):
                 # Median HSV only for display
                 mask_c = np.zeros(hsv.shape[:2], dtype=np.uint8)
                 cv2.drawContours(mask_c, [c], -1, 255, -1)
-                pixels = hsv[mask_c == 255]
-                med_hsv = tuple(np.median(pixels, axis=0).astype(int)) if pixels.size >= 9 else (0, 0, 0)
+                med_hsv = hist_median_hsv(hsv, mask_c) or (0, 0, 0)
                 best = (int(cen[0]), int(cen[1]), rad, med_hsv)
 
         if best:
@@ -680,7 +693,7 @@ def main(camera_index=0):
             cv2.putText(frame, coord_label, (tx, ty), font, 0.45, (255,255,255), 1, cv2.LINE_AA)
             roi_hsv = hsv[y1:y2, x1:x2]
             if roi_hsv.size:
-                med_vals = np.median(roi_hsv.reshape(-1, 3), axis=0).astype(int)
+                med_vals = hist_median_hsv(roi_hsv)
                 med_label = f"ROI HSV med: ({med_vals[0]},{med_vals[1]},{med_vals[2]})"
                 (mw, mh), _ = cv2.getTextSize(med_label, font, 0.40, 1)
                 mtx = max(2, min(frame.shape[1] - mw - 2, x1 + (64 - mw) // 2))
@@ -11,6 +11,8 @@
      Handles tracking transitions, full/body control, lost-ball search,
      and close-enough completion/barking logic.
 
+ v1.01  (2026-10-18 00:12)    : Cheaper bark gate
+     • bark_should_run() checks the OFF/latched completion state first and drops the getattr/try chains.
  v1.00  (2026-01-31 22:25)    : Initial ball tracking controller extraction
      • Move tracking helpers + close-enough/bark logic into controller.
 ===============================================================================
@@ -129,28 +131,18 @@ class BallTrackingController:
             pass
 
     def bark_should_run(self) -> bool:
-        host = self._host
         """Barking should only run after FULL completion reaches OFF and we still have a ball lock."""
-        try:
-            mode = getattr(host.ball_tracker, "tracking_mode", None)
-        except Exception:
-            mode = None
-        try:
-            missed = int(getattr(host.ball_tracker, "missed_frames", 0) or 0)
-        except Exception:
-            missed = 0
-
-        return bool(
-            host.ball_mode_enabled
-            and host.use_dog_video
-            and host.dog_client is not None
-            and getattr(host.dog_client, "tcp_flag", False)
-            and getattr(host, "server_control_ok", False)
-            and mode == TRACKING_MODE_FULL
-            and bool(getattr(host, "_close_enough_latched", False))
-            and str(getattr(host, "_close_enough_seq_state", "")) == "off"
-            and missed == 0
-        )
+        host = self._host
+        # Cheapest/rarest gate first: outside the OFF completion phase this returns after two reads.
+        if host._close_enough_seq_state != "off" or not host._close_enough_latched:
+            return False
+        if not (host.ball_mode_enabled and host.use_dog_video and host.server_control_ok):
+            return False
+        client = host.dog_client
+        if client is None or not getattr(client, "tcp_flag", False):
+            return False
+        tracker = host.ball_tracker
+        return tracker.tracking_mode == TRACKING_MODE_FULL and not tracker.missed_frames
 
     def trigger_close_enough_sequence(self, *, ball_diameter: float | None, frame_w: float):
         host = self._host
@@ -10,6 +10,23 @@
      Client (Mac) camera controller extracted from mtDogMain.py (CameraWindow).
      Handles camera selection, retry logic, and UI combo population.
 
+ v1.09  (2026-10-17 23:55)    : Shorter open probe
+     • require_frame waits 30 ms and reads once; a single 50 ms retry replaces the 3x read/sleep loop.
+ v1.08  (2026-10-17 23:55)    : Low-latency capture hints
+     • open_client_camera_index requests CAP_PROP_BUFFERSIZE=1 and MJPG FOURCC; unsupported settings keep defaults.
+ v1.07  (2026-10-17 23:54)    : Cheaper duplicate-log check
+     • log_client_cam compares against _client_cam_last_msg directly (no getattr/str copy per call).
+ v1.06  (2026-10-17 23:52)    : Cached device-name enumeration
+     • _get_avfoundation_device_names reuses a process-wide 5 s cache (_AVF_DEVICES_CACHE).
+     • rescan_client_cameras() invalidates device-name and index caches, then rebuilds the selector.
+ v1.05  (2026-10-17 23:46)    : Enumerate client cameras without opening them
+     • _scan_client_camera_indices uses QCameraInfo when it reports devices; VideoCapture probing is the fallback.
+     • Scan results are cached for 5 s.
+ v1.04  (2026-10-17 23:46)    : Exponential reopen backoff
+     • Failed open scans double the retry delay (from CLIENT_CAMERA_RETRY_SEC, cap 60 s); success resets it.
+ v1.03  (2026-10-17 23:45)    : Background client camera reader
+     • ClientCameraReader runs cap.read() on a daemon thread; newest frame wins (deque maxlen=1).
+     • release_client_camera() serializes release against an in-flight read.
  v1.02  (2026-02-02)          : Default MacBook camera
      • Prefer Index 1 (MacBook) by default and update label casing.
  v1.01  (2026-02-01)          : Friendlier camera labels
@@ -21,9 +38,12 @@
 
 from __future__ import annotations
 
+import threading
 import time
+from collections import deque
 
 import cv2
+import numpy as np
 
 try:
     from PyQt5.QtMultimedia import QCameraInfo
@@ -37,10 +57,84 @@ except Exception:
 
 from config.mtDogConfig import CLIENT_CAMERA_INDEX_ORDER, CLIENT_CAMERA_RETRY_SEC
 
+_CLIENT_CAM_BACKOFF_MAX_S = 60.0
+_CLIENT_CAM_SCAN_TTL_S = 5.0
+
+# Process-wide device-name cache: AVFoundation/QCameraInfo enumeration probes hardware.
+_AVF_DEVICES_CACHE = {"ts": 0.0, "names": []}
+
+
+class ClientCameraReader:
+    """Background `cap.read()` loop for the client camera (newest frame wins).
+
+    The Qt frame timer only takes the latest frame, so a blocking AVFoundation
+    read never stalls the GUI event loop. `lock` serializes read() against
+    release(); callers must release `host.cap` via `ClientCameraController.release_client_camera`.
+    """
+
+    def __init__(self, host):
+        self._host = host
+        self.lock = threading.Lock()
+        self._latest: deque = deque(maxlen=1)
+        self._fail_count = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def clear(self) -> None:
+        self._latest.clear()
+        self._fail_count = 0
+
+    def take_latest(self):
+        """Return (frame or None, consecutive read failures); each frame is handed out once."""
+        try:
+            frame = self._latest.pop()
+        except IndexError:
+            frame = None
+        return frame, self._fail_count
+
+    def _worker(self) -> None:
+        host = self._host
+        while not self._stop.is_set():
+            # Idle while Dog video is shown (the Mac camera stays open but unread).
+            if host.use_dog_video and host.dog_client is not None:
+                self._stop.wait(0.05)
+                continue
+            ret = None
+            cam_frame = None
+            with self.lock:
+                cap = host.cap
+                if cap is not None and cap.isOpened():
+                    try:
+                        ret, cam_frame = cap.read()
+                    except Exception:
+                        ret = False
+            if ret is None:
+                self._stop.wait(0.02)
+            elif ret and isinstance(cam_frame, np.ndarray):
+                self._fail_count = 0
+                self._latest.append(cam_frame)
+            else:
+                self._fail_count += 1
+                self._stop.wait(0.01)
+
 
 class ClientCameraController:
     def __init__(self, host):
         self._host = host
+        self.reader = ClientCameraReader(host)
 
         # Client camera (Mac side) preference / retry
         host._client_cam_indices = list(CLIENT_CAMERA_INDEX_ORDER)
@@ -50,17 +144,46 @@ class ClientCameraController:
             host._client_cam_indices = [1] + [i for i in host._client_cam_indices if i != 1]
         host._client_cam_opened_index = None
         host._client_cam_next_try_ts = 0.0
+        # Reopen backoff: doubles per failed scan (cap 60 s), resets on success.
+        host._client_cam_fail_streak = 0
+        host._client_cam_backoff_s = float(CLIENT_CAMERA_RETRY_SEC)
         host._client_cam_try_pos = 0
         host._client_cam_fail_count = 0
         host._client_cam_fail_limit = 10
         host._client_cam_last_log_ts = 0.0
         host._client_cam_combo_map = []
         host._client_cam_last_msg = ""
+        host._client_cam_indices_cache = None  # (timestamp, indices) from the last scan
+
+    def release_client_camera(self) -> None:
+        """Release `host.cap` (waits for an in-flight background read) and drop stale frames."""
+        host = self._host
+        with self.reader.lock:
+            cap = host.cap
+            host.cap = None
+            if cap is not None:
+                try:
+                    cap.release()
+                except Exception:
+                    pass
+        self.reader.clear()
+
+    def _note_client_cam_open_ok(self) -> None:
+        host = self._host
+        host._client_cam_fail_streak = 0
+        host._client_cam_backoff_s = float(CLIENT_CAMERA_RETRY_SEC)
+
+    def _schedule_client_cam_retry(self, now: float) -> None:
+        """Next reopen attempt after the current backoff; the backoff then doubles (max 60 s)."""
+        host = self._host
+        host._client_cam_fail_streak += 1
+        host._client_cam_next_try_ts = now + host._client_cam_backoff_s
+        host._client_cam_backoff_s = min(_CLIENT_CAM_BACKOFF_MAX_S, host._client_cam_backoff_s * 2.0)
 
     def log_client_cam(self, msg: str) -> None:
         host = self._host
-        last = str(getattr(host, "_client_cam_last_msg", "") or "")
-        if msg == last:
+        # _client_cam_last_msg is always a str (set in init), so compare directly.
+        if msg == host._client_cam_last_msg:
             return  # Suppress duplicate success messages
         print(msg)
         host._client_cam_last_msg = msg
@@ -79,17 +202,27 @@ class ClientCameraController:
                 except Exception:
                     pass
             return None
+        # Low-latency hints: keep only the newest frame queued and prefer MJPG over the
+        # raw 2vuy->BGRA path. Either set() may be unsupported (returns False): keep defaults.
+        try:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        except Exception:
+            pass
+        try:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        except Exception:
+            pass
         if require_frame:
+            # First frame usually lands within one frame period; retry once only if it did not.
             ok = False
-            for _ in range(3):
+            for wait_s in (0.03, 0.05):
+                time.sleep(wait_s)
                 try:
-                    ret, _ = cap.read()
+                    ok, _ = cap.read()
                 except Exception:
-                    ret = False
-                if ret:
-                    ok = True
+                    ok = False
+                if ok:
                     break
-                time.sleep(0.05)
             if not ok:
                 try:
                     cap.release()
@@ -110,6 +243,7 @@ class ClientCameraController:
                 host.cap = cap
                 host._client_cam_opened_index = idx
                 host._client_cam_fail_count = 0
+                self._note_client_cam_open_ok()
                 self.log_client_cam(f"[SRC] Client camera opened (index {idx}).")
                 return True
         host.cap = None
@@ -124,6 +258,7 @@ class ClientCameraController:
             if cap is not None:
                 host.cap = cap
                 host._client_cam_opened_index = idx
+                self._note_client_cam_open_ok()
                 opened = True
                 print(f"[INIT] Mac camera opened OK (index {idx}).")
                 break
@@ -131,14 +266,9 @@ class ClientCameraController:
             print("[INIT] ERROR: Mac camera could not be opened.")
             print("[INIT] HINT: Check System Settings > Privacy & Security > Camera")
             print("[INIT] HINT: Make sure Terminal/Python has camera permission")
-            if host.cap is not None:
-                try:
-                    host.cap.release()
-                except Exception:
-                    pass
-            host.cap = None
+            self.release_client_camera()
             host._client_cam_opened_index = None
-            host._client_cam_next_try_ts = time.time() + float(CLIENT_CAMERA_RETRY_SEC)
+            self._schedule_client_cam_retry(time.time())
 
     def iter_client_camera_indices(self):
         host = self._host
@@ -167,12 +297,28 @@ class ClientCameraController:
                 host.cap = cap
                 host._client_cam_opened_index = idx
                 host._client_cam_fail_count = 0
+                self._note_client_cam_open_ok()
                 self.log_client_cam(f"[SRC] Client camera opened (index {idx}).")
                 return
         host._client_cam_opened_index = None
-        host._client_cam_next_try_ts = now + float(CLIENT_CAMERA_RETRY_SEC)
+        self._schedule_client_cam_retry(now)
 
     def _get_avfoundation_device_names(self):
+        now = time.time()
+        if _AVF_DEVICES_CACHE["ts"] and (now - _AVF_DEVICES_CACHE["ts"]) < _CLIENT_CAM_SCAN_TTL_S:
+            return list(_AVF_DEVICES_CACHE["names"])
+        names = self._enumerate_device_names()
+        _AVF_DEVICES_CACHE["ts"] = now
+        _AVF_DEVICES_CACHE["names"] = list(names)
+        return names
+
+    def _avf_cache_invalidate(self) -> None:
+        """Forget cached device names and scan results (next refresh re-enumerates)."""
+        _AVF_DEVICES_CACHE["ts"] = 0.0
+        _AVF_DEVICES_CACHE["names"] = []
+        self._host._client_cam_indices_cache = None
+
+    def _enumerate_device_names(self):
         if QCameraInfo is not None:
             try:
                 cams = QCameraInfo.availableCameras()
@@ -202,7 +348,25 @@ class ClientCameraController:
 
     def _scan_client_camera_indices(self, max_index: int = 2):
         host = self._host
-        # Default to checking just 0, 1, 2 for speed and less log spam.
+        now = time.time()
+        cached = host._client_cam_indices_cache
+        if cached is not None and (now - cached[0]) < _CLIENT_CAM_SCAN_TTL_S:
+            return list(cached[1])
+        available = self._list_client_camera_indices(max_index)
+        host._client_cam_indices_cache = (now, list(available))
+        return available
+
+    def _list_client_camera_indices(self, max_index: int):
+        host = self._host
+        # Device enumeration is free compared to opening each index via AVFoundation.
+        if QCameraInfo is not None:
+            try:
+                n = len(QCameraInfo.availableCameras() or [])
+            except Exception:
+                n = 0
+            if n > 0:
+                return list(range(n))
+        # Fallback: probe by opening. Default to checking just 0, 1, 2 for speed and less log spam.
         candidates = list(dict.fromkeys(host._client_cam_indices + list(range(0, max_index + 1))))
         available = []
         for idx in candidates:
@@ -264,6 +428,11 @@ class ClientCameraController:
                     self.open_client_camera_best(preferred_index=first_index)
         host.mac_cam_combo.blockSignals(False)
 
+    def rescan_client_cameras(self):
+        """Manual "Rescan": drop the enumeration caches and rebuild the selector."""
+        self._avf_cache_invalidate()
+        self.refresh_client_camera_list(select_index=self._host._client_cam_opened_index)
+
     def on_mac_camera_changed(self, combo_index: int):
         host = self._host
         if combo_index is None or combo_index < 0:
@@ -278,12 +447,7 @@ class ClientCameraController:
         host.update_status_ui()
         # Prefer selected index first
         host._client_cam_indices = [target_index] + [i for i in host._client_cam_indices if i != target_index]
-        try:
-            if host.cap is not None:
-                host.cap.release()
-        except Exception:
-            pass
-        host.cap = None
+        self.release_client_camera()
         if self.open_client_camera_best(preferred_index=target_index):
             self.log_client_cam(f"[SRC] Client camera selected (index {host._client_cam_opened_index}).")
             return
@@ -10,6 +10,28 @@
      Frame update controller extracted from mtDogMain.py (CameraWindow).
      Handles per-frame capture, overlays, and detection/test-mode updates.
 
+ v1.14  (2026-10-18 00:26)    : EMA display/RX FPS
+     • display_fps / rx_fps come from an EMA of frame intervals (display_dt_ema / rx_dt_ema) updated every frame instead of once-per-second counters.
+ v1.13  (2026-10-18 00:25)    : image_ready flag for Dog frames
+     • Legacy dog_client path gates on dog_client.image_ready instead of an isinstance check on every tick.
+ v1.12  (2026-10-18 00:25)    : Skip detectors on unchanged frames
+     • Ball/CV Ball/Yolo detectors run only on new frames; repeated Dog frames reuse the last annotated frame, mask and ball_center (_last_detection) in the same mode.
+     • Legacy dog_client path copies the frame only when frame_seq changes.
+ v1.11  (2026-10-18 00:20)    : Cached no-video placeholders
+     • NO DOG VIDEO / NO CLIENT SOURCE frames are rendered once (_placeholder_frame) and re-rendered only when the debug line changes.
+     • Detection modes draw on a copy; last_display_frame_bgr is the captured frame itself.
+ v1.10  (2026-10-18 00:17)    : One clock read per tick for capture bookkeeping
+     • update_frame reads time.time() once and passes it to _capture_frame/_update_display_fps (display FPS, RX FPS, stall and frame timestamps).
+ v1.09  (2026-10-18 00:16)    : Copy the picker frame only when it can be drawn on
+     • last_display_frame_bgr references the captured frame unless Ball/CV Ball/Yolo/GPT Vision (the modes that draw on the BGR frame) is on.
+ v1.08  (2026-10-18 00:16)    : Copy Dog frames outside image_lock
+     • Legacy dog_client path takes the frame reference + frame_seq under the lock and copies after releasing it.
+ v1.07  (2026-10-18 00:15)    : Sequence-based Dog frame check
+     • Legacy dog_client path detects new frames by dog_client.frame_seq instead of np.array_equal on full frames.
+ v1.06  (2026-10-17 23:45)    : Take client frames from the reader thread
+     • Client branch no longer blocks on cap.read(); ticks without a new frame are skipped.
+     • _client_cam_fail_count still counts failing UI ticks (not the reader's ~10 ms retries), so the reopen limit keeps its timescale.
+     • Display FPS counts painted frames only.
  v1.05  (2026-02-07 20:42)    : Add pluggable Dog video source path
      • Read Dog video from `host.video_source` when available (SFU RTSP backend).
      • Keep legacy `dog_client.image` path as fallback for compatibility.
@@ -38,11 +60,27 @@ from PyQt5.QtGui import QImage, QPixmap
 from mtDogBallTrack import TRACKING_MODE_FULL, TRACKING_MODE_HEAD, TRACKING_MODE_BODY
 from ui.status_overlay_controller import StatusOverlayController
 
+_FPS_EMA_ALPHA = 0.1  # weight of the newest frame interval in the display/RX FPS averages
+
+
+def _ema_interval(prev: float, dt: float) -> float:
+    """EMA of frame intervals in seconds (a non-positive `prev` seeds from `dt`)."""
+    if prev <= 0.0:
+        return dt
+    return prev + _FPS_EMA_ALPHA * (dt - prev)
+
 
 class FrameUpdateController:
     def __init__(self, host):
         self._host = host
         self.status_overlay = StatusOverlayController(host)
+        self._last_dog_seq = None  # (client, frame_seq) of the last legacy dog_client frame
+        # "No video" placeholder frames, rendered once per (title, debug text): title -> (debug_text, frame)
+        self._placeholders: dict[str, tuple] = {}
+        self._frame_is_new = False  # set by _capture_frame: False for repeated Dog frames / placeholders
+        # Result of the last detector run, reused while the frame is unchanged:
+        # (mode_key, annotated BGR frame, mask, ball_center)
+        self._last_detection = None
 
     def update_frame(self):
         """
@@ -54,12 +92,17 @@ class FrameUpdateController:
         """
         host = self._host
 
-        frame = self._capture_frame()
+        # One clock read for the capture/FPS/stall bookkeeping of this tick.
+        frame = self._capture_frame(time.time())
         if frame is None:
             return
 
-        # Keep last BGR frame for picker clicks
-        host.last_display_frame_bgr = frame.copy()  # ** for HSV picker, before any drawing or ball tracking **
+        # Keep last BGR frame for picker clicks  ** for HSV picker, before any drawing or ball tracking **
+        host.last_display_frame_bgr = frame
+        # Only the detection modes draw on the BGR frame (overlays go onto the RGB copy); they get a
+        # private copy so the captured frame (also the cached placeholder / last Dog frame) stays clean.
+        if host.ball_mode_enabled or host.cv_ball_enabled or host.yolo_vision_enabled or host.ai_vision_enabled:
+            frame = frame.copy()
 
         frame, mask, abort_frame = self._run_detection_pipeline(frame)
         if abort_frame:
@@ -67,24 +110,36 @@ class FrameUpdateController:
         frame_rgb = self._apply_overlays(frame, mask)
         self._render_frame(frame_rgb)
 
-    def _update_display_fps(self):
+    def _update_display_fps(self, now: float):
         host = self._host
-        host.display_frame_count += 1
-        now = time.time()
-        if now - host.display_last_time >= 1.0:
-            host.display_fps = host.display_frame_count / (now - host.display_last_time)
-            host.display_frame_count = 0
-            host.display_last_time = now
-
-    def _capture_frame(self):
+        # Averaging intervals (not 1/dt samples) keeps the rate unbiased; gaps count as at most 1 s.
+        host.display_dt_ema = _ema_interval(host.display_dt_ema, min(now - host.display_last_time, 1.0))
+        host.display_last_time = now
+        host.display_fps = 1.0 / max(1e-6, host.display_dt_ema)
+
+    def _placeholder_frame(self, title: str, debug_text: str = ""):
+        """Cached black 640x480 "no video" frame; only re-rendered when the debug line changes.
+
+        Callers never draw on it: update_frame hands a copy to the detection pipeline.
+        """
+        cached = self._placeholders.get(title)
+        if cached is not None and cached[0] == debug_text:
+            return cached[1]
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        cv2.putText(frame, title, (40, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
+        if debug_text:
+            cv2.putText(frame, debug_text, (40, 180), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+        self._placeholders[title] = (debug_text, frame)
+        return frame
+
+    def _capture_frame(self, now: float):
         host = self._host
         frame = None
         new_dog_frame = False
 
-        self._update_display_fps()
-
         # Dog video (legacy socket or SFU RTSP backend)
         if host.use_dog_video and host.dog_client is not None:
+            self._update_display_fps(now)
             src = getattr(host, "video_source", None)
             if src is not None:
                 vf = src.read()
@@ -93,84 +148,62 @@ class FrameUpdateController:
                 if new_dog_frame:
                     host.last_dog_frame = frame.copy()
                     host.dog_has_recent_frame = True
-                    host.dog_last_frame_time = float(vf.timestamp or time.time())
+                    host.dog_last_frame_time = float(vf.timestamp or now)
                     host.video_stall = False
                 if vf.error:
                     host.video_source_last_error = str(vf.error)
             else:
-                with host.dog_client.image_lock:
-                    if isinstance(host.dog_client.image, np.ndarray):
-                        current = host.dog_client.image.copy()
-                        if host.last_dog_frame is None:
-                            new_dog_frame = True
-                        else:
-                            new_dog_frame = not np.array_equal(current, host.last_dog_frame)
-                        host.last_dog_frame = current
-                        frame = current
-                        if new_dog_frame:
-                            host.dog_has_recent_frame = True
-                            host.dog_last_frame_time = time.time()
-                            host.video_stall = False
+                client = host.dog_client
+                # image_ready: once a frame is published, client.image is always an ndarray.
+                if client.image_ready:
+                    with client.image_lock:
+                        image = client.image
+                        seq = (client, client.frame_seq)
+                    new_dog_frame = host.last_dog_frame is None or seq != self._last_dog_seq
+                    self._last_dog_seq = seq
+                    if new_dog_frame:
+                        # Copy outside the lock; the producer swaps in a new array per frame.
+                        host.last_dog_frame = image.copy()
+                    frame = host.last_dog_frame
+                    if new_dog_frame:
+                        host.dog_has_recent_frame = True
+                        host.dog_last_frame_time = now
+                        host.video_stall = False
 
             if frame is None:
-                now2 = time.time()
                 if host.last_dog_frame is not None:
                     frame = host.last_dog_frame
                 else:
-                    frame = np.zeros((480, 640, 3), dtype=np.uint8)
-                    cv2.putText(
-                        frame,
-                        "NO DOG VIDEO",
-                        (40, 120),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.8,
-                        (0, 0, 255),
-                        2,
-                    )
                     # Debug info: show video source status
                     debug_text = f"IP:{host.ip}:{host.video_port} | Socket2:{getattr(host.dog_client, 'client_socket2', None) is not None}"
-                    cv2.putText(
-                        frame,
-                        debug_text,
-                        (40, 180),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        (0, 255, 255),
-                        1,
-                    )
+                    frame = self._placeholder_frame("NO DOG VIDEO", debug_text)
                 if host.dog_last_frame_time is not None:
-                    if now2 - host.dog_last_frame_time > 2.0:
+                    if now - host.dog_last_frame_time > 2.0:
                         host.video_stall = True
                 host.dog_has_recent_frame = False
 
                 # If we're reusing the last frame for too long, RX FPS must decay to 0.
                 if host.video_stall:
                     host.rx_fps = 0.0
-                    host.rx_frame_count = 0
-                    host.rx_last_time = now2
+                    host.rx_dt_ema = 0.0
+                    host.rx_last_time = now
+
+            self._frame_is_new = new_dog_frame
 
             # ---- Receive FPS: count only when a new Dog frame arrives ----
             if new_dog_frame:
                 # Time since previous *new* frame – this is the true stream interval
-                now_rx = time.time()
-                if hasattr(host, "_last_rx_debug_time"):
-                    dt = (now_rx - host._last_rx_debug_time) * 1000.0
-                    # print(f"[RX-DEBUG] Dog new frame dt = {dt:.1f} ms")
-                host._last_rx_debug_time = now_rx
-
-                # FPS counter based on new frames
-                host.rx_frame_count += 1
-                if now_rx - host.rx_last_time >= 1.0:
-                    host.rx_fps = host.rx_frame_count / (now_rx - host.rx_last_time)
-                    host.rx_frame_count = 0
-                    host.rx_last_time = now_rx
+                dt = now - host.rx_last_time
+                # print(f"[RX-DEBUG] Dog new frame dt = {dt * 1000.0:.1f} ms")
+                host.rx_dt_ema = _ema_interval(host.rx_dt_ema, min(dt, 1.0))
+                host.rx_last_time = now
+                host.rx_fps = 1.0 / max(1e-6, host.rx_dt_ema)
             else:
                 # If we haven't seen a new frame recently, force RX FPS to 0.
-                now_rx = time.time()
-                if (now_rx - float(getattr(host, "rx_last_time", now_rx) or now_rx)) >= 1.0:
+                if now - host.rx_last_time >= 1.0:
                     host.rx_fps = 0.0
-                    host.rx_frame_count = 0
-                    host.rx_last_time = now_rx
+                    host.rx_dt_ema = 0.0
+                    host.rx_last_time = now
 
             # NEW: remember Dog frame height for head tracking
             if frame is not None:
@@ -180,21 +213,21 @@ class FrameUpdateController:
         else:
             host._retry_client_camera_if_needed()
             if host.cap is not None and host.cap.isOpened():
-                ret, cam_frame = host.cap.read()
-                if ret and isinstance(cam_frame, np.ndarray):
+                # Frames are read by ClientCameraReader's thread; take the newest one.
+                cam_frame, fail_count = host.client_camera.reader.take_latest()
+                if cam_frame is not None:
                     frame = cam_frame
+                    self._frame_is_new = True
                     host._client_cam_fail_count = 0
+                elif fail_count <= 0:
+                    return None  # No new camera frame since the last tick; keep the current paint.
                 else:
+                    # The reader retries every ~10 ms; count failing UI ticks so the reopen limit keeps its old timescale.
                     host._client_cam_fail_count += 1
                     host._log_client_cam("[SRC] Client source read failed.")
                     if host._client_cam_fail_count >= host._client_cam_fail_limit:
                         host._log_client_cam("[SRC] Client camera reopening after failures.")
-                        try:
-                            if host.cap is not None:
-                                host.cap.release()
-                        except Exception:
-                            pass
-                        host.cap = None
+                        host.client_camera.release_client_camera()
                         host._client_cam_opened_index = None
                         host._client_cam_next_try_ts = 0.0
                         host._client_cam_fail_count = 0
@@ -202,18 +235,11 @@ class FrameUpdateController:
                 host._log_client_cam("[SRC] Client source not opened or unavailable.")
 
             if frame is None:
-                frame = np.zeros((480, 640, 3), dtype=np.uint8)
-                cv2.putText(
-                    frame,
-                    "NO CLIENT SOURCE",
-                    (40, 120),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.8,
-                    (0, 0, 255),
-                    2,
-                )
+                frame = self._placeholder_frame("NO CLIENT SOURCE")
+                self._frame_is_new = False
 
             # In Mac mode we simply mirror the display FPS into rx_fps
+            self._update_display_fps(now)
             host.rx_fps = host.display_fps
 
         return frame
@@ -224,9 +250,25 @@ class FrameUpdateController:
         ball_center = None
         abort_frame = False
 
+        # Detector results only change with the pixels: while the Dog stream repeats its last frame
+        # (UI ticking faster than RX, stalls, placeholders) reuse the previous run in the same mode.
+        mode_key = (host.ball_mode_enabled, host.cv_ball_enabled, host.yolo_vision_enabled, host.yolo_detector is not None)
+        last = self._last_detection
+        reuse = (
+            last is not None
+            and not self._frame_is_new
+            and last[0] == mode_key
+            and frame is not None
+            and last[1].shape == frame.shape
+        )
+
         # IMPORTANT: autonomous tracking behavior (motion/head commands) must only run in "Ball" mode.
         # CV Ball / Yolo Vision / GPT Vision are test-only modes and must NOT move the dog.
-        if host.ball_mode_enabled and frame is not None:
+        if reuse:
+            # `frame` is update_frame's private copy in detection modes; paint the cached overlay into it.
+            _, annotated, mask, ball_center = last
+            np.copyto(frame, annotated)
+        elif host.ball_mode_enabled and frame is not None:
             # If Yolo Vision is enabled, prefer YOLO detections for tracking.
             if host.yolo_vision_enabled and host.yolo_detector is not None:
                 frame, ball_center = host.yolo_runtime.run_ball_mode(frame)
@@ -249,6 +291,11 @@ class FrameUpdateController:
             host._ball_locked = False
             host._ball_lock_source = ""
             host._ball_close_enough = False
+            self._last_detection = None
+        if not reuse and frame is not None and (host.ball_mode_enabled or host.cv_ball_enabled or host.yolo_vision_enabled):
+            # GPT Vision draws on `frame` below; keep its boxes out of the cached overlay.
+            annotated = frame.copy() if host.ai_vision_enabled else frame
+            self._last_detection = (mode_key, annotated, mask, ball_center)
 
         # Common tracking behavior (AUTONOMOUS) — ONLY for "Ball" mode.
         if host.ball_mode_enabled and frame is not None:
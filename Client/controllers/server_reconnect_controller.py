@@ -10,6 +10,8 @@
      Server check + reconnect controller extracted from mtDogMain.py / ui_event_handlers.py.
      Owns background server check thread and Dog/Mac reconnect flow.
 
+ v1.02  (2026-10-18 00:26)    : EMA FPS state
+     • Reconnect resets display_dt_ema / rx_dt_ema instead of the removed frame counters.
  v1.01  (2026-02-07 20:42)    : Integrate selected video backend probe/init
      • Reconnect now validates selected video path (SFU RTSP or legacy socket).
      • Close/init pluggable video source during Dog↔Mac mode switch.
@@ -77,10 +79,10 @@ class ServerReconnectController:
 
         # Reset FPS counters
         host.display_fps = 0.0
-        host.display_frame_count = 0
+        host.display_dt_ema = 0.0
         host.display_last_time = time.time()
         host.rx_fps = 0.0
-        host.rx_frame_count = 0
+        host.rx_dt_ema = 0.0
         host.rx_last_time = time.time()
 
         ip_ok = host.ping_ip(host.ip)
@@ -12,6 +12,17 @@
        - Legacy Pi JPEG socket frames (dog_client.image)
        - SFU RTSP pull (OpenCV/FFmpeg) for low-latency H264
 
+ v1.04  (2026-10-18 00:25)    : image_ready flag for Dog frames
+     • LegacyDogSocketSource.read() gates on dog_client.image_ready instead of an isinstance check on every read.
+ v1.03  (2026-10-18 00:22)    : Background RTSP reader
+     • SfuRtspSource reads on a daemon thread (newest frame wins) so FFmpeg's queue never holds stale frames.
+     • read() no longer blocks the UI tick; reopen attempts run on the thread every 1.0s.
+     • read() returns frame=None between frames, so the frame update's stall check and RX FPS decay still see gaps.
+     • Each reader thread has its own stop event; a capture opened after close() is released instead of stored. Only open() starts the thread.
+ v1.02  (2026-10-18 00:16)    : Copy legacy frames outside image_lock
+     • LegacySocketSource.read() holds the lock only to grab the frame reference and sequence number.
+ v1.01  (2026-10-18 00:15)    : Sequence-based new-frame check
+     • LegacySocketSource.read() compares dog_client.frame_seq instead of np.array_equal on full frames.
  v1.00  (2026-02-07)          : Initial extraction
      • Add backend-neutral interface and SFU RTSP source.
 ===============================================================================
@@ -20,13 +31,18 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
 import cv2
 import numpy as np
 
+# Delay between background RTSP reopen attempts after a failed open.
+_RTSP_REOPEN_DELAY_S = 1.0
+
 
 @dataclass
 class VideoFrame:
@@ -62,6 +78,7 @@ class LegacyDogSocketSource(BaseVideoSource):
     def __init__(self, host):
         self._host = host
         self._last_frame: np.ndarray | None = None
+        self._last_seq = None  # (client, frame_seq) of the last frame read
         self._last_ts = 0.0
 
     def open(self) -> bool:
@@ -69,6 +86,7 @@ class LegacyDogSocketSource(BaseVideoSource):
 
     def close(self) -> None:
         self._last_frame = None
+        self._last_seq = None
         self._last_ts = 0.0
 
     def read(self) -> VideoFrame:
@@ -77,22 +95,41 @@ class LegacyDogSocketSource(BaseVideoSource):
         is_new = False
         ts = self._last_ts
         try:
-            if host.dog_client is not None:
-                with host.dog_client.image_lock:
-                    if isinstance(host.dog_client.image, np.ndarray):
-                        current = host.dog_client.image.copy()
-                        is_new = self._last_frame is None or (not np.array_equal(current, self._last_frame))
-                        self._last_frame = current
-                        frame = current
-                        if is_new:
-                            ts = time.time()
-                            self._last_ts = ts
+            client = host.dog_client
+            # image_ready: once a frame is published, client.image is always an ndarray.
+            if client is not None and client.image_ready:
+                # Only the reference is taken under the lock: the producer swaps in a new array per
+                # frame rather than writing into the published one.
+                with client.image_lock:
+                    image = client.image
+                    # Keyed by client too: a reconnect creates a new Client whose counter restarts.
+                    seq = (client, client.frame_seq)
+                # Callers draw overlays on the returned frame, so hand out a private copy.
+                current = image.copy()
+                is_new = self._last_frame is None or seq != self._last_seq
+                self._last_seq = seq
+                self._last_frame = current
+                frame = current
+                if is_new:
+                    ts = time.time()
+                    self._last_ts = ts
         except Exception as e:
             return VideoFrame(frame=None, is_new=False, timestamp=0.0, error=str(e))
         return VideoFrame(frame=frame, is_new=is_new, timestamp=ts, error="")
 
 
 class SfuRtspSource(BaseVideoSource):
+    """RTSP pull with a background reader thread (newest frame wins).
+
+    The thread keeps calling cap.read(), so FFmpeg's queue never backs up with stale
+    frames and a blocking read never stalls the Qt frame timer. `read()` only takes
+    the latest decoded frame; between frames it returns frame=None, so the caller reuses its last
+    frame and its stall check sees the gap.
+    `_lock` serializes cap.read() against release. Each reader thread gets its own stop
+    event, so a thread still blocked in VideoCapture() after close() discards its capture.
+    The thread is started by open() only.
+    """
+
     backend = "sfu_rtsp"
 
     def __init__(self, rtsp_url: str, *, transport: str = "tcp"):
@@ -102,6 +139,10 @@ class SfuRtspSource(BaseVideoSource):
         self.last_err = ""
         self._last_ts = 0.0
         self._last_open_try_ts = 0.0
+        self._latest: deque = deque(maxlen=1)  # (frame, timestamp) from the reader thread
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
 
     def _set_ffmpeg_capture_opts(self):
         opts = f"rtsp_transport;{self.transport}|fflags;nobuffer|flags;low_delay|max_delay;0|stimeout;3000000"
@@ -111,11 +152,13 @@ class SfuRtspSource(BaseVideoSource):
         elif "rtsp_transport" not in prev:
             os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = prev + "|" + opts
 
-    def open(self) -> bool:
+    def _open_cap(self, stop: threading.Event) -> bool:
         if not self.rtsp_url:
             self.last_err = "empty RTSP URL"
             return False
-        self.close()
+        if stop.is_set():
+            return False
+        self._release_cap()
         self._last_open_try_ts = time.time()
         self._set_ffmpeg_capture_opts()
         try:
@@ -130,23 +173,78 @@ class SfuRtspSource(BaseVideoSource):
                     cap.release()
             except Exception:
                 pass
-            self.cap = None
             return False
         try:
             cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         except Exception:
             pass
-        self.cap = cap
+        with self._lock:
+            if stop.is_set():
+                # close() returned while VideoCapture() was blocking (stimeout ~3 s): don't leak it.
+                try:
+                    cap.release()
+                except Exception:
+                    pass
+                return False
+            self.cap = cap
         self.last_err = ""
         return True
 
+    def _release_cap(self) -> None:
+        with self._lock:
+            cap = self.cap
+            self.cap = None
+            if cap is not None:
+                try:
+                    cap.release()
+                except Exception:
+                    pass
+
+    def open(self) -> bool:
+        self.close()
+        self._stop = threading.Event()
+        ok = self._open_cap(self._stop)
+        self._start_reader()
+        return ok
+
     def close(self) -> None:
-        if self.cap is not None:
-            try:
-                self.cap.release()
-            except Exception:
-                pass
-        self.cap = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        self._release_cap()
+        self._latest.clear()
+
+    def _start_reader(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._worker, args=(self._stop,), daemon=True)
+        self._thread.start()
+
+    def _worker(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            if not self.is_ready():
+                # Reopen in the background (was: one blocking attempt per UI tick).
+                if not self._open_cap(stop):
+                    stop.wait(_RTSP_REOPEN_DELAY_S)
+                    continue
+            ok = False
+            frame = None
+            with self._lock:
+                cap = self.cap
+                if cap is not None:
+                    try:
+                        ok, frame = cap.read()
+                    except Exception as e:
+                        self.last_err = str(e)
+                        ok = False
+            if ok and isinstance(frame, np.ndarray):
+                self.last_err = ""
+                self._latest.append((frame, time.time()))
+            elif not stop.is_set():
+                if not self.last_err:
+                    self.last_err = "RTSP read failed"
+                self._release_cap()
 
     def is_ready(self) -> bool:
         return self.cap is not None and self.cap.isOpened()
@@ -170,37 +268,12 @@ class SfuRtspSource(BaseVideoSource):
             return False
 
     def read(self) -> VideoFrame:
-        if self.cap is None or not self.cap.isOpened():
-            if not self.open():
-                return VideoFrame(frame=None, is_new=False, timestamp=self._last_ts, error=self.last_err)
         try:
-            ok, frame = self.cap.read()
-        except Exception as e:
-            self.last_err = str(e)
-            ok = False
-            frame = None
-        if ok and isinstance(frame, np.ndarray):
-            ts = time.time()
-            self._last_ts = ts
-            self.last_err = ""
-            return VideoFrame(frame=frame, is_new=True, timestamp=ts, error="")
-        # Read failed: one quick reopen attempt.
-        self.close()
-        if self.open():
-            try:
-                ok2, frame2 = self.cap.read()
-            except Exception as e:
-                self.last_err = str(e)
-                ok2 = False
-                frame2 = None
-            if ok2 and isinstance(frame2, np.ndarray):
-                ts = time.time()
-                self._last_ts = ts
-                self.last_err = ""
-                return VideoFrame(frame=frame2, is_new=True, timestamp=ts, error="")
-        if not self.last_err:
-            self.last_err = "RTSP read failed"
-        return VideoFrame(frame=None, is_new=False, timestamp=self._last_ts, error=self.last_err)
+            frame, ts = self._latest.pop()
+        except IndexError:
+            return VideoFrame(frame=None, is_new=False, timestamp=self._last_ts, error=self.last_err)
+        self._last_ts = ts
+        return VideoFrame(frame=frame, is_new=True, timestamp=ts, error="")
 
 
 class VideoSourceController:
@@ -8,6 +8,11 @@ Summary   : Socket protocol handling (video + instruction channels), shared imag
 # Copilot GPT-5: use recv_exact pattern, not file.read(n), to avoid blocking.
 
 Revision History:
+- 1.10 (2026-10-18 00:25): Add image_ready (set under image_lock with the first published frame) so GUI readers skip
+                     the lock and type check until a frame exists.
+- 1.09 (2026-10-18 00:16): Publish the decoded frame without a copy when no ball/face processing touched it.
+- 1.08 (2026-10-18 00:15): Add frame_seq (bumped under image_lock with each published frame) so consumers detect
+                     new frames by sequence number instead of comparing pixels.
 - 1.07 (2025-11-13): Add periodic stall debug: print when no frame for >2s while waiting on recv; expose
                      video_last_frame_ts for GUI; minor log cleanups.
 - 1.06 (2025-11-13): Add periodic stall debug: print when no frame for >2s while waiting on recv; expose
@@ -23,7 +28,7 @@ Revision History:
 - 1.01 (2025-11-11): Add defensive socket cleanup with detailed debug logging; prevent AttributeError on 'connection.connection'; add safety checks for socket closure.
 - 1.00:   "Client.py" from Freenove Robot Dog Kit. Original code renamed as "Client.original.py" .
 """
-__version__ = "1.07 (2025-11-13)"
+__version__ = "1.10 (2026-10-18 00:25)"
 # =======================================================================================
 import io
 import copy
@@ -70,6 +75,10 @@ class Client:
 
         # Shared frame buffer (numpy BGR image); empty string until first decode
         self.image = ''
+        # Published-frame counter (bumped under image_lock); consumers compare it instead of pixels
+        self.frame_seq = 0
+        # Set (under image_lock) with the first published frame; from then on self.image is an ndarray
+        self.image_ready = False
 
         # Sockets / stream handles
         self.client_socket1 = None      # Command/telemetry socket (5001)
@@ -334,10 +343,14 @@ class Client:
                         self.face.face_detect(self.image)
                         work = self.image
 
-                    # Atomic publish to GUI
+                    # Atomic publish to GUI. A freshly decoded frame is never written again by this
+                    # thread, so it is handed over as-is; processed frames are published as a copy.
+                    published = work if work is frame else work.copy()
                     with self.image_lock:
-                        self.image = work.copy()  # publish a copy to avoid GUI races
+                        self.image = published
                         self.video_flag = False   # signal: fresh frame available
+                        self.frame_seq += 1
+                        self.image_ready = True
 
                     # Optional: run ball tracking here when enabled
                     if getattr(self, "ball_flag", False):
@@ -26,6 +26,12 @@ Features
 
 Revision History
 ----------------
+- v2.8.7: 2026-10-18 00:23
+          process_with_mask thresholds frames >= half_res_min_width (640) at half resolution; center/radius/areas are scaled back to full-frame coords.
+- v2.8.6: 2026-10-18 00:22
+          Cache the morphology kernel (morph_kernel, rebuilt in _clamp_all) and erode/dilate the inRange mask in place.
+- v2.8.5: 2026-10-18 00:09
+          Cache HSV inRange bounds (hsv_bounds, rebuilt in _clamp_all) and add hsv_mask(); touching H1/H2 bands are thresholded once.
 - v2.8.4: 2026-01-28
           Allow external detection overlays to set circle thickness (used by YOLO).
 - v2.8.3: 2026-01-28
@@ -267,6 +273,8 @@ class BallTracker:
         self.v_min = 80
         self.v_max = 255
         self.kernel_size = 3  # morphology kernel (odd)
+        self._update_hsv_bounds()  # self.hsv_bounds: cached inRange (lower, upper) pairs
+        self.morph_kernel = np.ones((3, 3), np.uint8)  # rebuilt in _clamp_all
 
         # Detection info (instant and smoothed)
         self.last_center = None      # (x, y) – smoothed center used by UI / head
@@ -284,6 +292,10 @@ class BallTracker:
         self.reacquire_timeout = 0.6  # seconds without update → allow bigger jumps
         self.reacquire_area_ratio = 0.02  # if blob area > 2% of frame, allow reacquire
 
+        # Frames at least this wide are thresholded at half resolution (0 = always full-res);
+        # contours/center/radius are scaled back to full-frame coords.
+        self.half_res_min_width = 640
+
         # Trace of recent centers (for visual trail)
         # Each entry: ( (x, y), timestamp_seconds )
         self.trace_points = deque(maxlen=60)
@@ -543,6 +555,42 @@ class BallTracker:
         self.kernel_size = max(1, min(15, int(self.kernel_size)))
         if self.kernel_size % 2 == 0:
             self.kernel_size += 1
+        if self.morph_kernel.shape[0] != self.kernel_size:
+            self.morph_kernel = np.ones((self.kernel_size, self.kernel_size), np.uint8)
+        self._update_hsv_bounds()
+
+    def _update_hsv_bounds(self):
+        """Rebuild the inRange bound arrays (every range change passes through _clamp_all).
+
+        H1/H2 bands that overlap or touch are merged into one (lower, upper) pair.
+        """
+        h1_min, h1_max = self.h1_min, self.h1_max
+        second = self.h2_max > self.h2_min
+        if second and self.h2_min <= h1_max + 1 and h1_min <= self.h2_max + 1:
+            h1_min, h1_max = min(h1_min, self.h2_min), max(h1_max, self.h2_max)
+            second = False
+        bounds = [
+            (
+                np.array([h1_min, self.s_min, self.v_min], np.uint8),
+                np.array([h1_max, self.s_max, self.v_max], np.uint8),
+            )
+        ]
+        if second:
+            bounds.append(
+                (
+                    np.array([self.h2_min, self.s_min, self.v_min], np.uint8),
+                    np.array([self.h2_max, self.s_max, self.v_max], np.uint8),
+                )
+            )
+        self.hsv_bounds = tuple(bounds)
+
+    def hsv_mask(self, hsv):
+        """Binary mask of `hsv` pixels inside the configured H1/H2 + S/V ranges."""
+        (lower, upper), *rest = self.hsv_bounds
+        mask = cv2.inRange(hsv, lower, upper)
+        for lower, upper in rest:
+            mask |= cv2.inRange(hsv, lower, upper)
+        return mask
 
     # ------------------------------------------------------------------
     # Range setters
@@ -597,23 +645,12 @@ class BallTracker:
             return None, None
 
         hsv = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
+        mask = self.hsv_mask(hsv)
 
-        lower1 = np.array([self.h1_min, self.s_min, self.v_min], np.uint8)
-        upper1 = np.array([self.h1_max, self.s_max, self.v_max], np.uint8)
-        mask1 = cv2.inRange(hsv, lower1, upper1)
-
-        if self.h2_max > self.h2_min:
-            lower2 = np.array([self.h2_min, self.s_min, self.v_min], np.uint8)
-            upper2 = np.array([self.h2_max, self.s_max, self.v_max], np.uint8)
-            mask2 = cv2.inRange(hsv, lower2, upper2)
-            mask = cv2.bitwise_or(mask1, mask2)
-        else:
-            mask = mask1
-
-        k = self.kernel_size
-        kernel = np.ones((k, k), np.uint8)
-        mask = cv2.erode(mask, kernel, iterations=1)
-        mask = cv2.dilate(mask, kernel, iterations=2)
+        # Morphology in place on the inRange buffer (no per-frame kernel/mask allocs)
+        kernel = self.morph_kernel
+        cv2.erode(mask, kernel, dst=mask, iterations=1)
+        cv2.dilate(mask, kernel, dst=mask, iterations=2)
         return hsv, mask
 
     # ------------------------------------------------------------------
@@ -630,12 +667,24 @@ class BallTracker:
         if frame_bgr is None:
             return None, frame_bgr
 
-        hsv, mask = self.compute_mask(frame_bgr)        # 
+        # --- threshold at half resolution on large frames (4x fewer pixels) ---
+        h, w = frame_bgr.shape[:2]
+        scale = 1
+        small = frame_bgr
+        if 0 < self.half_res_min_width <= w:
+            scale = 2
+            small = cv2.resize(frame_bgr, (w // 2, h // 2), interpolation=cv2.INTER_AREA)
+
+        hsv, mask = self.compute_mask(small)
         if mask is None:
             return None, frame_bgr
+        mask_small = mask
+        if scale != 1:
+            # Mask window / picker overlay expect a full-res mask.
+            mask = cv2.resize(mask_small, (w, h), interpolation=cv2.INTER_NEAREST)
 
         contours, _ = cv2.findContours(
-            mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            mask_small, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
         if not contours:
             # No ball this frame → keep previous center, mark as a miss
@@ -644,7 +693,8 @@ class BallTracker:
             return mask, frame_bgr
 
         # --- choose best contour: MAX AREA STRATEGY ---
-        h, w = hsv.shape[:2]
+        # Areas are measured on the (possibly half-res) mask and scaled to full-frame pixels.
+        area_scale = float(scale * scale)
         min_area = 0.0004 * (w * h)      # ignore very tiny blobs (noise)
         
         chosen_cnt = None
@@ -653,7 +703,7 @@ class BallTracker:
             # print(f"[BallTracker] Frame {w}×{h}, min_area={min_area:.1f}, found {len(contours)} contour(s)")
 
         for i, cnt in enumerate(contours):
-            area = cv2.contourArea(cnt)
+            area = cv2.contourArea(cnt) * area_scale
                 # print(f"  Contour {i}: area={area:.1f}, {'REJECTED (too small)' if area < min_area else 'OK'}")
             if area < min_area:
                 continue
@@ -673,7 +723,8 @@ class BallTracker:
         
         # --- got chosen contour ---
         (cx_f, cy_f), radius = cv2.minEnclosingCircle(chosen_cnt)
-        raw_center = (int(cx_f), int(cy_f))
+        radius *= scale
+        raw_center = (int(cx_f * scale), int(cy_f * scale))
 
         # --- jump rejection with smart reacquire ---
         if self.filtered_center is not None:
@@ -715,8 +766,9 @@ class BallTracker:
         self.last_update_ts = time.time()
 
         # HSV at smoothed center
-        cx = max(0, min(w - 1, fx))
-        cy = max(0, min(h - 1, fy))
+        hh, hw = hsv.shape[:2]
+        cx = max(0, min(hw - 1, fx // scale))
+        cy = max(0, min(hh - 1, fy // scale))
         H, S, V = [int(v) for v in hsv[cy, cx]]
         self.last_hsv = (H, S, V)
 
@@ -15,6 +15,37 @@ os.environ["OPENCV_VIDEOIO_DEBUG"] = "0"
         - `VIDEO_BACKEND = "legacy_socket"` (original Pi 8001 JPEG stream)
      2) Run: `python3 mtDogMain.py`
 
+ v3.49  (2026-10-18 00:26)    : EMA FPS state
+     • Replace display_frame_count / rx_frame_count with display_dt_ema / rx_dt_ema (frame-interval EMAs).
+ v3.48  (2026-10-18 00:13)    : Single motion-button slot
+     • Motion buttons carry their key in a 'cmd' property and share _on_motion_btn instead of seven lambdas.
+ v3.47  (2026-10-18 00:11)    : OpenCV threads set at startup
+     • __main__ enables OpenCV optimized paths and sets its thread pool to os.cpu_count() once before the window is built.
+ v3.46  (2026-10-17 23:52)    : Mac camera Rescan button
+     • Bottom-bar Rescan button drops cached camera enumeration and refreshes the selector.
+ v3.45  (2026-10-17 23:45)    : Start client camera reader thread
+     • Started next to the server check thread.
+ v3.44  (2026-10-17 23:41)    : Hoist attribute lookups in the confidence histogram
+     • _render_conf_hist binds cv2.rectangle locally and iterates hist.tolist().
+ v3.43  (2026-10-17 23:40)    : Training histogram paints QImage directly
+     • YoloTrainHistogramWindow.view is an ImageLabel fed by the histogram worker.
+ v3.42  (2026-10-17 23:39)    : Reused training histogram canvas
+     • _render_conf_hist fills a preallocated 480x160 canvas instead of np.zeros per call.
+ v3.41  (2026-10-17 23:39)    : Batched compare repaint
+     • YoloCompareWindow.update_views wraps both panes in setUpdatesEnabled(False/True).
+ v3.40  (2026-10-17 23:38)    : Uniform-bin confidence histogram
+     • np.histogram uses bins=20 + range instead of linspace edges.
+ v3.39  (2026-10-17 23:38)    : Training histogram takes ndarray input
+     • update_histogram snapshots the conf slice with one array copy (no list→ndarray rebuild).
+ v3.38  (2026-10-17 23:37)    : Shared YOLO window stylesheet
+     • Label/compare/train windows apply one _YOLO_WINDOW_QSS; labels opt in via objectName.
+ v3.37  (2026-10-17 23:36)    : Drop misplaced bind_yolo_controls
+     • Method moved to YoloVisionDebugWindow (its spin boxes never existed on YoloTrainHistogramWindow).
+ v3.36  (2026-10-17 23:35)    : Render training confidence histogram off the GUI thread
+     • YoloTrainHistogramWindow renders via HistogramWorker; GUI thread only swaps the pixmap.
+     • Removed its unused _set_pixmap/_render_hsv_hist/update_view (copied from the debug window; they referenced labels it never had).
+ v3.35  (2026-10-17 23:33)    : Reuse per-label RGB buffers for YOLO windows
+     • YOLO label/compare/train windows paint through ui.common_widgets.set_label_pixmap, which converts BGR→RGB into persistent per-window buffers (no QImage .copy()).
  v3.34  (2026-02-08 10:45)    : Restore WASD+QE motion keys
      • Reverted experimental motion keys to standard W/S (fwd/back), A/D (turns), Q/E (strafe).
      • Fixed command blocking when video backend is not "dog" (allow blind control).
@@ -346,12 +377,13 @@ from PyQt5.QtWidgets import (
     QSlider, QComboBox, QLineEdit, QCheckBox, QDoubleSpinBox, QSpinBox
 )
 from PyQt5.QtCore import Qt, QTimer, QEvent, QRect, QPoint
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QPen, QColor, QFont
+from PyQt5.QtGui import QImage, QPainter, QPen, QColor, QFont
 
 from ui.ai_hist_windows import AIVisionHistogramWindow
-from ui.common_widgets import ClickableLabel
+from ui.common_widgets import ClickableLabel, ImageLabel, set_label_pixmap
 from ui.control_panel_sections import ControlPanelSectionsBuilder
 from ui.cv_debug_windows import CVBallDebugWindow, CVBallHistogramWindow
+from ui.histogram_worker import HistogramWorker
 from ui.yolo_debug_windows import YoloVisionDebugWindow
 from controllers.ball_tracking_controller import BallTrackingController
 from controllers.client_camera_controller import ClientCameraController
@@ -444,25 +476,37 @@ HEAD_SERVO_ID = 8  # TODO: set this to your actual head-servo ID on the Dog
 
 
 
+# Shared stylesheet for the auxiliary YOLO windows (parsed once per window), widgets opt in via objectName.
+_YOLO_WINDOW_QSS = """
+QLabel#darkBg { background-color:#101010; color:#9aa6b2; }
+QLabel#titleSmall { color:#b7c0ce; font-size:11px; }
+QLabel#infoText { color:#e6e6e6; font-size:12px; }
+QLabel#infoTextSmall { color:#e6e6e6; font-size:11px; }
+QLabel#helpText { color:#9fb0c3; font-size:11px; }
+QLabel#footerText { color:#7f8a99; font-size:11px; }
+"""
+
+
 class YoloLabelWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("YOLO Manual Labeling")
         self.resize(760, 560)
+        self.setStyleSheet(_YOLO_WINDOW_QSS)
         self.on_key_event = None  # Callback for manual labeling keys
 
         self.info_label = QLabel("Manual labeling ready.")
         self.info_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.info_label.setStyleSheet("color:#e6e6e6; font-size:12px;")
+        self.info_label.setObjectName("infoText")
 
         self.help_label = QLabel("")
         self.help_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        self.help_label.setStyleSheet("color:#9fb0c3; font-size:11px;")
+        self.help_label.setObjectName("helpText")
         self.help_label.setWordWrap(True)
 
         self.view = ClickableLabel("")
         self.view.setAlignment(Qt.AlignCenter)
-        self.view.setStyleSheet("background-color:#101010; color:#9aa6b2;")
+        self.view.setObjectName("darkBg")
         self.view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.view.setScaledContents(False)
 
@@ -475,30 +519,16 @@ class YoloLabelWindow(QWidget):
         self.setLayout(layout)
         self.setFocusPolicy(Qt.StrongFocus)
 
+        # Persistent RGB conversion buffers keyed by label (avoid per-frame allocations)
+        self._rgb_buffers: dict[int, np.ndarray] = {}
+
     def keyPressEvent(self, event):
         if self.on_key_event:
             self.on_key_event(event)
         super().keyPressEvent(event)
 
     def _set_pixmap(self, label: QLabel, img_bgr):
-        if label is None:
-            return
-        if img_bgr is None:
-            label.clear()
-            return
-        try:
-            rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
-            qimg = QImage(rgb.data, rgb.shape[1], rgb.shape[0], rgb.strides[0], QImage.Format_RGB888).copy()
-            pix = QPixmap.fromImage(qimg)
-            try:
-                target = label.size()
-                if target.width() > 0 and target.height() > 0:
-                    pix = pix.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            except Exception:
-                pass
-            label.setPixmap(pix)
-        except Exception:
-            label.clear()
+        set_label_pixmap(label, img_bgr, self._rgb_buffers)
 
     def update_view(self, img_bgr, info_text: str, help_text: str):
         try:
@@ -514,30 +544,31 @@ class YoloCompareWindow(QWidget):
         super().__init__()
         self.setWindowTitle("YOLO Compare")
         self.resize(820, 420)
+        self.setStyleSheet(_YOLO_WINDOW_QSS)
 
         self.left_title = QLabel("BEST (best.pt)")
         self.left_title.setAlignment(Qt.AlignCenter)
-        self.left_title.setStyleSheet("color:#b7c0ce; font-size:11px;")
+        self.left_title.setObjectName("titleSmall")
 
         self.right_title = QLabel("ORIGINAL (yolov8n.pt)")
         self.right_title.setAlignment(Qt.AlignCenter)
-        self.right_title.setStyleSheet("color:#b7c0ce; font-size:11px;")
+        self.right_title.setObjectName("titleSmall")
 
         self.left_view = QLabel("")
         self.left_view.setAlignment(Qt.AlignCenter)
-        self.left_view.setStyleSheet("background-color:#101010; color:#9aa6b2;")
+        self.left_view.setObjectName("darkBg")
         self.left_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.left_view.setScaledContents(False)
 
         self.right_view = QLabel("")
         self.right_view.setAlignment(Qt.AlignCenter)
-        self.right_view.setStyleSheet("background-color:#101010; color:#9aa6b2;")
+        self.right_view.setObjectName("darkBg")
         self.right_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.right_view.setScaledContents(False)
 
         self.total_label = QLabel("Total Detect Count: 0 (100.0%)")
         self.total_label.setAlignment(Qt.AlignCenter)
-        self.total_label.setStyleSheet("color:#7f8a99; font-size:11px;")
+        self.total_label.setObjectName("footerText")
 
         left_col = QVBoxLayout()
         left_col.setContentsMargins(0, 0, 0, 0)
@@ -565,6 +596,9 @@ class YoloCompareWindow(QWidget):
 
         self.setLayout(main_col)
 
+        # Persistent RGB conversion buffers keyed by label (avoid per-frame allocations)
+        self._rgb_buffers: dict[int, np.ndarray] = {}
+
     def set_titles(self, left: str, right: str):
         try:
             self.left_title.setText(str(left))
@@ -579,28 +613,17 @@ class YoloCompareWindow(QWidget):
             pass
 
     def _set_pixmap(self, label: QLabel, img_bgr):
-        if label is None:
-            return
-        if img_bgr is None:
-            label.clear()
-            return
-        try:
-            rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
-            qimg = QImage(rgb.data, rgb.shape[1], rgb.shape[0], rgb.strides[0], QImage.Format_RGB888).copy()
-            pix = QPixmap.fromImage(qimg)
-            try:
-                target = label.size()
-                if target.width() > 0 and target.height() > 0:
-                    pix = pix.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            except Exception:
-                pass
-            label.setPixmap(pix)
-        except Exception:
-            label.clear()
+        set_label_pixmap(label, img_bgr, self._rgb_buffers)
 
     def update_views(self, left_bgr, right_bgr):
-        self._set_pixmap(self.left_view, left_bgr)
-        self._set_pixmap(self.right_view, right_bgr)
+        # Batch both panes into one repaint.
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_pixmap(self.left_view, left_bgr)
+            self._set_pixmap(self.right_view, right_bgr)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
 
 class YoloTrainHistogramWindow(QWidget):
@@ -608,14 +631,15 @@ class YoloTrainHistogramWindow(QWidget):
         super().__init__()
         self.setWindowTitle("YOLO Ball Training — Confidence Distribution")
         self.resize(520, 240)
+        self.setStyleSheet(_YOLO_WINDOW_QSS)
 
         self.info_label = QLabel("")
         self.info_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.info_label.setStyleSheet("color:#e6e6e6; font-size:11px;")
+        self.info_label.setObjectName("infoTextSmall")
 
-        self.view = QLabel("")
+        self.view = ImageLabel("")
         self.view.setAlignment(Qt.AlignCenter)
-        self.view.setStyleSheet("background-color:#101010; color:#9aa6b2;")
+        self.view.setObjectName("darkBg")
         self.view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.view.setScaledContents(False)
 
@@ -626,6 +650,14 @@ class YoloTrainHistogramWindow(QWidget):
         layout.addWidget(self.view, stretch=1)
         self.setLayout(layout)
 
+        # Reused histogram canvas (only the histogram worker renders into it).
+        self._hist_canvas = np.zeros((160, 480, 3), dtype=np.uint8)
+
+        # Histogram image is rendered on a worker thread; the GUI thread only swaps the pixmap.
+        self._hist_worker = HistogramWorker(self._render_conf_hist)
+        self._hist_worker.sig_ready.connect(self._on_hist_ready, Qt.QueuedConnection)
+        self._hist_worker.start()
+
     def update_histogram(
         self,
         conf_values,
@@ -656,151 +688,45 @@ class YoloTrainHistogramWindow(QWidget):
         except Exception:
             pass
 
-        w = 480
-        h = 160
-        img = np.zeros((h, w, 3), dtype=np.uint8)
+        # Snapshot the (GUI-thread owned) buffer before handing it to the worker.
+        vals = np.array(conf_values if conf_values is not None else (), dtype=np.float32)
+        self._hist_worker.submit("conf", vals)
 
-        # Histogram bins 0.01–1.00
-        bins = np.linspace(0.01, 1.0, 21)
-        vals = np.asarray(conf_values or [], dtype=np.float32)
-        vals = vals[(vals >= 0.01) & (vals <= 1.0)]
+    def _on_hist_ready(self, key: str, qimg: QImage):
+        if qimg.isNull():
+            self.view.clear()
+            return
+        self.view.setImage(qimg)
+
+    def _render_conf_hist(self, conf_values: np.ndarray):
+        img = self._hist_canvas
+        h, w = img.shape[:2]
+        img.fill(0)
+
+        # Histogram bins 0.01–1.00 (integer bins + range → NumPy's uniform-bin fast path)
+        vals = conf_values[(conf_values >= 0.01) & (conf_values <= 1.0)]
         hist = np.zeros((20,), dtype=np.float32)
         if vals.size > 0:
-            hist, _ = np.histogram(vals, bins=bins)
+            hist, _ = np.histogram(vals, bins=20, range=(0.01, 1.0))
 
         maxv = float(hist.max()) if hist.size > 0 else 1.0
         maxv = max(maxv, 1.0)
         bar_w = int(w / 20)
 
         # Axes
-        cv2.rectangle(img, (0, 0), (w - 1, h - 1), (60, 60, 60), 1)
-        for i in range(20):
+        rect = cv2.rectangle
+        rect(img, (0, 0), (w - 1, h - 1), (60, 60, 60), 1)
+        y1 = h - 8
+        bar_h = h - 20
+        for i, count in enumerate(hist.tolist()):
             x0 = i * bar_w
-            x1 = x0 + bar_w - 2
-            v = float(hist[i]) / maxv
-            y1 = h - 8
-            y0 = int(round(y1 - v * (h - 20)))
-            cv2.rectangle(img, (x0 + 1, y0), (x1, y1), (0, 200, 255), -1)
+            y0 = int(round(y1 - (count / maxv) * bar_h))
+            rect(img, (x0 + 1, y0), (x0 + bar_w - 2, y1), (0, 200, 255), -1)
 
         # Min/Max labels
         cv2.putText(img, "0.01", (4, h - 4), cv2.FONT_HERSHEY_SIMPLEX, 0.35, (200, 200, 200), 1)
         cv2.putText(img, "1.00", (w - 40, h - 4), cv2.FONT_HERSHEY_SIMPLEX, 0.35, (200, 200, 200), 1)
-
-        rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        qimg = QImage(rgb.data, w, h, rgb.strides[0], QImage.Format_RGB888)
-        self.view.setPixmap(QPixmap.fromImage(qimg))
-
-    def bind_yolo_controls(self, conf_value: float, imgsz_value: int, on_conf, on_imgsz):
-        try:
-            self.yolo_conf_spin.blockSignals(True)
-            self.yolo_imgsz_spin.blockSignals(True)
-            self.yolo_conf_spin.setValue(float(conf_value))
-            self.yolo_imgsz_spin.setValue(int(imgsz_value))
-        except Exception:
-            pass
-        finally:
-            try:
-                self.yolo_conf_spin.blockSignals(False)
-                self.yolo_imgsz_spin.blockSignals(False)
-            except Exception:
-                pass
-
-        if not self._controls_connected:
-            try:
-                self.yolo_conf_spin.valueChanged.connect(on_conf)
-                self.yolo_imgsz_spin.valueChanged.connect(on_imgsz)
-                self._controls_connected = True
-            except Exception:
-                pass
-
-    def _set_pixmap(self, label: QLabel, img_bgr):
-        if label is None:
-            return
-        if img_bgr is None:
-            label.clear()
-            return
-        try:
-            rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
-            qimg = QImage(rgb.data, rgb.shape[1], rgb.shape[0], rgb.strides[0], QImage.Format_RGB888).copy()
-            pix = QPixmap.fromImage(qimg)
-            try:
-                target = label.size()
-                if target.width() > 0 and target.height() > 0:
-                    pix = pix.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            except Exception:
-                pass
-            label.setPixmap(pix)
-        except Exception:
-            label.clear()
-
-    def _render_hsv_hist(self, frame_bgr, *, label_text: str = ""):
-        if frame_bgr is None:
-            return None
-        try:
-            hsv_img = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
-            hist_h = cv2.calcHist([hsv_img], [0], None, [180], [0, 180])
-            hist_s = cv2.calcHist([hsv_img], [1], None, [256], [0, 256])
-            hist_v = cv2.calcHist([hsv_img], [2], None, [256], [0, 256])
-        except Exception:
-            return None
-
-        width = 256
-        band_h = 60
-        gap = 8
-        img_h = band_h * 3 + gap * 2
-        hist_img = np.zeros((img_h, width, 3), dtype=np.uint8)
-
-        def draw_hist(hist, color, y0, bins):
-            if hist is None:
-                return
-            hist = hist.flatten()
-            maxv = float(hist.max()) if hist.size > 0 else 1.0
-            maxv = max(maxv, 1.0)
-            for i in range(bins):
-                v = hist[i] / maxv
-                x_bin = int(round(i * (width - 1) / (bins - 1)))
-                y_val = int(round(v * (band_h - 6)))
-                cv2.line(
-                    hist_img,
-                    (x_bin, y0 + band_h - 1),
-                    (x_bin, y0 + band_h - 1 - y_val),
-                    color,
-                    1,
-                )
-
-        draw_hist(hist_h, (0, 0, 255), 0, 180)
-        draw_hist(hist_s, (0, 255, 0), band_h + gap, 256)
-        draw_hist(hist_v, (255, 0, 0), (band_h + gap) * 2, 256)
-
-        cv2.putText(hist_img, "H", (6, 14), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 0, 255), 1)
-        cv2.putText(hist_img, "S", (6, band_h + gap + 14), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 0), 1)
-        cv2.putText(hist_img, "V", (6, (band_h + gap) * 2 + 14), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 0, 0), 1)
-        if label_text:
-            cv2.putText(hist_img, label_text, (90, 14), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (220, 220, 220), 1)
-
-        return hist_img
-
-    def update_view(
-        self,
-        vis_bgr,
-        info_text: str,
-        *,
-        full_hist=None,
-        hi_img=None,
-        hi_hist=None,
-        lo_img=None,
-        lo_hist=None,
-    ):
-        text = str(info_text or "")
-        if self.compare_status_line:
-            text = f"{self.compare_status_line}\n{text}" if text else self.compare_status_line
-        self.info_label.setText(text)
-        self._set_pixmap(self.view, vis_bgr)
-        self._set_pixmap(self.full_hist_label, full_hist)
-        self._set_pixmap(self.hi_img_label, hi_img)
-        self._set_pixmap(self.hi_hist_label, hi_hist)
-        self._set_pixmap(self.lo_img_label, lo_img)
-        self._set_pixmap(self.lo_hist_label, lo_hist)
+        return img
 
     def set_compare_status(self, enabled: bool, message: str = ""):
         if enabled:
@@ -932,12 +858,13 @@ class CameraWindow(QWidget, DogLogicMixin):
         self.video_source_last_error = ""
 
         # FPS measurement: display vs receive (Dog mode)
+        # (EMAs of the interval between painted / received frames; 0.0 = reseed on the next frame)
         self.display_fps = 0.0
-        self.display_frame_count = 0
+        self.display_dt_ema = 0.0
         self.display_last_time = time.time()
 
         self.rx_fps = 0.0
-        self.rx_frame_count = 0
+        self.rx_dt_ema = 0.0
         self.rx_last_time = time.time()
 
         # Client camera (Mac side) controller
@@ -1030,6 +957,9 @@ class CameraWindow(QWidget, DogLogicMixin):
         # ---------- Background server check ----------
         self.server_reconnect.start_server_check_thread()
 
+        # ---------- Background client camera reader ----------
+        self.client_camera.reader.start()
+
         # ---------- Telemetry poll timer (Dog-mode only) ----------
         self.telemetry.start()
 
@@ -1054,6 +984,9 @@ class CameraWindow(QWidget, DogLogicMixin):
     def _on_mac_camera_changed(self, combo_index: int):
         return self.client_camera.on_mac_camera_changed(combo_index)
 
+    def _rescan_client_cameras(self):
+        return self.client_camera.rescan_client_cameras()
+
     # ==================================================================
     # Post-completion bark + cheer helpers
     # ==================================================================
@@ -1562,6 +1495,9 @@ class CameraWindow(QWidget, DogLogicMixin):
         self.mac_cam_combo = QComboBox()
         self.mac_cam_combo.setMinimumWidth(240)
         self.mac_cam_combo.currentIndexChanged.connect(self._on_mac_camera_changed)
+        self.mac_cam_rescan_button = QPushButton("Rescan")
+        self.mac_cam_rescan_button.setToolTip("Re-enumerate Mac cameras")
+        self.mac_cam_rescan_button.clicked.connect(self._rescan_client_cameras)
 
         bottom_bar = QHBoxLayout()
         bottom_bar.addWidget(self.dog_button)
@@ -1569,6 +1505,7 @@ class CameraWindow(QWidget, DogLogicMixin):
         bottom_bar.addSpacing(8)
         bottom_bar.addWidget(self.mac_cam_label)
         bottom_bar.addWidget(self.mac_cam_combo)
+        bottom_bar.addWidget(self.mac_cam_rescan_button)
         bottom_bar.addStretch()
 
         self.bottom_frame = QFrame()
@@ -1605,13 +1542,15 @@ class CameraWindow(QWidget, DogLogicMixin):
 
         # ---- Wire buttons to handlers ----
         # Motion: original behavior (single click sends one command).
-        self.btn_W.clicked.connect(lambda: self.send_motion_command("w"))
-        self.btn_E.clicked.connect(lambda: self.send_motion_command("e"))
-        self.btn_R.clicked.connect(lambda: self.send_motion_command("r"))
-        self.btn_S.clicked.connect(lambda: self.send_motion_command("s"))
-        self.btn_D.clicked.connect(lambda: self.send_motion_command("d"))
-        self.btn_F.clicked.connect(lambda: self.send_motion_command("f"))
-        self.btn_C.clicked.connect(lambda: self.send_motion_command("c"))
+        self.btn_W.setProperty("cmd", "w")
+        self.btn_E.setProperty("cmd", "e")
+        self.btn_R.setProperty("cmd", "r")
+        self.btn_S.setProperty("cmd", "s")
+        self.btn_D.setProperty("cmd", "d")
+        self.btn_F.setProperty("cmd", "f")
+        self.btn_C.setProperty("cmd", "c")
+        for btn in (self.btn_W, self.btn_E, self.btn_R, self.btn_S, self.btn_D, self.btn_F, self.btn_C):
+            btn.clicked.connect(self._on_motion_btn)
         self.btn_SpaceStop.clicked.connect(self.send_stop_motion)
 
         self.btn_Beep.clicked.connect(self.handle_beep_key)
@@ -1780,6 +1719,11 @@ class CameraWindow(QWidget, DogLogicMixin):
         self.mask_picker.handle_mouse_press(event)
         super().mousePressEvent(event)
 
+    # ------------------------------------------
+    def _on_motion_btn(self):
+        """Shared slot for the motion buttons; the command key is the button's 'cmd' property."""
+        self.send_motion_command(self.sender().property("cmd"))
+
     # ------------------------------------------
     def keyPressEvent(self, event):
         """
@@ -1876,6 +1820,9 @@ class CameraWindow(QWidget, DogLogicMixin):
     #=================================
 
 if __name__ == "__main__":
+    # OpenCV's parallel_for_ (cvtColor/inRange/morphology) on every core; process-wide, set once.
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(max(1, os.cpu_count() or 1))
     app = QApplication(sys.argv)
     w = CameraWindow()
     w.show()
@@ -11,6 +11,17 @@
      Maintains labeling state, input handlers, dataset path/version resolution,
      and manual label saving logic.
 
+ v1.04  (2026-10-18 00:14)    : Cached dataset path prefixes
+     • yolo_train_prepare_dataset caches the images/ and labels/ prefixes; manual sample paths are plain f-strings.
+     • Manual sample timestamp uses time.time_ns() // 1_000_000.
+ v1.03  (2026-10-18 00:09)    : Manual samples written off the GUI thread
+     • yolo_save_manual_sample queues JPEG encode (cv2.imencode) + image/label writes on a single-worker ThreadPoolExecutor.
+     • Writer failures are printed and shown via _yolo_labeling_msg.
+ v1.02  (2026-10-18 00:00)    : Dict-dispatched labeling keys
+     • on_labeling_key_event maps Return/Enter/Space/Escape through _labeling_key_dispatch; digits index the class by offset.
+     • clear_labeling_points() split out of the key handler.
+ v1.01  (2026-10-17 23:59)    : Precompiled dataset image-name scan
+     • yolo_train_prepare_dataset scans images/ with os.scandir and a module-level _IMG_NAME_RE (prefix check before the regex).
  v1.00  (2026-01-31 16:55)    : Initial labeling controller extraction
      • Extract YOLO manual labeling state + handlers from CameraWindow.
 ===============================================================================
@@ -21,12 +32,16 @@ from __future__ import annotations
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import cv2
 
 from PyQt5.QtCore import Qt
 
+# Auto-labeled training image names (imgNNNNNN.jpg); the next index continues after the max.
+_IMG_NAME_RE = re.compile(r"img(\d{6})\.jpg$")
+
 
 class YoloLabelingController:
     def __init__(self, host, *, label_window_factory=None):
@@ -43,6 +58,19 @@ class YoloLabelingController:
         self._host._yolo_labeling_last_frame = None
         self._host._yolo_labeling_msg = ""
         self._host._yolo_labeling_save_msg_ts = 0.0
+        # Manual samples are encoded/written off the GUI thread (created on first save).
+        self._save_executor: ThreadPoolExecutor | None = None
+        # "<dataset>/images/" and "<dataset>/labels/" for the current dataset (set by yolo_train_prepare_dataset).
+        self._images_prefix = ""
+        self._labels_prefix = ""
+
+        # Non-digit labeling keys -> handler (digits 1..9 select the class directly).
+        self._labeling_key_dispatch = {
+            Qt.Key_Return: self.save_manual_label,
+            Qt.Key_Enter: self.save_manual_label,
+            Qt.Key_Space: self.clear_labeling_points,
+            Qt.Key_Escape: self.clear_labeling_points,
+        }
 
     def yolo_train_next_version_dir(self) -> tuple[str, str]:
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
@@ -112,11 +140,16 @@ class YoloLabelingController:
         # Determine next image index (continue to img001000)
         next_idx = 1
         try:
-            max_idx = 0
-            for name in os.listdir(images_dir):
-                m = re.match(r"img(\d{6})\.jpg$", name)
-                if m:
-                    max_idx = max(max_idx, int(m.group(1)))
+            with os.scandir(images_dir) as entries:
+                # Cheap prefix test first; most non-matching names (manual_*.jpg) never reach the regex.
+                max_idx = max(
+                    (
+                        int(m.group(1))
+                        for entry in entries
+                        if entry.name.startswith("img") and (m := _IMG_NAME_RE.match(entry.name))
+                    ),
+                    default=0,
+                )
             next_idx = max_idx + 1
         except Exception:
             next_idx = 1
@@ -126,6 +159,8 @@ class YoloLabelingController:
 
         self._host._yolo_training_dir = path
         self._host._yolo_training_dataset_label = label
+        self._images_prefix = images_dir + os.sep
+        self._labels_prefix = labels_dir + os.sep
         self._host._yolo_training_next_index = next_idx
 
     def yolo_labeling_class_label(self) -> str:
@@ -264,9 +299,9 @@ class YoloLabelingController:
         if not self._host.yolo_labeling_enabled:
             return
         key = event.key()
-        if Qt.Key_1 <= key <= Qt.Key_9:
-            idx = int(key - Qt.Key_1)
-            if 0 <= idx < len(self._host._yolo_labeling_class_names):
+        idx = int(key - Qt.Key_1)
+        if 0 <= idx < 9:
+            if idx < len(self._host._yolo_labeling_class_names):
                 self.on_yolo_labeling_class_changed(idx)
                 try:
                     if self._host.yolo_debug_window is not None:
@@ -274,12 +309,14 @@ class YoloLabelingController:
                 except Exception:
                     pass
             return
-        if key == Qt.Key_Return or key == Qt.Key_Enter:
-             self.save_manual_label()
-        elif key == Qt.Key_Space or key == Qt.Key_Escape:
-             self._host._yolo_labeling_p1 = None
-             self._host._yolo_labeling_p2 = None
-             self._host._yolo_labeling_msg = f"Cleared. [{self.yolo_labeling_class_label()}]"
+        handler = self._labeling_key_dispatch.get(key)
+        if handler is not None:
+            handler()
+
+    def clear_labeling_points(self):
+        self._host._yolo_labeling_p1 = None
+        self._host._yolo_labeling_p2 = None
+        self._host._yolo_labeling_msg = f"Cleared. [{self.yolo_labeling_class_label()}]"
 
     def save_manual_label(self):
         if not self._host._yolo_labeling_p1 or not self._host._yolo_labeling_p2:
@@ -335,20 +372,36 @@ class YoloLabelingController:
         bw *= dw
         bh *= dh
 
-        ts = int(time.time() * 1000)
-        base = f"manual_{ts}"
+        base = f"manual_{time.time_ns() // 1_000_000}"
+        img_path = f"{self._images_prefix}{base}.jpg"
+        txt_path = f"{self._labels_prefix}{base}.txt"
+        label_line = f"{self._host._yolo_labeling_class_id} {cx:.6f} {cy:.6f} {bw:.6f} {bh:.6f}\\n"
+
+        # JPEG encode + file writes run on the writer thread. The frame is not copied:
+        # _yolo_labeling_last_frame is replaced (never drawn on) by the debug view.
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yolo-label-save")
         try:
-            img_path = os.path.join(self._host._yolo_training_dir, "images", f"{base}.jpg")
-            txt_path = os.path.join(self._host._yolo_training_dir, "labels", f"{base}.txt")
+            self._save_executor.submit(self._write_manual_sample, base, img_path, img_bgr, txt_path, label_line)
+        except Exception as e:
+            print(f"[YOLO] Save error: {e}")
+            return False
+        return True
 
-            cv2.imwrite(img_path, img_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), 95])
+    def _write_manual_sample(self, base, img_path, img_bgr, txt_path, label_line) -> None:
+        """Writer-thread half of yolo_save_manual_sample; failures are reported via _yolo_labeling_msg."""
+        try:
+            ok, enc = cv2.imencode(".jpg", img_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), 95])
+            if not ok:
+                raise ValueError("JPEG encode failed")
+            with open(img_path, "wb") as f:
+                f.write(enc.tobytes())
             with open(txt_path, "w") as f:
-                f.write(f"{self._host._yolo_labeling_class_id} {cx:.6f} {cy:.6f} {bw:.6f} {bh:.6f}\\n")
+                f.write(label_line)
             print(f"[YOLO] Manual Label Saved: {base}")
-            return True
         except Exception as e:
             print(f"[YOLO] Save error: {e}")
-            return False
+            self._host._yolo_labeling_msg = f"Save Failed! ({base})"
 
     def yolo_label_help_text(self) -> str:
         return (
@@ -9,6 +9,8 @@
  Description:
      UI window/widget module extracted from mtDogMain.py.
 
+ v1.01  (2026-10-17 23:47)    : Reuse HSV buffer
+     • update_histogram converts into a persistent scratch array (cvtColor dst=).
  v1.00  (2026-01-31 15:10)    : Initial UI module extraction
      • Extracted UI-only window/widgets from mtDogMain.py.
 ===============================================================================
@@ -64,6 +66,7 @@ class AIVisionHistogramWindow(QWidget):
         self._mode_label = "GPT Vision"
         self._model_label = ""
         self._update_hz: float | None = None
+        self._hsv_scratch: np.ndarray | None = None  # reused cvtColor destination
         self.setWindowTitle("Object Detection Test — Histogram")
         self.resize(660, 360)
         try:
@@ -141,7 +144,9 @@ class AIVisionHistogramWindow(QWidget):
         sample_d = int(round(sample_r * 2))
 
         try:
-            hsv_img = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
+            if self._hsv_scratch is None or self._hsv_scratch.shape != frame_bgr.shape:
+                self._hsv_scratch = np.empty_like(frame_bgr)
+            hsv_img = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV, dst=self._hsv_scratch)
         except Exception:
             return
 
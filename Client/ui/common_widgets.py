@@ -9,13 +9,33 @@
  Description:
      UI window/widget module extracted from mtDogMain.py.
 
+ v1.06  (2026-10-17 23:41)    : Grayscale8 path for 2D images
+     • set_label_pixmap wraps 2D uint8 masks as Format_Grayscale8 instead of expanding to 3 channels.
+ v1.05  (2026-10-17 23:41)    : Hoist attribute lookups in set_label_pixmap
+     • Shape/stride are read once into locals.
+ v1.04  (2026-10-17 23:40)    : Add ImageLabel
+     • QLabel subclass that paints a QImage directly (aspect-fit, centered).
+ v1.03  (2026-10-17 23:39)    : Wrap BGR frames directly (Format_BGR888)
+     • set_label_pixmap skips cvtColor on Qt >= 5.14; the RGB buffer path is kept as fallback.
+ v1.02  (2026-10-17 23:36)    : Skip no-op pixmap scaling
+     • set_label_pixmap only rescales when the pixmap size differs from the label (width/height passed as ints).
+ v1.01  (2026-10-17 23:33)    : Shared set_label_pixmap helper
+     • One BGR→QLabel painter for the YOLO windows: converts into a caller-owned per-label RGB buffer and wraps it without QImage .copy().
  v1.00  (2026-01-31 15:10)    : Initial UI module extraction
      • Extracted UI-only window/widgets from mtDogMain.py.
 ===============================================================================
 """
 
+import cv2
+import numpy as np
+
+from PyQt5.QtCore import QPoint, QRect, Qt
+from PyQt5.QtGui import QImage, QPainter, QPixmap
 from PyQt5.QtWidgets import QLabel
 
+# Qt >= 5.14 can wrap OpenCV BGR buffers directly; older Qt falls back to a BGR→RGB conversion.
+_FORMAT_BGR888 = getattr(QImage, "Format_BGR888", None)
+
 
 class ClickableLabel(QLabel):
     def __init__(self, parent=None):
@@ -37,3 +57,86 @@ class ClickableLabel(QLabel):
         if self.on_mouse_event:
             self.on_mouse_event("release", event.pos(), event.button())
         super().mouseReleaseEvent(event)
+
+
+class ImageLabel(QLabel):
+    """QLabel that paints a QImage directly (aspect-fit, centered).
+
+    Skips the per-update QImage→QPixmap conversion for views that change every
+    frame (histograms). setPixmap()/clear() still behave like a normal QLabel.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._img = None
+
+    def setImage(self, qimg):
+        self._img = qimg if (qimg is not None and not qimg.isNull()) else None
+        self.update()
+
+    def setPixmap(self, pix):
+        self._img = None
+        super().setPixmap(pix)
+
+    def clear(self):
+        self._img = None
+        super().clear()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)  # stylesheet background / pixmap / text
+        img = self._img
+        if img is None:
+            return
+        size = img.size().scaled(self.size(), Qt.KeepAspectRatio)
+        if size.width() <= 0 or size.height() <= 0:
+            return
+        rect = QRect(QPoint(0, 0), size)
+        rect.moveCenter(self.rect().center())
+        painter = QPainter(self)
+        painter.drawImage(rect, img)
+        painter.end()
+
+
+def set_label_pixmap(label: QLabel, img_bgr, rgb_buffers: dict) -> None:
+    """Show a BGR image on `label`, scaled to fit (aspect kept); None clears it.
+
+    `rgb_buffers` maps id(label) to a caller-owned RGB buffer for the BGR→RGB fallback (Qt < 5.14);
+    the QImage wraps it without .copy().
+    """
+    if label is None:
+        return
+    if img_bgr is None:
+        label.clear()
+        return
+    try:
+        if img_bgr.ndim == 2:
+            # Masks stay 1-byte grayscale (no GRAY2BGR expansion, 1/3 the bytes).
+            src = np.ascontiguousarray(img_bgr)
+            fmt = QImage.Format_Grayscale8
+        elif _FORMAT_BGR888 is not None:
+            # Qt >= 5.14 reads OpenCV's BGR bytes directly (no cvtColor pass).
+            src = np.ascontiguousarray(img_bgr)
+            fmt = _FORMAT_BGR888
+        else:
+            key = id(label)
+            src = rgb_buffers.get(key)
+            if src is None or src.shape != img_bgr.shape:
+                src = np.empty(img_bgr.shape, dtype=np.uint8)
+                rgb_buffers[key] = src
+            cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB, dst=src)
+            fmt = QImage.Format_RGB888
+        h, w = src.shape[:2]
+        qimg = QImage(src.data, w, h, src.strides[0], fmt)
+        # Non-owning QImage: the source array outlives this call; fromImage() copies into the pixmap.
+        pix = QPixmap.fromImage(qimg)
+        try:
+            target = label.size()
+            tw = target.width()
+            th = target.height()
+            if tw > 0 and th > 0 and (pix.width() != tw or pix.height() != th):
+                pix = pix.scaled(tw, th, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        except Exception:
+            pass
+        label.setPixmap(pix)
+    except Exception:
+        label.clear()
@@ -9,6 +9,12 @@
  Description:
      UI window/widget module extracted from mtDogMain.py.
 
+ v1.03  (2026-10-17 23:47)    : Reuse HSV buffer in histogram panels
+     • update_panels converts into a persistent scratch array (cvtColor dst=).
+ v1.02  (2026-10-17 23:43)    : Sample center HSV from a 1x1 patch
+     • update_view no longer converts the full frame to HSV for one marker color.
+ v1.01  (2026-10-17 23:41)    : Show bare masks as Grayscale8
+     • 2D masks without a center overlay skip GRAY2BGR/BGR2RGB and paint as Format_Grayscale8.
  v1.00  (2026-01-31 15:10)    : Initial UI module extraction
      • Extracted UI-only window/widgets from mtDogMain.py.
 ===============================================================================
@@ -173,6 +179,10 @@ class CVBallDebugWindow(QWidget):
         if mask is not None:
             try:
                 if len(mask.shape) == 2:
+                    if center is None:
+                        # Nothing colored to draw: show the 1-channel mask as-is.
+                        self._set_gray_pixmap(mask)
+                        return
                     vis = cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR)
                 else:
                     vis = mask.copy()
@@ -199,8 +209,9 @@ class CVBallDebugWindow(QWidget):
                     cv2.circle(vis, (cx, cy), rr, (0, 255, 255), 1)
                 try:
                     if frame_bgr is not None:
-                        hsv_src = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
-                        Hc, Sc, Vc = [int(v) for v in hsv_src[cy, cx]]
+                        # Only the center pixel is needed: convert 1x1, not the whole frame.
+                        px = np.ascontiguousarray(frame_bgr[cy : cy + 1, cx : cx + 1])
+                        Hc, Sc, Vc = [int(v) for v in cv2.cvtColor(px, cv2.COLOR_BGR2HSV)[0, 0]]
                     else:
                         Hc, Sc, Vc = 0, 0, 0
                 except Exception:
@@ -216,6 +227,12 @@ class CVBallDebugWindow(QWidget):
         except Exception:
             return
 
+    def _set_gray_pixmap(self, mask):
+        m = np.ascontiguousarray(mask, dtype=np.uint8)
+        h, w = m.shape[:2]
+        qimg = QImage(m.data, w, h, m.strides[0], QImage.Format_Grayscale8)
+        self.view.setPixmap(QPixmap.fromImage(qimg))
+
 
 class CVBallHistogramWindow(QWidget):
     def __init__(self):
@@ -265,6 +282,7 @@ class CVBallHistogramWindow(QWidget):
         self.frame_hist_v = deque(maxlen=64)
         self.picker_hist_updates = 0
         self.frame_hist_updates = 0
+        self._hsv_scratch: np.ndarray | None = None  # reused cvtColor destination
 
     def _render_hist_from_arrays(self, hist_h, hist_s, hist_v, *, thresholds: dict | None = None, label_text: str = ""):
         if hist_h is None or hist_s is None or hist_v is None:
@@ -408,7 +426,9 @@ class CVBallHistogramWindow(QWidget):
 
         h, w = frame_bgr.shape[:2]
         try:
-            hsv_img = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
+            if self._hsv_scratch is None or self._hsv_scratch.shape != frame_bgr.shape:
+                self._hsv_scratch = np.empty_like(frame_bgr)
+            hsv_img = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV, dst=self._hsv_scratch)
         except Exception:
             return
 
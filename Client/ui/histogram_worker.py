@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+ Project : Freenove Robot Dog - Enhanced Video Client (Mac)
+ File   : histogram_worker.py
+ Author : MT & GitHub Copilot
+
+ Description:
+     Background histogram renderer for debug windows.
+     Runs the (cvtColor/calcHist/putText) render on a QThread and posts the
+     finished QImage back to the GUI thread, which only swaps the pixmap.
+
+ v1.02  (2026-10-17 23:54)    : busy(key) query
+     • compute() tracks the keys it is rendering; busy(key) reports queued or running renders.
+ v1.01  (2026-10-17 23:39)    : Emit BGR888 images
+     • Rendered histograms are wrapped as Format_BGR888 (no cvtColor) when Qt supports it.
+ v1.00  (2026-10-17 23:35)    : Initial histogram worker
+     • HistogramWorker(QObject) on a QThread; latest request per key wins.
+     • Inputs guarded by a QMutex; results delivered via queued sig_ready.
+     • Started workers stay referenced until quit, so a running QThread is never collected with its owner window.
+===============================================================================
+"""
+
+import cv2
+import numpy as np
+
+from PyQt5.QtCore import QCoreApplication, QMutex, QMutexLocker, QObject, QThread, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QImage
+
+# Qt >= 5.14 can wrap OpenCV BGR buffers directly; older Qt falls back to a BGR→RGB conversion.
+_FORMAT_BGR888 = getattr(QImage, "Format_BGR888", None)
+
+# Started workers stay referenced until app quit so a running QThread is never
+# garbage-collected along with its owner window (Qt aborts on that).
+_ACTIVE_WORKERS: list = []
+
+
+class HistogramWorker(QObject):
+    """Render BGR histogram images off the GUI thread.
+
+    `render_fn(*args, **kwargs)` must return a BGR uint8 image (or None).
+    Results are emitted as `sig_ready(key, QImage)`; a null QImage means
+    "nothing to show" (the receiver should clear the label).
+    """
+
+    sig_ready = pyqtSignal(str, QImage)
+    _sig_wakeup = pyqtSignal()
+
+    def __init__(self, render_fn):
+        super().__init__()
+        self._render_fn = render_fn
+        self._mutex = QMutex()
+        self._pending: dict[str, tuple] = {}
+        self._in_flight: frozenset = frozenset()
+        self._scheduled = False
+        self._thread = None
+        self._sig_wakeup.connect(self.compute)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = QThread()
+        self.moveToThread(self._thread)
+        self._thread.start()
+        _ACTIVE_WORKERS.append(self)
+        app = QCoreApplication.instance()
+        if app is not None:
+            # Direct: stop() must run on the GUI thread (it waits for the worker thread).
+            app.aboutToQuit.connect(self.stop, Qt.DirectConnection)
+
+    def stop(self):
+        thread = self._thread
+        if thread is None:
+            return
+        self._thread = None
+        thread.quit()
+        thread.wait(1000)
+        try:
+            _ACTIVE_WORKERS.remove(self)
+        except ValueError:
+            pass
+
+    def submit(self, key: str, *args, **kwargs):
+        """Queue a render for `key` (replaces any not-yet-rendered request for the same key)."""
+        with QMutexLocker(self._mutex):
+            self._pending[str(key)] = (args, kwargs)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._sig_wakeup.emit()
+
+    def busy(self, key: str) -> bool:
+        """True while a render for `key` is queued or running (its result is not posted yet)."""
+        key = str(key)
+        with QMutexLocker(self._mutex):
+            return key in self._pending or key in self._in_flight
+
+    @pyqtSlot()
+    def compute(self):
+        with QMutexLocker(self._mutex):
+            pending = self._pending
+            self._pending = {}
+            self._in_flight = frozenset(pending)
+            self._scheduled = False
+        for key, (args, kwargs) in pending.items():
+            qimg = QImage()
+            try:
+                img_bgr = self._render_fn(*args, **kwargs)
+                if img_bgr is not None:
+                    if _FORMAT_BGR888 is not None:
+                        src = np.ascontiguousarray(img_bgr)
+                        fmt = _FORMAT_BGR888
+                    else:
+                        src = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+                        fmt = QImage.Format_RGB888
+                    # .copy(): the QImage must own its bytes once it crosses threads.
+                    qimg = QImage(src.data, src.shape[1], src.shape[0], src.strides[0], fmt).copy()
+            except Exception:
+                qimg = QImage()
+            self.sig_ready.emit(key, qimg)
+        with QMutexLocker(self._mutex):
+            self._in_flight = frozenset()
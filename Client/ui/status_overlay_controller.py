@@ -10,6 +10,8 @@
      Status/FPS/HUD overlay controller extracted from frame_update_controller.py.
      Draws AI/CV/YOLO hints, telemetry, FPS, and HSV overlays on the main frame.
 
+ v1.05  (2026-10-18 00:17)    : Direct reads of CV status counters
+     • CV Ball status line reads cv_ball_interval_s/_cv_update_count/_cv_detect_count directly.
  v1.04  (2026-02-02 20:31)    : Route IMU attitude text into bottom message panel.
  v1.03  (2026-02-01)          : Connection-aware FPS display
      • Show RX/UI FPS as 0 when dog video is stalled/disconnected.
@@ -180,20 +182,11 @@ class StatusOverlayController:
             cross = 8
             cv2.line(frame_rgb, (cx_ai - cross, cy_ai), (cx_ai + cross, cy_ai), (0, 255, 255), 1)
             cv2.line(frame_rgb, (cx_ai, cy_ai - cross), (cx_ai, cy_ai + cross), (0, 255, 255), 1)
-        if bool(getattr(host, "cv_ball_enabled", False)):
-            try:
-                cv_int = float(getattr(host, "cv_ball_interval_s", 1.0) or 1.0)
-            except Exception:
-                cv_int = 1.0
+        if host.cv_ball_enabled:
+            cv_int = host.cv_ball_interval_s
             cv_hz = (1.0 / cv_int) if cv_int > 0 else 0.0
-            try:
-                cv_n = int(getattr(host, "_cv_update_count", 0) or 0)
-            except Exception:
-                cv_n = 0
-            try:
-                cv_det_n = int(getattr(host, "_cv_detect_count", 0) or 0)
-            except Exception:
-                cv_det_n = 0
+            cv_n = host._cv_update_count
+            cv_det_n = host._cv_detect_count
             cv2.putText(
                 frame_rgb,
                 f"CV Ball: ON #{cv_n} @ {cv_hz:.1f}Hz, Detected #{cv_det_n}",
@@ -10,6 +10,8 @@
      UI event handler controller extracted from mtDogMain.py (CameraWindow).
      Handles UI button events, status updates, and cleanup/quit logic.
 
+ v1.03  (2026-10-17 23:45)    : Stop client camera reader on close
+     • closeEvent stops the reader before releasing the camera.
  v1.02  (2026-02-07 20:42)    : Close pluggable Dog video source on app exit
      • Ensure external video backend resources are released in close flow.
  v1.00  (2026-01-31 20:50)    : Initial UI event handler controller extraction
@@ -413,10 +415,10 @@ class UIEventHandlersController:
         except Exception:
             pass
 
-        if host.cap is not None:
-            try:
-                host.cap.release()
-            except Exception as e:
-                print(f"[CLOSE] Error releasing camera: {e}")
+        try:
+            host.client_camera.reader.stop()
+            host.client_camera.release_client_camera()
+        except Exception as e:
+            print(f"[CLOSE] Error releasing camera: {e}")
 
         event.accept()
@@ -10,6 +10,10 @@
      CV-only ball detection controller extracted from mtDogMain.py (CameraWindow).
      Maintains CV detection state, timing, debug capture, and overlay gating.
 
+ v1.02  (2026-10-18 00:18)    : Single freshness check per tick
+     • ttl_s/is_fresh and the tracker's center/radius are computed once after the detection gate and shared by the overlay, lock state and histogram.
+ v1.01  (2026-10-18 00:17)    : Direct reads of CV gate state
+     • Interval gate and update/detect counters read the attributes set in __init__ (no getattr/float/or chains).
  v1.00  (2026-01-31 17:25)    : Initial CV detection controller extraction
      • Extract OpenCV CV Ball detection pipeline from CameraWindow.
 ===============================================================================
@@ -61,31 +65,20 @@ class CVBallDetectionController:
             return None, frame_bgr, None, False
 
         mask = None
-        ball_center = None
-        is_fresh = False
 
         now_cv = time.time()
-        if (now_cv - float(getattr(host, "_cv_ball_last_ts", 0.0) or 0.0)) >= float(
-            getattr(host, "cv_ball_interval_s", 1.0) or 1.0
-        ):
+        # Gate/counter state is initialized in __init__; read it directly.
+        if now_cv - host._cv_ball_last_ts >= host.cv_ball_interval_s:
+            detected = True
             host._cv_ball_last_ts = now_cv
-            try:
-                host._cv_update_count = int(getattr(host, "_cv_update_count", 0) or 0) + 1
-            except Exception:
-                host._cv_update_count = 1
+            host._cv_update_count += 1
             mask, frame_bgr = host.ball_tracker.process_with_cv(frame_bgr)
-            try:
-                if int(getattr(host.ball_tracker, "missed_frames", 0) or 0) == 0:
-                    host._cv_detect_count = int(getattr(host, "_cv_detect_count", 0) or 0) + 1
-            except Exception:
-                pass
-            try:
-                missed0 = int(getattr(host.ball_tracker, "missed_frames", 0) or 0)
-                host._cv_last_status = "Detected !" if missed0 == 0 else "No Ball !"
-                host._cv_last_status_ts = now_cv
-            except Exception:
+            if host.ball_tracker.missed_frames == 0:
+                host._cv_detect_count += 1
+                host._cv_last_status = "Detected !"
+            else:
                 host._cv_last_status = "No Ball !"
-                host._cv_last_status_ts = now_cv
+            host._cv_last_status_ts = now_cv
             host._cv_ball_last_mask = mask
             # Capture detector debug (thresholds + mask panes) for debug windows.
             try:
@@ -116,59 +109,41 @@ class CVBallDetectionController:
             if host._cv_ball_last_hist_mask is None:
                 host._cv_ball_last_hist_mask = mask
         else:
-            mask = getattr(host, "_cv_ball_last_mask", None)
-            # Draw last known CV result so the overlay stays visible at UI FPS,
-            # but only while detection is still "locked" (missed_frames==0).
+            mask = host._cv_ball_last_mask
+            detected = False
+
+        # Freshness of the last accepted CV result (shared by the overlay and the lock state below).
+        tracker = host.ball_tracker
+        c0 = tracker.last_center
+        r0 = float(tracker.last_radius or 0.0)
+        last_ok_ts = float(tracker.last_update_ts or 0.0)
+        ttl_s = max(host.cv_ball_overlay_ttl_s, host.cv_ball_interval_s * 1.1)
+        is_fresh = tracker.missed_frames == 0 and last_ok_ts > 0.0 and (time.time() - last_ok_ts) <= ttl_s
+
+        # Between detections, draw the last known CV result so the overlay stays visible at UI FPS,
+        # but only while detection is still "locked" and fresh.
+        if not detected and is_fresh and c0 is not None and r0 > 1.0:
             try:
-                c0 = getattr(host.ball_tracker, "last_center", None)
-                r0 = float(getattr(host.ball_tracker, "last_radius", 0.0) or 0.0)
-                missed0 = int(getattr(host.ball_tracker, "missed_frames", 0) or 0)
-                last_ok_ts = float(getattr(host.ball_tracker, "last_update_ts", 0.0) or 0.0)
-                ttl_s = max(
-                    float(getattr(host, "cv_ball_overlay_ttl_s", 0.35) or 0.35),
-                    float(getattr(host, "cv_ball_interval_s", 1.0) or 1.0) * 1.1,
+                # Use raw (pre-draw) frame for HSV sampling so text doesn't perturb HSV.
+                hsv_src = host.last_display_frame_bgr if host.last_display_frame_bgr is not None else frame_bgr
+                tracker.draw_detection_overlay(
+                    frame_bgr,
+                    source="CV",
+                    hsv_source_bgr=hsv_src,
+                    dashed_inner=True,
                 )
-                is_fresh = (missed0 == 0) and (last_ok_ts > 0.0) and ((time.time() - last_ok_ts) <= ttl_s)
-                if is_fresh and c0 is not None and r0 > 1.0:
-                    # Use raw (pre-draw) frame for HSV sampling so text doesn't perturb HSV.
-                    hsv_src = host.last_display_frame_bgr if host.last_display_frame_bgr is not None else frame_bgr
-                    if hasattr(host.ball_tracker, "draw_detection_overlay"):
-                        host.ball_tracker.draw_detection_overlay(
-                            frame_bgr,
-                            source="CV",
-                            hsv_source_bgr=hsv_src,
-                            dashed_inner=True,
-                        )
-                    else:
-                        cx0, cy0 = int(c0[0]), int(c0[1])
-                        cv2.circle(frame_bgr, (cx0, cy0), int(round(r0)), (255, 255, 0), 2)
-                        cv2.circle(frame_bgr, (cx0, cy0), 2, (255, 255, 0), -1)
             except Exception:
                 pass
 
-        # Treat stale CV detections as "no ball" for UI perception.
-        try:
-            missed0 = int(getattr(host.ball_tracker, "missed_frames", 0) or 0)
-            last_ok_ts = float(getattr(host.ball_tracker, "last_update_ts", 0.0) or 0.0)
-            ttl_s = max(
-                float(getattr(host, "cv_ball_overlay_ttl_s", 0.35) or 0.35),
-                float(getattr(host, "cv_ball_interval_s", 1.0) or 1.0) * 1.1,
-            )
-            is_fresh = (missed0 == 0) and (last_ok_ts > 0.0) and ((time.time() - last_ok_ts) <= ttl_s)
-        except Exception:
-            is_fresh = False
-        ball_center = host.ball_tracker.last_center if is_fresh else None
-        try:
-            host._ball_locked = bool(ball_center is not None and int(getattr(host.ball_tracker, "missed_frames", 0) or 0) == 0)
-            host._ball_lock_source = "CV" if host._ball_locked else ""
-        except Exception:
-            host._ball_locked = False
-            host._ball_lock_source = ""
+        # Treat stale CV detections as "no ball" for UI perception (is_fresh implies missed_frames == 0).
+        ball_center = c0 if is_fresh else None
+        host._ball_locked = ball_center is not None
+        host._ball_lock_source = "CV" if host._ball_locked else ""
 
         # Shared histogram window (Object Detection Test) @ throttled rate
         try:
             src = host.last_display_frame_bgr if host.last_display_frame_bgr is not None else frame_bgr
-            rr = float(getattr(host.ball_tracker, "last_radius", 0.0) or 0.0) if is_fresh else 0.0
+            rr = r0 if is_fresh else 0.0
             rank1_mask = None
             try:
                 ranked = getattr(host, "_cv_ball_last_ranked_masks", None) or []
@@ -179,12 +154,12 @@ class CVBallDetectionController:
             host.ai_vision.maybe_update_test_hist(
                 "CV Ball",
                 src,
-                host.ball_tracker.last_center if is_fresh else None,
+                ball_center,
                 rr,
                 thresholds=getattr(host, "_cv_ball_last_thresholds", None),
                 mask_combined=rank1_mask,
                 roi_rect=getattr(host, "_cv_ball_last_roi_rect", None),
-                interval_s=float(getattr(host, "cv_ball_interval_s", 1.0) or 1.0),
+                interval_s=host.cv_ball_interval_s,
             )
         except Exception:
             pass
@@ -12,6 +12,10 @@ AI-assisted ball candidate detection (test module).
 Notes:
 - This is a lightweight test harness; it falls back to empty detections
   if the SDK/key are missing or the API call fails.
+
+v1.01  (2026-10-18 00:15)    : Collapsed open/close morphology
+    • _open_close(): erode -> dilate x3 -> erode x2 with a module-level 5x5 ellipse
+      replaces the MORPH_OPEN + MORPH_CLOSE pairs in both mask passes.
 """
 
 from __future__ import annotations
@@ -31,6 +35,20 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QImage, QPixmap
 
 
+_ELLIPSE_5 = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+
+
+def _open_close(mask: np.ndarray) -> np.ndarray:
+    """MORPH_OPEN (x1) then MORPH_CLOSE (x2) with a 5x5 ellipse, as three ops.
+
+    OPEN's trailing dilate and CLOSE's two dilates run back-to-back, so they are
+    one dilate(iterations=3): erode -> dilate x3 -> erode x2 (identical output).
+    """
+    mask = cv2.erode(mask, _ELLIPSE_5)
+    mask = cv2.dilate(mask, _ELLIPSE_5, iterations=3)
+    return cv2.erode(mask, _ELLIPSE_5, iterations=2)
+
+
 @dataclass
 class AICircle:
     x: float
@@ -307,10 +325,7 @@ def _detect_red_orange_ball(frame_bgr: np.ndarray) -> List[AICircle]:
             mask = cv2.bitwise_and(mask, extra_mask)
 
         # Clean up noise
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel, iterations=1)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel, iterations=2)
-        return mask
+        return _open_close(mask)
 
     def _pick_best_contour(contours, s_min: int, v_min: int) -> List[AICircle]:
         if not contours:
@@ -394,8 +409,7 @@ def _detect_red_orange_ball(frame_bgr: np.ndarray) -> List[AICircle]:
     s_min_ratio = max(10, int(round(0.2 * s_p90)))
     v_min_ratio = max(10, int(round(0.2 * v_p90)))
     ratio_mask = ((red_ratio > red_ratio_min) & (red_boost > red_boost_min) & color_gate).astype(np.uint8) * 255
-    ratio_mask = cv2.morphologyEx(ratio_mask, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5)), iterations=1)
-    ratio_mask = cv2.morphologyEx(ratio_mask, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5)), iterations=2)
+    ratio_mask = _open_close(ratio_mask)
     contours, _ = cv2.findContours(ratio_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     picks = _pick_best_contour(contours, s_min_ratio, v_min_ratio)
     if picks:
@@ -10,6 +10,18 @@
      Optional YOLO-based detection helpers (local inference).
      Supports single-class ball detection and multi-class queries.
 
+ v1.06  (2026-10-18 00:19)    : Locked model cache
+     • _MODEL_CACHE check-and-insert runs under _MODEL_CACHE_LOCK, so a worker-thread load and a GUI-thread load never build the same model twice.
+ v1.05  (2026-10-18 00:02)    : Slotted YOLOBox with as_tuple()
+     • YOLOBox declares __slots__ (label is now passed explicitly; both constructors already did).
+     • as_tuple() returns (x1, y1, x2, y2, cx, cy, conf, cls, label) in one call.
+ v1.04  (2026-10-17 23:57)    : Cached model display name
+     • YOLOBallDetector.model_name holds basename(model_path), set once in __init__.
+ v1.03  (2026-10-17 23:47)    : Column view of detection lists
+     • YOLOBoxColumns.from_boxes resolves x1/y1/x2/y2/conf/cls/label once into NumPy columns.
+     • Class id 0 is kept (only a missing cls maps to -1); conf=None reads as 0.0.
+ v1.02  (2026-10-17 23:37)    : Share loaded YOLO models by weights path
+     • Detectors that point at the same .pt reuse one lazily-built model (no duplicate loads).
  v1.01  (2026-02-01)          : Multi-class inference support
      • Add analyze_classes() for COCO multi-class usage while keeping analyze() stable.
  v1.00  (2026-01-31)          : Initial version
@@ -20,6 +32,7 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, List, Optional, Sequence, Tuple
@@ -29,13 +42,16 @@ import numpy as np
 
 @dataclass
 class YOLOBox:
+    # Slotted (no per-box __dict__); a class-level default would clash with the slot, so label is passed explicitly.
+    __slots__ = ("x1", "y1", "x2", "y2", "conf", "cls", "label")
+
     x1: float
     y1: float
     x2: float
     y2: float
     conf: float
     cls: int
-    label: str = ""
+    label: str
 
     @property
     def cx(self) -> float:
@@ -45,6 +61,66 @@ class YOLOBox:
     def cy(self) -> float:
         return (self.y1 + self.y2) / 2.0
 
+    def as_tuple(self) -> Tuple[float, float, float, float, float, float, float, int, str]:
+        """(x1, y1, x2, y2, cx, cy, conf, cls, label) in one call."""
+        x1, y1, x2, y2 = self.x1, self.y1, self.x2, self.y2
+        return x1, y1, x2, y2, (x1 + x2) / 2.0, (y1 + y2) / 2.0, self.conf, self.cls, self.label
+
+
+@dataclass
+class YOLOBoxColumns:
+    """Column (SoA) view of a detection list, built once and shared by all consumers.
+
+    Rows whose fields cannot be parsed are dropped, matching the per-box
+    try/except the drawers used. `labels` keeps the raw label (None if absent).
+    """
+
+    dets: list
+    xyxy: np.ndarray    # (N, 4) float64
+    conf: np.ndarray    # (N,) float64
+    cls: np.ndarray     # (N,) int64
+    labels: list
+
+    @classmethod
+    def from_boxes(cls, boxes: Sequence[Any]) -> "YOLOBoxColumns":
+        dets = []
+        rows = []
+        confs = []
+        clss = []
+        labels = []
+        for det in boxes or ():
+            try:
+                row = (
+                    float(getattr(det, "x1", 0)),
+                    float(getattr(det, "y1", 0)),
+                    float(getattr(det, "x2", 0)),
+                    float(getattr(det, "y2", 0)),
+                )
+                cf = float(getattr(det, "conf", 0.0) or 0.0)
+                ci = getattr(det, "cls", None)
+                ci = -1 if ci is None else int(ci)
+            except Exception:
+                continue
+            dets.append(det)
+            rows.append(row)
+            confs.append(cf)
+            clss.append(ci)
+            labels.append(getattr(det, "label", None))
+        return cls(
+            dets=dets,
+            xyxy=np.array(rows, dtype=np.float64).reshape(-1, 4),
+            conf=np.array(confs, dtype=np.float64),
+            cls=np.array(clss, dtype=np.int64),
+            labels=labels,
+        )
+
+
+# Loaded models shared by path: best/orig and the dual-mode coco/mt detectors point at the
+# same two weight files, so each file is read (and its model built) at most once per process.
+_MODEL_CACHE: dict[str, Any] = {}
+# Detectors load lazily from the GUI thread and the Ball-mode inference worker.
+_MODEL_CACHE_LOCK = threading.Lock()
+
 
 class YOLOBallDetector:
     def __init__(
@@ -56,6 +132,7 @@ class YOLOBallDetector:
         imgsz: int = 640,    # default 640 in Ultralytics YOLO, can be 320, 640, 1280, etc. smaller=faster but less accurate
     ):
         self.model_path = model_path or os.getenv("YOLO_MODEL_PATH", "yolov8n.pt")
+        self.model_name = os.path.basename(self.model_path)  # display name, fixed for the detector's lifetime
         self.ball_class_id = int(ball_class_id)
         self.conf = float(conf)
         self.imgsz = int(imgsz)
@@ -77,7 +154,13 @@ class YOLOBallDetector:
             self.last_error = f"ultralytics not installed: {e}"
             return False
         try:
-            self._model = YOLO(self.model_path)
+            key = os.path.abspath(self.model_path)
+            with _MODEL_CACHE_LOCK:
+                model = _MODEL_CACHE.get(key)
+                if model is None:
+                    model = YOLO(self.model_path)
+                    _MODEL_CACHE[key] = model
+            self._model = model
             self._names = getattr(self._model, "names", None)
             return True
         except Exception as e:
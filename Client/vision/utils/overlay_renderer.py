@@ -10,6 +10,34 @@
      Overlay drawing helpers extracted from mtDogMain.py. Preserves all
      visual output for AI/YOLO overlays, probe boxes, and labeling UI.
 
+ v1.14  (2026-10-17 23:55)    : Fixed crosshair option for YOLO markers
+     • draw_yolo_detections(crosshair=True) draws a black-outlined cyan '+' and skips the per-center HSV sample.
+     • _clip_boxes(sample_hsv=False) leaves hsv as None.
+ v1.13  (2026-10-17 23:53)    : Batched box outlines
+     • _draw_rects draws 8+ boxes of one style with a single cv2.polylines call (same pixels as cv2.rectangle).
+     • YOLO/probe/dual drawers outline all boxes first, then labels and markers on top.
+ v1.12  (2026-10-17 23:52)    : Vectorized dual-model box coordinates
+     • _box_coords factors the one-pass NumPy round/clip out of _clip_boxes.
+     • draw_yolo_dual_detections reads coordinates from the shared columns instead of per-box int(round(float(getattr()))) chains; active bbox parsed once per call.
+ v1.11  (2026-10-17 23:51)    : LRU text strip cache
+     • _blit_text evicts the least recently used strip instead of clearing the whole cache at the bound.
+     • Whole-string strips stay the sprite unit: per-glyph blits cost ~2x a putText pair (Python per-glyph overhead).
+ v1.10  (2026-10-17 23:50)    : ROI-only center marker blend
+     • _draw_center_marker copies/blends a 17x17 patch instead of the whole frame per detection (pixel-identical).
+ v1.09  (2026-10-17 23:47)    : Vectorized YOLO box clipping
+     • _clip_boxes rounds/clips/validates all boxes on YOLOBoxColumns in one NumPy pass.
+     • Columns are memoized per detection list, so the debug view and main frame share one conversion.
+ v1.08  (2026-10-17 23:46)    : Single outlined-label helper
+     • _put_text_shadowed replaces every black-outline + fill putText pair in the AI/YOLO/probe/dual drawers.
+     • Repeating labels (class + conf, probe labels, score/latency) use the cached strip; live coordinate/HSV text still strokes glyphs.
+ v1.07  (2026-10-17 23:44)    : Cache outlined score/latency text
+     • _blit_text renders each (text, scale, color) once and blends the cached strip per frame.
+     • text1/text2 (live coords/HSV) still use cv2.putText.
+ v1.06  (2026-10-17 23:43)    : Vectorize AI detection coordinates
+     • draw_ai_detections denormalizes, rounds and clips all (x, y, r) in one NumPy pass.
+ v1.05  (2026-10-17 23:43)    : Sample HSV per pixel instead of per frame
+     • _sample_hsv converts a 1x1 patch; AI/YOLO/probe drawers no longer cvtColor the full frame.
+     • _clip_boxes parses/clips boxes and samples centers before drawing (output unchanged).
  v1.04  (2026-02-01)          : mt_Ball label placement/color
      • Render mt_Ball label at bottom of box using distinct text color.
      • Normalize label casing to mt_Ball / Sport_Ball.
@@ -31,8 +59,27 @@ import time
 import cv2
 import numpy as np
 
+from vision.legacy.mtBallDetectYOLO import YOLOBoxColumns
+
+
+# Bound on cached outlined-text strips (score/latency strings repeat, but keep memory flat).
+_TEXT_CACHE_MAX = 256
+# Detection lists whose column views are kept (main + probe + compare lists per frame).
+_BOX_COLUMNS_MAX = 4
+# Half-size of the patch blended by _draw_center_marker (markerSize=10 cross + margin).
+_MARKER_PAD = 8
+# Box count from which outlines go through one cv2.polylines call (below it, per-box
+# cv2.rectangle is cheaper than building the point array).
+_POLY_BATCH_MIN = 8
+
 
 class OverlayRenderer:
+    def __init__(self):
+        # (text, scale, color) -> (offset, gain, dx, dy) for _blit_text.
+        self._text_cache: dict[tuple, tuple[np.ndarray, np.ndarray, int, int]] = {}
+        # id(list) -> (list, YOLOBoxColumns); holding the list keeps its id from being reused.
+        self._box_columns: dict[int, tuple[list, YOLOBoxColumns]] = {}
+
     @staticmethod
     def _contrast_bgr_from_hsv(h: int, s: int, v: int) -> tuple[int, int, int]:
         try:
@@ -56,28 +103,166 @@ class OverlayRenderer:
             h, w = img.shape[:2]
             cx = max(0, min(w - 1, int(cx)))
             cy = max(0, min(h - 1, int(cy)))
-            overlay = img.copy()
+            # Blend only the marker's neighbourhood (not a full-frame copy + addWeighted per detection).
+            x0, y0 = max(0, cx - _MARKER_PAD), max(0, cy - _MARKER_PAD)
+            x1, y1 = min(w, cx + _MARKER_PAD + 1), min(h, cy + _MARKER_PAD + 1)
+            roi = img[y0:y1, x0:x1]
+            overlay = roi.copy()
             cv2.drawMarker(
                 overlay,
-                (cx, cy),
+                (cx - x0, cy - y0),
                 bgr,
                 markerType=cv2.MARKER_CROSS,
                 markerSize=10,
                 thickness=1,
             )
-            cv2.addWeighted(overlay, float(alpha), img, 1.0 - float(alpha), 0, img)
+            cv2.addWeighted(overlay, float(alpha), roi, 1.0 - float(alpha), 0, roi)
         except Exception:
             return
 
+    @staticmethod
+    def _draw_crosshair(img, cx: int, cy: int, *, half: int = 3):
+        """Fixed cyan '+' with a black outline (no HSV sample / blend needed)."""
+        for color, th in (((0, 0, 0), 2), ((255, 255, 0), 1)):
+            cv2.line(img, (cx - half, cy), (cx + half, cy), color, th)
+            cv2.line(img, (cx, cy - half), (cx, cy + half), color, th)
+
+    @staticmethod
+    def _sample_hsv(frame_bgr, x: int, y: int) -> tuple[int, int, int]:
+        """HSV of one pixel (1x1 cvtColor instead of converting the whole frame)."""
+        try:
+            px = np.ascontiguousarray(frame_bgr[y : y + 1, x : x + 1])
+            H, S, V = cv2.cvtColor(px, cv2.COLOR_BGR2HSV)[0, 0]
+            return int(H), int(S), int(V)
+        except Exception:
+            return 0, 0, 0
+
+    def _put_text_shadowed(self, img, text: str, org, color, *, scale: float = 0.45, cached: bool = False):
+        """Outlined label: black 2px outline + colored 1px fill.
+
+        `cached=True` for strings that repeat across frames (labels, quantized scores);
+        those blit a pre-rendered strip instead of stroking glyphs twice.
+        """
+        if cached:
+            self._blit_text(img, text, org, color, scale=scale)
+            return
+        cv2.putText(img, text, org, cv2.FONT_HERSHEY_SIMPLEX, scale, (0, 0, 0), 2)
+        cv2.putText(img, text, org, cv2.FONT_HERSHEY_SIMPLEX, scale, color, 1)
+
+    def _blit_text(self, frame_bgr, text: str, org: tuple[int, int], color, *, scale: float = 0.45):
+        """Outlined putText (black 2px + colored 1px) via a cached pre-rendered strip.
+
+        The two putText passes are an affine map of the background per pixel
+        (out = P + K * bg, antialiasing included), so P/K are rendered once per
+        distinct (text, scale, color) and each frame only blends the strip.
+        """
+        key = (text, scale, color)
+        cache = self._text_cache
+        entry = cache.pop(key, None)
+        if entry is None:
+            (tw, th), base = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 2)
+            pad = 3
+            shape = (th + base + 2 * pad, tw + 2 * pad, 3)
+            o = (pad, pad + th)
+            on_black = np.zeros(shape, dtype=np.uint8)
+            on_white = np.full(shape, 255, dtype=np.uint8)
+            for canvas in (on_black, on_white):
+                cv2.putText(canvas, text, o, cv2.FONT_HERSHEY_SIMPLEX, scale, (0, 0, 0), 2)
+                cv2.putText(canvas, text, o, cv2.FONT_HERSHEY_SIMPLEX, scale, color, 1)
+            offset = on_black.astype(np.float32)
+            gain = (on_white.astype(np.float32) - on_black) / 255.0
+            if len(cache) >= _TEXT_CACHE_MAX:
+                # Evict the least recently blitted strip (hits are re-inserted at the end).
+                del cache[next(iter(cache))]
+            entry = (offset, gain, pad, pad + th)
+        cache[key] = entry
+        offset, gain, dx, dy = entry
+
+        # Clip the strip to the frame (text near edges is partially visible, like putText).
+        h, w = frame_bgr.shape[:2]
+        x0 = int(org[0]) - dx
+        y0 = int(org[1]) - dy
+        sh, sw = offset.shape[:2]
+        fx0, fy0 = max(0, x0), max(0, y0)
+        fx1, fy1 = min(w, x0 + sw), min(h, y0 + sh)
+        if fx1 <= fx0 or fy1 <= fy0:
+            return
+        sx0, sy0 = fx0 - x0, fy0 - y0
+        sx1, sy1 = sx0 + (fx1 - fx0), sy0 + (fy1 - fy0)
+        roi = frame_bgr[fy0:fy1, fx0:fx1]
+        scaled = cv2.multiply(roi, gain[sy0:sy1, sx0:sx1], dtype=cv2.CV_32F)
+        cv2.add(scaled, offset[sy0:sy1, sx0:sx1], dst=roi, dtype=cv2.CV_8U)  # saturating, rounded
+
+    def _columns_for(self, detections) -> YOLOBoxColumns:
+        """Columns for a detection list, converted once per list (lists are replaced, not mutated)."""
+        entry = self._box_columns.get(id(detections))
+        if entry is not None and entry[0] is detections:
+            return entry[1]
+        cols = YOLOBoxColumns.from_boxes(detections)
+        if len(self._box_columns) >= _BOX_COLUMNS_MAX:
+            self._box_columns.clear()
+        self._box_columns[id(detections)] = (detections, cols)
+        return cols
+
+    @staticmethod
+    def _draw_rects(frame_bgr, rects, color, thickness: int) -> None:
+        """Outline [(x1, y1, x2, y2), ...] boxes; same pixels as cv2.rectangle per box."""
+        if len(rects) < _POLY_BATCH_MIN:
+            for x1, y1, x2, y2 in rects:
+                cv2.rectangle(frame_bgr, (x1, y1), (x2, y2), color, thickness)
+            return
+        r = np.asarray(rects, dtype=np.int32)
+        cv2.polylines(frame_bgr, r[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2), True, color, thickness)
+
+    def _box_coords(self, frame_bgr, detections) -> tuple[YOLOBoxColumns, list, list]:
+        """Round/clip every box of a detection list in one NumPy pass.
+
+        Returns (cols, kept row indices, [x1, y1, x2, y2, cx, cy] int rows); degenerate
+        or non-finite boxes are left out of the kept indices.
+        """
+        h, w = frame_bgr.shape[:2]
+        cols = self._columns_for(detections)
+        if not cols.dets:
+            return cols, [], []
+        xyxy = np.rint(cols.xyxy)
+        finite = np.isfinite(xyxy).all(axis=1)
+        xyxy[~finite] = 0
+        np.clip(xyxy[:, 0::2], 0, w - 1, out=xyxy[:, 0::2])
+        np.clip(xyxy[:, 1::2], 0, h - 1, out=xyxy[:, 1::2])
+        x1, y1, x2, y2 = xyxy.T
+        keep = finite & (x2 > x1) & (y2 > y1)
+        cx = np.clip(np.rint((x1 + x2) / 2.0), 0, w - 1)
+        cy = np.clip(np.rint((y1 + y2) / 2.0), 0, h - 1)
+        ints = np.stack([x1, y1, x2, y2, cx, cy], axis=1).astype(np.int64).tolist()
+        return cols, np.flatnonzero(keep).tolist(), ints
+
+    def _clip_boxes(self, frame_bgr, detections, *, default_label: str, sample_hsv: bool = True) -> list:
+        """Parse/clip YOLO boxes and sample each center's HSV before anything is drawn.
+
+        Returns (det, x1, y1, x2, y2, conf, label, cls_id, cx, cy, hsv) tuples; degenerate boxes are dropped.
+        hsv is None when `sample_hsv=False`.
+        """
+        cols, kept, ints = self._box_coords(frame_bgr, detections)
+        boxes = []
+        for i in kept:
+            bx1, by1, bx2, by2, bcx, bcy = ints[i]
+            label = str(cols.labels[i] or default_label)
+            boxes.append(
+                (
+                    cols.dets[i], bx1, by1, bx2, by2, float(cols.conf[i]), label, int(cols.cls[i]),
+                    bcx, bcy, self._sample_hsv(frame_bgr, bcx, bcy) if sample_hsv else None,
+                )
+            )
+        return boxes
+
     def draw_ai_detections(self, frame_bgr, detections, *, ai_detector=None):
         if frame_bgr is None or not detections:
             return
-        try:
-            hsv_img = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
-        except Exception:
-            hsv_img = None
 
         h, w = frame_bgr.shape[:2]
+        # Gather raw (x, y, r) per detection; the numeric work below is one NumPy pass.
+        kept = []
+        raw = []
         for det in detections:
             try:
                 if isinstance(det, dict):
@@ -88,21 +273,38 @@ class OverlayRenderer:
                     x_val = getattr(det, "x", 0)
                     y_val = getattr(det, "y", 0)
                     r_val = getattr(det, "r", 0)
-                x_f = float(x_val)
-                y_f = float(y_val)
-                r_f = float(r_val)
-                if 0 < x_f <= 1.0 and 0 < y_f <= 1.0 and w > 1 and h > 1:
-                    x_f *= w
-                    y_f *= h
-                if 0 < r_f <= 1.0 and min(w, h) > 1:
-                    r_f *= min(w, h)
-                x = int(round(x_f))
-                y = int(round(y_f))
-                r = int(round(r_f))
+                raw.append((float(x_val), float(y_val), float(r_val)))
             except Exception:
                 continue
-            x = max(0, min(w - 1, x))
-            y = max(0, min(h - 1, y))
+            kept.append(det)
+        if not raw:
+            return
+
+        xyr = np.array(raw, dtype=np.float64)
+        finite = np.isfinite(xyr).all(axis=1)
+        if not finite.all():
+            kept = [det for det, ok in zip(kept, finite.tolist()) if ok]
+            xyr = xyr[finite]
+        xs, ys, rs = xyr[:, 0], xyr[:, 1], xyr[:, 2]
+        # Normalized (0, 1] coordinates/radii scale to pixels.
+        if w > 1 and h > 1:
+            norm = (xs > 0) & (xs <= 1.0) & (ys > 0) & (ys <= 1.0)
+            xs[norm] *= w
+            ys[norm] *= h
+        if min(w, h) > 1:
+            rs[(rs > 0) & (rs <= 1.0)] *= min(w, h)
+        np.rint(xyr, out=xyr)
+        np.clip(xs, 0, w - 1, out=xs)
+        np.clip(ys, 0, h - 1, out=ys)
+        np.clip(rs, -1, max(w, h), out=rs)  # drawing clamps r to [1, max(w, h)] anyway
+
+        # Sample HSV before any drawing touches the frame.
+        points = [
+            (det, x, y, r, self._sample_hsv(frame_bgr, x, y))
+            for det, (x, y, r) in zip(kept, xyr.astype(np.int64).tolist())
+        ]
+
+        for det, x, y, r, (H, S, V) in points:
             r_draw = r
             d_text = None
             if r <= 0:
@@ -119,13 +321,6 @@ class OverlayRenderer:
             sample_r = max(3, int(round(r_draw / 2)))
             cv2.circle(frame_bgr, (x, y), int(sample_r), (255, 0, 255), 1)
 
-            H = S = V = 0
-            if hsv_img is not None:
-                try:
-                    H, S, V = [int(v) for v in hsv_img[y, x]]
-                except Exception:
-                    H, S, V = 0, 0, 0
-
             tx = min(w - 1, x + 10)
             ty = max(15, y - 10)
             text1 = f"{d_text}px, ({x},{y})"
@@ -152,24 +347,21 @@ class OverlayRenderer:
             latency_s = float(getattr(ai_detector, "last_latency_s", 0.0) or 0.0) if ai_detector is not None else 0.0
             text3 = f"score {int(round(score_f * 100))}"
             text4 = f"latency {latency_s:.1f}s" if latency_s > 0 else "latency --.-s"
-            cv2.putText(frame_bgr, text1, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 0, 0), 2)
-            cv2.putText(frame_bgr, text1, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 255), 1)
-            cv2.putText(frame_bgr, text2, (tx, ty + 16), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 0, 0), 2)
-            cv2.putText(frame_bgr, text2, (tx, ty + 16), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 255), 1)
-            cv2.putText(frame_bgr, text3, (tx, ty + 32), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 0, 0), 2)
-            cv2.putText(frame_bgr, text3, (tx, ty + 32), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 255), 1)
-            cv2.putText(frame_bgr, text4, (tx, ty + 48), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 0, 0), 2)
-            cv2.putText(frame_bgr, text4, (tx, ty + 48), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 255), 1)
-
-    def draw_yolo_detections(self, frame_bgr, detections):
+            self._put_text_shadowed(frame_bgr, text1, (tx, ty), (0, 255, 255))
+            self._put_text_shadowed(frame_bgr, text2, (tx, ty + 16), (0, 255, 255))
+            # score/latency strings repeat frame to frame -> cached strips (text1/text2 carry live coords/HSV).
+            self._put_text_shadowed(frame_bgr, text3, (tx, ty + 32), (0, 255, 255), cached=True)
+            self._put_text_shadowed(frame_bgr, text4, (tx, ty + 48), (0, 255, 255), cached=True)
+
+    def draw_yolo_detections(self, frame_bgr, detections, *, crosshair: bool = False):
+        """YOLO boxes + labels + center markers.
+
+        `crosshair=True` (debug view) draws a fixed cyan crosshair instead of the
+        HSV-contrast blended marker, skipping the per-center HSV sample.
+        """
         if frame_bgr is None or not detections:
             return
         h, w = frame_bgr.shape[:2]
-        hsv_img = None
-        try:
-            hsv_img = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
-        except Exception:
-            hsv_img = None
         # Determine "top" detection by confidence (do not assume list order).
         try:
             top_det = max(detections, key=lambda d: float(getattr(d, "conf", 0.0) or 0.0))
@@ -179,51 +371,28 @@ class OverlayRenderer:
         top_color = (0, 255, 0)          # green (BGR)
         other_color = (255, 220, 140)    # light blue (BGR)
 
-        for det in detections:
-            try:
-                x1 = int(round(float(getattr(det, "x1", 0))))
-                y1 = int(round(float(getattr(det, "y1", 0))))
-                x2 = int(round(float(getattr(det, "x2", 0))))
-                y2 = int(round(float(getattr(det, "y2", 0))))
-                conf = float(getattr(det, "conf", 0.0))
-                label = str(getattr(det, "label", "ball") or "ball")
-            except Exception:
-                continue
-            x1 = max(0, min(w - 1, x1))
-            y1 = max(0, min(h - 1, y1))
-            x2 = max(0, min(w - 1, x2))
-            y2 = max(0, min(h - 1, y2))
-            if x2 <= x1 or y2 <= y1:
-                continue
-
+        boxes = self._clip_boxes(frame_bgr, detections, default_label="ball", sample_hsv=not crosshair)
+        # Outlines first (batched), labels/markers on top.
+        self._draw_rects(frame_bgr, [b[1:5] for b in boxes if b[0] is not top_det], other_color, 1)
+        self._draw_rects(frame_bgr, [b[1:5] for b in boxes if b[0] is top_det], top_color, 1)
+        for det, x1, y1, x2, y2, conf, label, _cls_id, cx, cy, hsv in boxes:
             # Top-confidence object highlighted in green; others use light blue.
             color = top_color if det is top_det else other_color
-            cv2.rectangle(frame_bgr, (x1, y1), (x2, y2), color, 1)
             label_disp = "Ball" if "ball" in label.lower() else (label.strip().title() or "Obj")
             txt = f"{label_disp} {conf:.2f}"
             ty = max(15, y1 - 6)
             tx = max(0, min(w - 1, x1 + 2))
-            cv2.putText(frame_bgr, txt, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 2)
-            cv2.putText(frame_bgr, txt, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
+            self._put_text_shadowed(frame_bgr, txt, (tx, ty), color, scale=0.5, cached=True)
 
             # Center dot + coords
-            cx = int(round((x1 + x2) / 2.0))
-            cy = int(round((y1 + y2) / 2.0))
-            cx = max(0, min(w - 1, cx))
-            cy = max(0, min(h - 1, cy))
-            try:
-                if hsv_img is not None:
-                    Hc, Sc, Vc = [int(v) for v in hsv_img[cy, cx]]
-                else:
-                    Hc, Sc, Vc = 0, 0, 0
-            except Exception:
-                Hc, Sc, Vc = 0, 0, 0
-            self._draw_center_marker(frame_bgr, cx, cy, self._contrast_bgr_from_hsv(Hc, Sc, Vc), alpha=0.5)
+            if crosshair:
+                self._draw_crosshair(frame_bgr, cx, cy)
+            else:
+                self._draw_center_marker(frame_bgr, cx, cy, self._contrast_bgr_from_hsv(*hsv), alpha=0.5)
             c_txt = f"({cx},{cy})"
             c_ty = min(h - 5, ty + 16)
             c_tx = max(0, min(w - 1, x1 + 2))
-            cv2.putText(frame_bgr, c_txt, (c_tx, c_ty), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 0, 0), 2)
-            cv2.putText(frame_bgr, c_txt, (c_tx, c_ty), cv2.FONT_HERSHEY_SIMPLEX, 0.45, color, 1)
+            self._put_text_shadowed(frame_bgr, c_txt, (c_tx, c_ty), color)
 
     def draw_yolo_dual_detections(self, frame_bgr, coco_detections, mt_detections, *, active_target=None):
         """Draw dual-model detections.
@@ -266,39 +435,19 @@ class OverlayRenderer:
                 return f"cls{int(cls_id)}"
             return (det_label or "Obj").strip().replace(" ", "_").title().replace("_", "_")
 
-        def _draw(det, *, base_color, thickness: int):
+        active_xyxy = None
+        if active_bbox is not None:
             try:
-                x1 = int(round(float(getattr(det, "x1", 0.0))))
-                y1 = int(round(float(getattr(det, "y1", 0.0))))
-                x2 = int(round(float(getattr(det, "x2", 0.0))))
-                y2 = int(round(float(getattr(det, "y2", 0.0))))
-                conf = float(getattr(det, "conf", 0.0) or 0.0)
-                label = str(getattr(det, "label", "") or "")
-                cls_id = getattr(det, "cls", None)
+                active_xyxy = [float(v) for v in active_bbox]
+                ax1, ay1, ax2, ay2 = active_xyxy
             except Exception:
-                return
-
-            x1 = max(0, min(w - 1, x1))
-            y1 = max(0, min(h - 1, y1))
-            x2 = max(0, min(w - 1, x2))
-            y2 = max(0, min(h - 1, y2))
-            if x2 <= x1 or y2 <= y1:
-                return
-
-            color = base_color
-            draw_th = int(thickness)
-            if active_bbox is not None:
-                try:
-                    ax1, ay1, ax2, ay2 = [float(v) for v in active_bbox]
-                    if abs(float(x1) - ax1) < 2 and abs(float(y1) - ay1) < 2 and abs(float(x2) - ax2) < 2 and abs(float(y2) - ay2) < 2:
-                        color = active_color
-                        draw_th = max(draw_th, 3)
-                except Exception:
-                    pass
+                active_xyxy = None
 
-            cv2.rectangle(frame_bgr, (x1, y1), (x2, y2), color, draw_th)
-
-            label_disp = _norm_label(label, cls_id)
+        def _label(cols, i, row, color):
+            x1, y1, x2, y2, cx, cy = row
+            conf = float(cols.conf[i])
+            label = str(cols.labels[i] or "")
+            label_disp = _norm_label(label, getattr(cols.dets[i], "cls", None))
             txt = f"{label_disp} {conf:.2f}"
             tx = max(0, min(w - 1, x1 + 2))
             if label_disp == "mt_Ball" and color != active_color:
@@ -307,74 +456,54 @@ class OverlayRenderer:
             else:
                 ty = max(15, y1 - 6)
                 tcolor = color
-            cv2.putText(frame_bgr, txt, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 2)
-            cv2.putText(frame_bgr, txt, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.5, tcolor, 1)
+            self._put_text_shadowed(frame_bgr, txt, (tx, ty), tcolor, scale=0.5, cached=True)
 
             # Only mark the active target center to reduce clutter.
             if color == active_color:
-                cx = int(round((x1 + x2) / 2.0))
-                cy = int(round((y1 + y2) / 2.0))
-                cx = max(0, min(w - 1, cx))
-                cy = max(0, min(h - 1, cy))
                 cv2.circle(frame_bgr, (cx, cy), 2, active_color, -1)
 
-        for det in (coco_detections or []):
-            _draw(det, base_color=coco_color, thickness=1)
-        for det in (mt_detections or []):
-            _draw(det, base_color=mt_color, thickness=2)
+        styled = []
+        rects_by_style: dict[tuple, list] = {}
+        for dets, base_color, thickness in ((coco_detections, coco_color, 1), (mt_detections, mt_color, 2)):
+            if not dets:
+                continue
+            cols, kept, ints = self._box_coords(frame_bgr, dets)
+            for i in kept:
+                row = ints[i]
+                x1, y1, x2, y2 = row[:4]
+                color = base_color
+                draw_th = thickness
+                if active_xyxy is not None:
+                    if abs(x1 - ax1) < 2 and abs(y1 - ay1) < 2 and abs(x2 - ax2) < 2 and abs(y2 - ay2) < 2:
+                        color = active_color
+                        draw_th = max(draw_th, 3)
+                styled.append((cols, i, row, color))
+                rects_by_style.setdefault((color, draw_th), []).append(row[:4])
+
+        # Outlines first (one batch per color/thickness), labels on top.
+        for (color, draw_th), rects in rects_by_style.items():
+            self._draw_rects(frame_bgr, rects, color, draw_th)
+        for cols, i, row, color in styled:
+            _label(cols, i, row, color)
 
     def draw_yolo_probe_boxes(self, frame_bgr, detections):
         if frame_bgr is None or not detections:
             return
         h, w = frame_bgr.shape[:2]
-        hsv_img = None
-        try:
-            hsv_img = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
-        except Exception:
-            hsv_img = None
-        for det in detections:
-            try:
-                x1 = int(round(float(getattr(det, "x1", 0))))
-                y1 = int(round(float(getattr(det, "y1", 0))))
-                x2 = int(round(float(getattr(det, "x2", 0))))
-                y2 = int(round(float(getattr(det, "y2", 0))))
-                conf = float(getattr(det, "conf", 0.0))
-                label = str(getattr(det, "label", "cls") or "cls")
-                cls_id = int(getattr(det, "cls", -1) or -1)
-            except Exception:
-                continue
-            x1 = max(0, min(w - 1, x1))
-            y1 = max(0, min(h - 1, y1))
-            x2 = max(0, min(w - 1, x2))
-            y2 = max(0, min(h - 1, y2))
-            if x2 <= x1 or y2 <= y1:
-                continue
-
-            color = (255, 140, 0)  # orange probe bbox
-            cv2.rectangle(frame_bgr, (x1, y1), (x2, y2), color, 1)
+        boxes = self._clip_boxes(frame_bgr, detections, default_label="cls")
+        color = (255, 140, 0)  # orange probe bbox
+        self._draw_rects(frame_bgr, [b[1:5] for b in boxes], color, 1)
+        for det, x1, y1, x2, y2, conf, label, cls_id, cx, cy, (Hc, Sc, Vc) in boxes:
             txt = f"PROBE {label} cls{cls_id} {int(round(conf * 100))}%"
             ty = max(15, y1 - 6)
             tx = max(0, min(w - 1, x1 + 2))
-            cv2.putText(frame_bgr, txt, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 0, 0), 2)
-            cv2.putText(frame_bgr, txt, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.45, color, 1)
+            self._put_text_shadowed(frame_bgr, txt, (tx, ty), color, cached=True)
 
-            cx = int(round((x1 + x2) / 2.0))
-            cy = int(round((y1 + y2) / 2.0))
-            cx = max(0, min(w - 1, cx))
-            cy = max(0, min(h - 1, cy))
-            try:
-                if hsv_img is not None:
-                    Hc, Sc, Vc = [int(v) for v in hsv_img[cy, cx]]
-                else:
-                    Hc, Sc, Vc = 0, 0, 0
-            except Exception:
-                Hc, Sc, Vc = 0, 0, 0
             self._draw_center_marker(frame_bgr, cx, cy, self._contrast_bgr_from_hsv(Hc, Sc, Vc), alpha=0.5)
             c_txt = f"({cx},{cy})"
             c_ty = min(h - 5, ty + 16)
             c_tx = max(0, min(w - 1, x1 + 2))
-            cv2.putText(frame_bgr, c_txt, (c_tx, c_ty), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 0, 0), 2)
-            cv2.putText(frame_bgr, c_txt, (c_tx, c_ty), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 200, 0), 1)
+            self._put_text_shadowed(frame_bgr, c_txt, (c_tx, c_ty), (255, 200, 0))
 
     def draw_labeling_overlay(self, vis, label_msg: str, save_msg_ts: float, p1, p2):
         if vis is None:
@@ -11,6 +11,76 @@
      Maintains YOLO detector setup, compare/probe logic, runtime updates,
      training capture, and debug/compare view rendering.
 
+ v1.34  (2026-10-18 00:26)    : Frame size read once in run_test_mode
+     • fh/fw are read from frame_bgr.shape once per call and reused for _yolo_last_frame_shape and the training bbox sanity check.
+ v1.33  (2026-10-18 00:19)    : Ball-mode YOLO inference off the GUI thread
+     • run_ball_mode submits the pre-draw frame to a single-worker executor (_analyze_ball_frame) and applies results on a later tick; one inference in flight, previous detections stay in use meanwhile.
+     • run_test_mode and both dual-YOLO paths wait for an in-flight Ball-mode inference (_ball_infer_busy) before touching the shared models.
+ v1.32  (2026-10-18 00:17)    : Direct reads of YOLO gate state
+     • Interval gate, update counter, adaptive training interval and hist interval read the attributes set in __init__ (no getattr/float/or chains).
+ v1.31  (2026-10-18 00:13)    : Skip unchanged training histogram updates
+     • update_yolo_train_hist_window pushes to the window only when the sample count, buckets, target, progress or label changed (host._yolo_train_hist_key).
+ v1.30  (2026-10-18 00:04)    : Fewer guards in update_debug_view
+     • Dropped try/except around straight-line code (frame copies, YOLOBox field reads, crop math, hist submits, probe/top-box lines).
+     • _crop_box closure -> module-level _crop_box_view reading YOLOBox fields directly.
+     • Guards kept only around overlay drawing and the Qt view/label updates, plus one boundary try/except around the whole refresh.
+ v1.29  (2026-10-18 00:03)    : Cached bucket targets
+     • yolo_train_bucket_allowed reads easy/medium/hard targets from host._yolo_training_bucket_targets, recomputed only when yolo_training_target changes.
+ v1.28  (2026-10-18 00:03)    : Per-slot hi/lo title refresh
+     • Only the title whose snapshot was replaced is re-formatted (median HSV) and re-set; the other keeps its text.
+     • _fmt_snap_title shows the --% placeholder for a missing snapshot.
+ v1.27  (2026-10-18 00:02)    : Bound append for debug info lines
+     • update_debug_view binds info_lines.append once (add_line) instead of an attribute lookup per line.
+ v1.26  (2026-10-18 00:02)    : Recent-box window binding
+     • yolo_train_update_recent binds the deque(maxlen=3) once per call; it already evicts the oldest box, so the container is unchanged.
+ v1.25  (2026-10-18 00:02)    : imencode training writes
+     • _write_training_sample encodes with cv2.imencode and writes the buffer with one open/write (encode and I/O failures reported separately).
+ v1.24  (2026-10-18 00:02)    : Top-box tuple unpack
+     • Debug status, last-hit and training-capture paths unpack the top detection via as_tuple() instead of per-field getattr.
+ v1.23  (2026-10-18 00:01)    : Flat hi/lo title update
+     • _median_hsv_bgr / _fmt_snap_title hoisted to module level; empty crops return None and show (--,--,--).
+     • Title block checks the window/snapshots up front; only the Qt setText calls sit in a try.
+ v1.22  (2026-10-18 00:00)    : Cached compare titles
+     • host._yolo_compare_titles built once in __init__; ensure_yolo_compare_window / apply_yolo_model_choice pass it straight to set_titles.
+     • Replaces the per-call basename f-strings (the _yolo_model_*_basename attrs had no other users).
+ v1.21  (2026-10-17 23:59)    : Division-free box sanity check
+     • yolo_train_box_sane compares max side against 1.6x min side and area x2.5 against the frame (same verdicts).
+ v1.20  (2026-10-17 23:59)    : Persistent compare panes
+     • update_compare_view copies into a reused (2, H, W, 3) buffer instead of two fresh frame copies.
+     • A pane with no detections shows the source frame directly (no copy).
+ v1.19  (2026-10-17 23:58)    : Background training sample writer
+     • yolo_train_save_sample hands the JPEG/label/meta writes to a single-thread executor (frame copied, JPEG quality 90).
+     • At most 8 samples pending; beyond that a sample is dropped and the status line says so.
+ v1.18  (2026-10-17 23:57)    : Module-level _fmt_conf_pct
+     • One branch, no try/except; no longer re-created as a closure on every debug refresh.
+ v1.17  (2026-10-17 23:57)    : Single-template status lines
+     • conf/frame/last-hit pieces are formatted once; each status line is one f-string (text unchanged).
+ v1.16  (2026-10-17 23:57)    : Skip minimized debug/compare windows
+     • update_debug_view/update_compare_view return early when their window is minimized (Qt still reports it visible).
+ v1.15  (2026-10-17 23:57)    : Cached model basenames
+     • Debug status and compare titles use detector.model_name / host._yolo_model_*_basename instead of os.path.basename per refresh.
+ v1.14  (2026-10-17 23:56)    : Format dual status items once
+     • _dual_update_status_text builds each item's display label, color and span once; the Detections and Target lines reuse them (text unchanged).
+ v1.13  (2026-10-17 23:55)    : Local snapshot for debug status text
+     • update_debug_view reads host attributes directly and binds the detector/detection lists once (no getattr/try chains).
+     • Info text unchanged.
+ v1.12  (2026-10-17 23:55)    : Crosshair markers in YOLO debug view
+     • Debug vis draws fixed cyan crosshairs (main frame keeps the HSV-contrast marker).
+ v1.11  (2026-10-17 23:54)    : Non-blocking full-frame histogram submit
+     • Full-frame HSV histogram is only submitted when the worker is idle for that key.
+ v1.10  (2026-10-17 23:49)    : calcHist in _median_hsv
+     • Per-channel cumulative histograms come from cv2.calcHist (no split planes).
+ v1.09  (2026-10-17 23:49)    : Histogram-based hi/lo median HSV
+     • _median_hsv reads the median from per-channel cumulative bincounts instead of sorting (same values).
+ v1.08  (2026-10-17 23:49)    : Read-only crop views
+     • _crop_box returns a read-only view (no per-tick ROI memcpy); snapshots copy on store.
+ v1.07  (2026-10-17 23:48)    : Throttle debug hi/lo panes
+     • hi/lo HSV histograms re-render only for a new snapshot, at most every cv_hist_interval_s.
+     • hi/lo titles (median HSV) recompute only when the snapshots change; crops are views until kept.
+ v1.06  (2026-10-17 23:38)    : Preallocated training confidence buffer
+     • _yolo_training_conf_values is a float32 ndarray + _yolo_training_conf_n (doubles when full).
+ v1.05  (2026-10-17 23:35)    : Async YOLO debug histograms
+     • update_debug_view submits full/hi/lo HSV histograms to the debug window worker.
  v1.03  (2026-02-02)          : Dual YOLO status text formatting
      • Add rich-text title + ranked detection list with color highlights.
      • Provide target summary line aligned with dual-model detections.
@@ -34,8 +104,10 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import numpy as np
@@ -46,16 +118,119 @@ except Exception:
     YOLOBallDetector = None  # type: ignore
 
 
+# Training samples waiting for the writer thread; beyond this, new samples are dropped.
+_TRAIN_SAVE_MAX_PENDING = 8
+# JPEG quality for saved training frames: the cv2.imwrite default, so the writer thread does not degrade samples.
+_TRAIN_JPEG_QUALITY = 95
+
+
+def _write_training_sample(img_path, frame_bgr, label_path, label_line, meta_path, meta) -> None:
+    """Writer-thread half of yolo_train_save_sample: JPEG + YOLO label + meta JSON."""
+    ok, enc = cv2.imencode(".jpg", frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), _TRAIN_JPEG_QUALITY])
+    if not ok:
+        print(f"[TRAIN] Failed to encode {img_path}")
+        return
+    try:
+        with open(img_path, "wb") as f:
+            f.write(enc.tobytes())
+    except Exception as e:
+        print(f"[TRAIN] Failed to write {img_path}: {e}")
+        return
+    try:
+        with open(label_path, "w", encoding="utf-8") as f:
+            f.write(label_line)
+    except Exception as e:
+        print(f"[TRAIN] Failed to write {label_path}: {e}")
+        return
+    try:
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+    except Exception:
+        pass
+
+
+def _analyze_ball_frame(detector, frame_bgr):
+    """Worker-thread half of run_ball_mode: (detections, error message, latency s, frame shape)."""
+    shape = (int(frame_bgr.shape[0]), int(frame_bgr.shape[1]))
+    try:
+        dets = detector.analyze(frame_bgr)
+    except Exception as e:
+        return [], f"YOLO exception: {e}", 0.0, shape
+    err = str(getattr(detector, "last_error", None) or "").strip()
+    try:
+        lat_s = float(getattr(detector, "last_latency_s", 0.0) or 0.0)
+    except Exception:
+        lat_s = 0.0
+    return dets, err, lat_s, shape
+
+
+def _fmt_conf_pct(conf_val: float | None) -> str:
+    """Confidence as a percent: one decimal below 10%, whole percent above."""
+    pct = (conf_val or 0.0) * 100.0
+    return f"{pct:.1f}%" if pct < 10.0 else f"{pct:.0f}%"
+
+
+def _median_hsv_bgr(img_bgr) -> tuple[int, int, int] | None:
+    """Per-channel median HSV of a BGR uint8 crop, or None for an empty crop."""
+    if img_bgr is None or img_bgr.size == 0:
+        return None
+    hsv = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2HSV)
+    n = hsv.shape[0] * hsv.shape[1]
+    # Median from each channel's 256-bin cumulative histogram: O(n), no sort.
+    ranks = np.array([(n - 1) // 2, n // 2])
+    med = []
+    for ch in range(3):
+        cum = np.cumsum(cv2.calcHist([hsv], [ch], None, [256], [0, 256]).ravel())
+        lo_v, hi_v = np.searchsorted(cum, ranks, side="right")
+        med.append(int(round((int(lo_v) + int(hi_v)) / 2.0)))
+    return med[0], med[1], med[2]
+
+
+def _crop_box_view(src, box, pad: int = 6):
+    """Padded crop of a YOLOBox as a read-only view of `src` (callers copy before keeping it)."""
+    h0, w0 = src.shape[:2]
+    x1 = max(0, min(w0 - 1, int(round(box.x1)) - pad))
+    y1 = max(0, min(h0 - 1, int(round(box.y1)) - pad))
+    x2 = max(0, min(w0, int(round(box.x2)) + pad))
+    y2 = max(0, min(h0, int(round(box.y2)) + pad))
+    if x2 <= x1 or y2 <= y1:
+        return None
+    crop = src[y1:y2, x1:x2]
+    crop.flags.writeable = False  # shares memory with the live frame
+    return crop
+
+
+def _fmt_snap_title(tag: str, conf: float | None, center, img_crop) -> str:
+    if img_crop is None:
+        return f"{tag} --%, (--,--), (--,--,--)"
+    cx, cy = center if center is not None else (0, 0)
+    med = _median_hsv_bgr(img_crop)
+    hsv_txt = "--,--,--" if med is None else f"{med[0]},{med[1]},{med[2]}"
+    return f"{tag} {_fmt_conf_pct(conf)}, ({cx},{cy}), ({hsv_txt})"
+
+
 class YoloRuntimeController:
     def __init__(self, host, *, compare_window_factory=None, train_hist_window_factory=None):
         self._host = host
         self._compare_window_factory = compare_window_factory
         self._train_hist_window_factory = train_hist_window_factory
+        # Training samples are encoded/written off the GUI thread (created on first save).
+        self._train_save_executor: ThreadPoolExecutor | None = None
+        self._train_save_slots = threading.BoundedSemaphore(_TRAIN_SAVE_MAX_PENDING)
+        # Ball-mode YOLO inference runs off the GUI thread, one frame in flight at a time
+        # (created on first use; frames arriving while it is busy are skipped).
+        self._ball_infer_executor: ThreadPoolExecutor | None = None
+        self._ball_infer_future = None
 
         # YOLO detector (local inference) used by "Yolo Vision" mode.
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
         host.yolo_model_best_path = os.path.join(project_root, "runs", "detect", "train5", "weights", "best.pt")
         host.yolo_model_orig_path = os.path.join(project_root, "yolov8n.pt")
+        # Compare-window titles only depend on the model paths; built once here.
+        host._yolo_compare_titles = (
+            f"BEST ({os.path.basename(host.yolo_model_best_path)}, cls 0)",
+            f"ORIGINAL ({os.path.basename(host.yolo_model_orig_path)}, cls 32)",
+        )
         host.yolo_model_choice = "best" if os.path.isfile(host.yolo_model_best_path) else "orig"
         host.yolo_detector_best = (
             YOLOBallDetector(model_path=host.yolo_model_best_path, ball_class_id=0) if YOLOBallDetector is not None else None
@@ -84,11 +259,16 @@ class YoloRuntimeController:
         host._yolo_lo_snap = None
         host._yolo_hi_center = None
         host._yolo_lo_center = None
+        # Debug window hi/lo panes: snapshots last rendered + throttle timestamp.
+        host._yolo_dbg_hist_snaps = (None, None)
+        host._yolo_dbg_title_snaps = None  # None: titles not written yet
+        host._yolo_dbg_last_hist_ts = 0.0
 
         # YOLO compare (best vs original)
         host.yolo_compare_enabled = False
         host.yolo_compare_window = None
         host._yolo_compare_detections_best = []
+        host._yolo_compare_buf = None  # (2, H, W, 3) panes reused by update_compare_view
         host._yolo_compare_detections_orig = []
         host._yolo_compare_hit_best = 0
         host._yolo_compare_hit_orig = 0
@@ -125,10 +305,14 @@ class YoloRuntimeController:
         host._yolo_training_dataset_label = ""
         host._yolo_training_dir = None
         host._yolo_training_next_index = 1
-        host._yolo_training_conf_values = []
+        # Confidence history: preallocated float32 buffer + fill count (O(1) append, zero-copy slice).
+        host._yolo_training_conf_values = np.empty(max(256, int(host.yolo_training_target)), dtype=np.float32)
+        host._yolo_training_conf_n = 0
         host._yolo_training_easy = 0
         host._yolo_training_med = 0
         host._yolo_training_hard = 0
+        host._yolo_training_bucket_targets = (None, 0, 0, 0)  # (target, easy, medium, hard)
+        host._yolo_train_hist_key = None  # last (n, easy, med, hard, target, count, label) pushed to the window
         host._yolo_training_recent_boxes = deque(maxlen=3)
         host._yolo_training_last_prompt_ts = 0.0
         host._yolo_training_prompt_idx = 0
@@ -384,7 +568,7 @@ class YoloRuntimeController:
                 label = str(getattr(b, "label", "mt_ball") or "mt_ball")
             except Exception:
                 label = "mt_ball"
-            items.append({"label": label, "conf": conf, "source": "MT"})
+            items.append((label, conf, "MT"))
 
         for b in list(getattr(host, "_yolo_dual_coco_display", []) or []):
             try:
@@ -409,25 +593,25 @@ class YoloRuntimeController:
                     label = "person"
                 else:
                     label = f"cls{ci}" if ci >= 0 else "object"
-            items.append({"label": label, "conf": conf, "source": "COCO"})
+            items.append((label, conf, "COCO"))
 
-        items.sort(key=lambda it: float(it.get("conf", 0.0) or 0.0), reverse=True)
-
-        def _color_for(item_label: str, source: str) -> str:
+        def _color_for(disp_label: str, source: str) -> str:
+            # disp_label is already _fmt_label() output.
             if str(source or "").upper() == "MT":
                 return "#00c853"
-            if _fmt_label(item_label).lower() == "sport_ball":
+            if disp_label.lower() == "sport_ball":
                 return "#ffd54f"
             return "#cfd6df"
 
-        if items:
-            det_parts = []
-            for it in items:
-                lbl = _fmt_label(it.get("label", ""))
-                conf = float(it.get("conf", 0.0) or 0.0)
-                color = _color_for(it.get("label", ""), it.get("source", ""))
-                det_parts.append(_span(f"{lbl} {conf:.2f}", color))
-            det_line = "Detections: " + ", ".join(det_parts)
+        # Display label, colored span and color are formatted once per item, then reused below.
+        items.sort(key=lambda it: it[1], reverse=True)
+        shown = []
+        for label, conf, src in items:
+            lbl = _fmt_label(label)
+            shown.append((lbl, conf, src, _span(f"{lbl} {conf:.2f}", _color_for(lbl, src))))
+
+        if shown:
+            det_line = "Detections: " + ", ".join(it[3] for it in shown)
         else:
             det_line = "Detections: --"
 
@@ -442,16 +626,12 @@ class YoloRuntimeController:
             tgt_color = _color_for(t_cls, t_src)
             tgt_parts = [_span(f"{t_cls} {t_cf:.2f} ({t_src})", tgt_color)]
             added = 0
-            for it in items:
+            for lbl, conf, src, span in shown:
                 if added >= 2:
                     break
-                lbl = _fmt_label(it.get("label", ""))
-                conf = float(it.get("conf", 0.0) or 0.0)
-                src = str(it.get("source", "") or "")
                 if lbl == t_cls and src == t_src and abs(conf - t_cf) < 1e-6:
                     continue
-                color = _color_for(it.get("label", ""), src)
-                tgt_parts.append(_span(f"{lbl} {conf:.2f}", color))
+                tgt_parts.append(span)
                 added += 1
             tgt_line = "Target: " + ", ".join(tgt_parts)
         else:
@@ -657,367 +837,242 @@ class YoloRuntimeController:
 
     def update_debug_view(self, frame_bgr):
         host = self._host
+        # One boundary guard for the whole refresh: a bad frame or detection row skips this update
+        # instead of escaping into the frame timer.
         try:
-            if host.yolo_debug_window is None or not host.yolo_debug_window.isVisible():
+            # Minimized windows still report isVisible(); skip the overlay/status/title work for them too.
+            w = host.yolo_debug_window
+            if w is None or not w.isVisible() or w.isMinimized():
                 return
-        except Exception:
-            return
-
-        vis = None
-        if frame_bgr is not None:
-             # Manual Labeling Capture
-            if host.yolo_labeling_enabled:
-                 try:
-                     host._yolo_labeling_last_frame = frame_bgr.copy()
-                 except Exception:
-                     pass
 
-            try:
-                vis = frame_bgr.copy()
-                if getattr(vis, "size", 0) > 0 and host._yolo_detections:
-                    host.overlay.draw_yolo_detections(vis, host._yolo_detections)
-                elif getattr(vis, "size", 0) > 0 and host._yolo_probe_boxes:
-                    host.overlay.draw_yolo_probe_boxes(vis, host._yolo_probe_boxes)
-                
+            vis = None
+            if frame_bgr is not None:
+                # Manual Labeling Capture
                 if host.yolo_labeling_enabled:
-                     host.overlay.draw_labeling_overlay(
-                         vis,
-                         host._yolo_labeling_msg,
-                         host._yolo_labeling_save_msg_ts,
-                         host._yolo_labeling_p1,
-                         host._yolo_labeling_p2,
-                     )
+                    host._yolo_labeling_last_frame = frame_bgr.copy()
 
-            except Exception:
-                vis = frame_bgr
-
-        full_hist = None
-        hi_img = hi_hist = None
-        lo_img = lo_hist = None
-        try:
-            if frame_bgr is not None and host.yolo_debug_window is not None:
-                full_hist = host.yolo_debug_window._render_hsv_hist(frame_bgr, label_text="frame")
-        except Exception:
-            full_hist = None
-
-        def _crop_box(src, box, pad: int = 6):
-            if src is None or box is None:
-                return None
-            try:
-                h0, w0 = src.shape[:2]
-                x1 = int(round(float(getattr(box, "x1", 0.0))))
-                y1 = int(round(float(getattr(box, "y1", 0.0))))
-                x2 = int(round(float(getattr(box, "x2", 0.0))))
-                y2 = int(round(float(getattr(box, "y2", 0.0))))
-                x1 = max(0, min(w0 - 1, x1 - pad))
-                y1 = max(0, min(h0 - 1, y1 - pad))
-                x2 = max(0, min(w0, x2 + pad))
-                y2 = max(0, min(h0, y2 + pad))
-                if x2 <= x1 or y2 <= y1:
-                    return None
-                return src[y1:y2, x1:x2].copy()
-            except Exception:
-                return None
-
-        try:
-            if frame_bgr is not None and host._yolo_detections and host.yolo_debug_window is not None:
-                hi_box = host._yolo_detections[0]
-                lo_box = host._yolo_detections[-1]
-                hi_img = _crop_box(frame_bgr, hi_box)
-                lo_img = _crop_box(frame_bgr, lo_box)
+                vis = frame_bgr.copy()
+                # Drawing is the one step here that can fail on odd detector output; fall back to the raw frame.
                 try:
-                    hi_conf_now = float(getattr(hi_box, "conf", 0.0) or 0.0)
-                    lo_conf_now = float(getattr(lo_box, "conf", 0.0) or 0.0)
+                    if vis.size > 0 and host._yolo_detections:
+                        host.overlay.draw_yolo_detections(vis, host._yolo_detections, crosshair=True)
+                    elif vis.size > 0 and host._yolo_probe_boxes:
+                        host.overlay.draw_yolo_probe_boxes(vis, host._yolo_probe_boxes)
+
+                    if host.yolo_labeling_enabled:
+                        host.overlay.draw_labeling_overlay(
+                            vis,
+                            host._yolo_labeling_msg,
+                            host._yolo_labeling_save_msg_ts,
+                            host._yolo_labeling_p1,
+                            host._yolo_labeling_p2,
+                        )
                 except Exception:
-                    hi_conf_now = 0.0
-                    lo_conf_now = 0.0
-                if hi_img is not None and (host._yolo_hi_conf is None or hi_conf_now >= float(host._yolo_hi_conf or 0.0)):
+                    vis = frame_bgr
+
+            w.submit_hsv_hist("full", frame_bgr, label_text="frame", skip_if_busy=True)
+
+            dets_now = host._yolo_detections
+            if frame_bgr is not None and dets_now:
+                # Detections are YOLOBox rows (floats already parsed by the detector).
+                hi_box = dets_now[0]
+                lo_box = dets_now[-1]
+                hi_img = _crop_box_view(frame_bgr, hi_box)
+                lo_img = _crop_box_view(frame_bgr, lo_box)
+                hi_conf_now = hi_box.conf
+                lo_conf_now = lo_box.conf
+                if hi_img is not None and (host._yolo_hi_conf is None or hi_conf_now >= host._yolo_hi_conf):
                     host._yolo_hi_conf = hi_conf_now
-                    host._yolo_hi_snap = hi_img
-                    try:
-                        host._yolo_hi_center = (
-                            int(round(float(getattr(hi_box, "cx", 0.0)))),
-                            int(round(float(getattr(hi_box, "cy", 0.0)))),
-                        )
-                    except Exception:
-                        host._yolo_hi_center = None
-                if lo_img is not None and (host._yolo_lo_conf is None or lo_conf_now <= float(host._yolo_lo_conf or 0.0)):
+                    host._yolo_hi_snap = hi_img.copy()
+                    host._yolo_hi_center = (int(round(hi_box.cx)), int(round(hi_box.cy)))
+                if lo_img is not None and (host._yolo_lo_conf is None or lo_conf_now <= host._yolo_lo_conf):
                     host._yolo_lo_conf = lo_conf_now
-                    host._yolo_lo_snap = lo_img
-                    try:
-                        host._yolo_lo_center = (
-                            int(round(float(getattr(lo_box, "cx", 0.0)))),
-                            int(round(float(getattr(lo_box, "cy", 0.0)))),
-                        )
-                    except Exception:
-                        host._yolo_lo_center = None
-        except Exception:
-            pass
-
-        try:
-            if host.yolo_debug_window is not None:
-                hi_img = host._yolo_hi_snap
-                lo_img = host._yolo_lo_snap
-                if hi_img is not None:
-                    hi_hist = host.yolo_debug_window._render_hsv_hist(hi_img, label_text="hi")
-                else:
-                    hi_hist = None
-                if lo_img is not None:
-                    lo_hist = host.yolo_debug_window._render_hsv_hist(lo_img, label_text="lo")
+                    host._yolo_lo_snap = lo_img.copy()
+                    host._yolo_lo_center = (int(round(lo_box.cx)), int(round(lo_box.cy)))
+
+            # hi/lo histograms only change with a new snapshot; re-render at most every cv_hist_interval_s.
+            snaps = (host._yolo_hi_snap, host._yolo_lo_snap)
+            last = host._yolo_dbg_hist_snaps
+            if snaps[0] is not last[0] or snaps[1] is not last[1]:
+                now = time.time()
+                if now - host._yolo_dbg_last_hist_ts >= float(getattr(host, "cv_hist_interval_s", 0.5) or 0.5):
+                    w.submit_hsv_hist("hi", snaps[0], label_text="hi")
+                    w.submit_hsv_hist("lo", snaps[1], label_text="lo")
+                    host._yolo_dbg_hist_snaps = snaps
+                    host._yolo_dbg_last_hist_ts = now
+
+            # Status text: plain attribute reads (all of these are set in YoloRuntimeController.__init__).
+            dets = host._yolo_detections or ()
+            y_int = float(host.yolo_vision_interval_s or 1.0)
+            y_hz = (1.0 / y_int) if y_int > 0 else 0.0
+            y_n = int(host._yolo_update_count or 0)
+            det_n = len(dets)
+            err = str(host._yolo_last_error_msg or "").strip()
+
+            lat_s = float(host._yolo_last_latency_s or 0.0)
+            lat_ms = lat_s * 1000.0 if lat_s > 0 else 0.0
+
+            conf_th = None
+            imgsz = None
+            ball_cls = None
+            model_name = ""
+            detector = host.yolo_detector
+            if detector is not None:
+                conf_th = getattr(detector, "conf", None)
+                imgsz = getattr(detector, "imgsz", None)
+                ball_cls = getattr(detector, "ball_class_id", None)
+                model_name = str(getattr(detector, "model_name", "") or "")
+
+            h_w = host._yolo_last_frame_shape
+            if vis is not None:
+                h_w = vis.shape[:2]
+
+            last_hit_ts = float(host._yolo_last_hit_ts or 0.0)
+            age_s = (time.time() - last_hit_ts) if last_hit_ts > 0 else -1.0
+
+            conf_txt = conf_th if conf_th is not None else "--"
+            imgsz_txt = imgsz if imgsz is not None else "--"
+            info_lines = []
+            add_line = info_lines.append  # bound once; up to ~14 lines per refresh
+            add_line(f"YOLO Vision #{y_n} @ {y_hz:.2f}Hz | det {det_n}")
+            top_box = dets[0] if dets else None
+            top_conf = float(getattr(top_box, "conf", 0.0) or 0.0) if top_box is not None else None
+            det_state = "Detected" if det_n > 0 else "No detection"
+            conf_pct_txt = _fmt_conf_pct(top_conf) if top_conf is not None else "--%"
+            add_line(f"{det_state} | conf {conf_pct_txt}")
+            if det_n == 0:
+                add_line(f"hint: try lower conf or larger imgsz (conf>={conf_txt}, imgsz {imgsz_txt})")
+            cls_txt = f"cls {ball_cls}" if ball_cls is not None else "cls --"
+            lat_txt = f"{lat_ms:.1f}ms" if lat_ms > 0 else "--.-ms"
+            add_line(f"latency {lat_txt} | conf>={conf_txt} | {cls_txt} | imgsz {imgsz_txt}")
+            hit_txt = f"{age_s:.2f}s ago" if age_s >= 0 else "--.-s"
+            hw_txt = f"{h_w[1]}x{h_w[0]}" if h_w else "--x--"
+            add_line(f"frame {hw_txt} | last hit {hit_txt}")
+
+            if model_name:
+                add_line(f"model {model_name}")
+            ds_dir = str(host._yolo_training_dir or "").strip()
+            ds_label = str(host._yolo_training_dataset_label or "").strip()
+            if ds_dir:
+                add_line(f"dataset {ds_label} | {ds_dir}" if ds_label else f"dataset {ds_dir}")
+            compare_on = bool(host.yolo_compare_enabled)
+            add_line(f"ui model={host.yolo_model_choice} | COMPARE MODE: {'ON' if compare_on else 'OFF'}")
+            if compare_on:
+                add_line(">> Comparing: best.pt (Left) vs yolov8n.pt (Right)")
+
+            if top_box is not None:
+                if isinstance(top_box, tuple):
+                    x1, y1, x2, y2, cx, cy, label, cls_id = top_box
+                    conf = float(host._yolo_last_hit_conf or 0.0)
                 else:
-                    lo_hist = None
-        except Exception:
-            pass
-
-        try:
-            y_int = float(getattr(host, "yolo_vision_interval_s", 1.0) or 1.0)
-        except Exception:
-            y_int = 1.0
-        y_hz = (1.0 / y_int) if y_int > 0 else 0.0
-        try:
-            y_n = int(getattr(host, "_yolo_update_count", 0) or 0)
-        except Exception:
-            y_n = 0
-        det_n = len(getattr(host, "_yolo_detections", []) or [])
-        err = str(getattr(host, "_yolo_last_error_msg", "") or "").strip()
-
-        lat_s = float(getattr(host, "_yolo_last_latency_s", 0.0) or 0.0)
-        lat_ms = lat_s * 1000.0 if lat_s > 0 else 0.0
-
-        conf_th = None
-        imgsz = None
-        ball_cls = None
-        model_path = ""
-        try:
-            if host.yolo_detector is not None:
-                conf_th = getattr(host.yolo_detector, "conf", None)
-                imgsz = getattr(host.yolo_detector, "imgsz", None)
-            ball_cls = getattr(host.yolo_detector, "ball_class_id", None)
-            model_path = str(getattr(host.yolo_detector, "model_path", "") or "")
-        except Exception:
-            pass
+                    x1, y1, x2, y2, cx, cy, conf, cls_id, label = top_box.as_tuple()
+                    label = label or "ball"
+                    cls_id = cls_id or -1
+                bw = max(0.0, x2 - x1)
+                bh = max(0.0, y2 - y1)
+                add_line(
+                    f"top {label} cls{cls_id} {_fmt_conf_pct(conf)} | box {int(round(bw))}x{int(round(bh))} @ ({int(round(cx))},{int(round(cy))})"
+                )
 
-        h_w = host._yolo_last_frame_shape
-        if vis is not None:
-            try:
-                h_w = (int(vis.shape[0]), int(vis.shape[1]))
-            except Exception:
-                pass
+            # Probe stats (any-class, lower conf) when no sports-ball hits
+            probe_boxes = host._yolo_probe_boxes or ()
+            probe_n = len(probe_boxes)
+            probe_err = str(host._yolo_probe_error_msg or "").strip()
+            probe_conf = float(host._yolo_probe_conf or 0.001)
+            probe_lat_ms = float(host._yolo_probe_latency_s or 0.0) * 1000.0
+            if probe_n > 0:
+                add_line(
+                    f"probe any-class det {probe_n} conf>={probe_conf} | lat {probe_lat_ms:.1f}ms"
+                )
+                p0 = probe_boxes[0]
+                add_line(f"probe top {p0.label or 'cls'} cls{p0.cls or -1} {int(round(p0.conf * 100))}%")
+            elif probe_err:
+                add_line(f"probe err: {probe_err}")
 
-        last_hit_ts = float(getattr(host, "_yolo_last_hit_ts", 0.0) or 0.0)
-        age_s = (time.time() - last_hit_ts) if last_hit_ts > 0 else -1.0
+            if err:
+                add_line(f"err: {err}")
 
-        def _fmt_conf_pct(conf_val: float | None) -> str:
-            try:
-                cv = float(conf_val or 0.0)
-            except Exception:
-                cv = 0.0
-            pct = cv * 100.0
-            if pct < 1.0:
-                return f"{pct:.1f}%"
-            if pct < 10.0:
-                return f"{pct:.1f}%"
-            return f"{pct:.0f}%"
-
-        info_lines = []
-        info_lines.append(f"YOLO Vision #{y_n} @ {y_hz:.2f}Hz | det {det_n}")
-        top_conf = None
-        if host._yolo_detections:
+            info_text = "\n".join(info_lines)
             try:
-                top_conf = float(getattr(host._yolo_detections[0], "conf", 0.0) or 0.0)
+                w.update_view(
+                    vis,
+                    info_text,
+                    hi_img=snaps[0],
+                    lo_img=snaps[1],
+                )
             except Exception:
-                top_conf = None
-        det_state = "Detected" if det_n > 0 else "No detection"
-        if top_conf is not None:
-            info_lines.append(f"{det_state} | conf {_fmt_conf_pct(top_conf)}")
-        else:
-            info_lines.append(f"{det_state} | conf --%")
-        if det_n == 0:
-            hint = f"hint: try lower conf or larger imgsz (conf>={conf_th if conf_th is not None else '--'}, imgsz {imgsz if imgsz is not None else '--'})"
-            info_lines.append(hint)
-        cls_txt = f"cls {ball_cls}" if ball_cls is not None else "cls --"
-        if lat_ms > 0:
-            info_lines.append(
-                f"latency {lat_ms:.1f}ms | conf>={conf_th if conf_th is not None else '--'} | {cls_txt} | imgsz {imgsz if imgsz is not None else '--'}"
-            )
-        else:
-            info_lines.append(
-                f"latency --.-ms | conf>={conf_th if conf_th is not None else '--'} | {cls_txt} | imgsz {imgsz if imgsz is not None else '--'}"
-            )
-        if h_w:
-            info_lines.append(f"frame {h_w[1]}x{h_w[0]} | last hit {age_s:.2f}s ago" if age_s >= 0 else f"frame {h_w[1]}x{h_w[0]} | last hit --.-s")
-        else:
-            info_lines.append(f"frame --x-- | last hit {age_s:.2f}s ago" if age_s >= 0 else "frame --x-- | last hit --.-s")
-
-        if model_path:
-            info_lines.append(f"model {os.path.basename(model_path)}")
-        try:
-            ds_dir = str(getattr(host, "_yolo_training_dir", "") or "").strip()
-            ds_label = str(getattr(host, "_yolo_training_dataset_label", "") or "").strip()
-        except Exception:
-            ds_dir = ""
-            ds_label = ""
-        if ds_dir:
-            info_lines.append(f"dataset {ds_label} | {ds_dir}" if ds_label else f"dataset {ds_dir}")
-        try:
-            info_lines.append(
-                f"ui model={str(getattr(host, 'yolo_model_choice', 'best'))} | COMPARE MODE: {'ON' if host.yolo_compare_enabled else 'OFF'}"
-            )
-        except Exception:
-            pass
-        if bool(getattr(host, "yolo_compare_enabled", False)):
-            info_lines.append(">> Comparing: best.pt (Left) vs yolov8n.pt (Right)")
-
-        top_box = None
-        if det_n > 0 and host._yolo_detections:
-            top_box = host._yolo_detections[0]
+                return
 
-        if top_box is not None and det_n > 0:
             try:
-                if isinstance(top_box, tuple):
-                    x1, y1, x2, y2, cx, cy, label, cls_id = top_box
-                    conf = float(getattr(host, "_yolo_last_hit_conf", 0.0) or 0.0)
-                else:
-                    x1 = float(getattr(top_box, "x1", 0.0))
-                    y1 = float(getattr(top_box, "y1", 0.0))
-                    x2 = float(getattr(top_box, "x2", 0.0))
-                    y2 = float(getattr(top_box, "y2", 0.0))
-                    cx = float(getattr(top_box, "cx", 0.0))
-                    cy = float(getattr(top_box, "cy", 0.0))
-                    label = str(getattr(top_box, "label", "ball") or "ball")
-                    cls_id = int(getattr(top_box, "cls", -1) or -1)
-                    conf = float(getattr(top_box, "conf", 0.0) or 0.0)
-                bw = max(0.0, x2 - x1)
-                bh = max(0.0, y2 - y1)
-                info_lines.append(
-                    f"top {label} cls{cls_id} {_fmt_conf_pct(conf)} | box {int(round(bw))}x{int(round(bh))} @ ({int(round(cx))},{int(round(cy))})"
-                )
+                if host.yolo_labeling_enabled and host.yolo_label_window is not None and host.yolo_label_window.isVisible():
+                    label_vis = vis.copy() if vis is not None else None
+                    if label_vis is None:
+                        try:
+                            if host._yolo_labeling_last_frame is not None:
+                                label_vis = host._yolo_labeling_last_frame.copy()
+                                host.overlay.draw_labeling_overlay(
+                                    label_vis,
+                                    host._yolo_labeling_msg,
+                                    host._yolo_labeling_save_msg_ts,
+                                    host._yolo_labeling_p1,
+                                    host._yolo_labeling_p2,
+                                )
+                        except Exception:
+                            label_vis = None
+                    msg = str(host._yolo_labeling_msg or "").strip()
+                    class_label = host._yolo_labeling_class_label()
+                    info = f"{msg}  |  Class {class_label}" if msg else f"Class {class_label}"
+                    if ds_dir:
+                        info = f"{info}  |  {ds_label}  {ds_dir}" if ds_label else f"{info}  |  {ds_dir}"
+                    host.yolo_label_window.update_view(label_vis, info, host._yolo_label_help_text())
             except Exception:
                 pass
 
-        # Probe stats (any-class, lower conf) when no sports-ball hits
-        probe_n = len(getattr(host, "_yolo_probe_boxes", []) or [])
-        probe_err = str(getattr(host, "_yolo_probe_error_msg", "") or "").strip()
-        probe_conf = float(getattr(host, "_yolo_probe_conf", 0.001) or 0.001)
-        probe_lat_ms = float(getattr(host, "_yolo_probe_latency_s", 0.0) or 0.0) * 1000.0
-        if probe_n > 0:
-            info_lines.append(
-                f"probe any-class det {probe_n} conf>={probe_conf} | lat {probe_lat_ms:.1f}ms"
-            )
+            prev = host._yolo_dbg_title_snaps or (False, False)  # False never matches a snapshot/None
+            host._yolo_dbg_title_snaps = snaps
+            # Per slot: the median HSV is only recomputed for the snapshot that was replaced.
             try:
-                p0 = (getattr(host, "_yolo_probe_boxes", []) or [])[0]
-                plabel = str(getattr(p0, "label", "cls") or "cls")
-                pcls = int(getattr(p0, "cls", -1) or -1)
-                pconf = float(getattr(p0, "conf", 0.0) or 0.0)
-                info_lines.append(f"probe top {plabel} cls{pcls} {int(round(pconf * 100))}%")
+                if snaps[0] is not prev[0]:
+                    w.hi_title.setText(
+                        _fmt_snap_title("Highest Conf", host._yolo_hi_conf, host._yolo_hi_center, snaps[0])
+                    )
+                if snaps[1] is not prev[1]:
+                    w.lo_title.setText(
+                        _fmt_snap_title("Lowest Conf", host._yolo_lo_conf, host._yolo_lo_center, snaps[1])
+                    )
             except Exception:
                 pass
-        elif probe_err:
-            info_lines.append(f"probe err: {probe_err}")
-
-        if err:
-            info_lines.append(f"err: {err}")
-
-        info_text = "\n".join(info_lines)
-        try:
-            host.yolo_debug_window.update_view(
-                vis,
-                info_text,
-                full_hist=full_hist,
-                hi_img=hi_img,
-                hi_hist=hi_hist,
-                lo_img=lo_img,
-                lo_hist=lo_hist,
-            )
         except Exception:
             return
 
-        try:
-            if host.yolo_labeling_enabled and host.yolo_label_window is not None and host.yolo_label_window.isVisible():
-                label_vis = None
-                if vis is not None:
-                    try:
-                        label_vis = vis.copy()
-                    except Exception:
-                        label_vis = None
-                if label_vis is None:
-                    try:
-                        if host._yolo_labeling_last_frame is not None:
-                            label_vis = host._yolo_labeling_last_frame.copy()
-                            host.overlay.draw_labeling_overlay(
-                                label_vis,
-                                host._yolo_labeling_msg,
-                                host._yolo_labeling_save_msg_ts,
-                                host._yolo_labeling_p1,
-                                host._yolo_labeling_p2,
-                            )
-                    except Exception:
-                        label_vis = None
-                try:
-                    ds_dir = str(getattr(host, "_yolo_training_dir", "") or "").strip()
-                    ds_label = str(getattr(host, "_yolo_training_dataset_label", "") or "").strip()
-                except Exception:
-                    ds_dir = ""
-                    ds_label = ""
-                msg = str(getattr(host, "_yolo_labeling_msg", "") or "").strip()
-                class_label = host._yolo_labeling_class_label()
-                info = f"{msg}  |  Class {class_label}" if msg else f"Class {class_label}"
-                if ds_dir:
-                    info = f"{info}  |  {ds_label}  {ds_dir}" if ds_label else f"{info}  |  {ds_dir}"
-                host.yolo_label_window.update_view(label_vis, info, host._yolo_label_help_text())
-        except Exception:
-            pass
-
-        try:
-            if host.yolo_debug_window is not None and (host._yolo_hi_snap is not None or host._yolo_lo_snap is not None):
-                def _median_hsv(img_bgr):
-                    if img_bgr is None or getattr(img_bgr, "size", 0) == 0:
-                        return 0, 0, 0
-                    try:
-                        hsv = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2HSV)
-                        pts = hsv.reshape(-1, 3)
-                        if pts.size == 0:
-                            return 0, 0, 0
-                        med = np.median(pts, axis=0)
-                        return int(round(med[0])), int(round(med[1])), int(round(med[2]))
-                    except Exception:
-                        return 0, 0, 0
-
-                def _fmt_box(tag: str, conf: float | None, center, img_crop):
-                    try:
-                        cx, cy = center if center is not None else (0, 0)
-                    except Exception:
-                        cx, cy = (0, 0)
-                    conf_v = float(conf or 0.0)
-                    Hc, Sc, Vc = _median_hsv(img_crop)
-                    return f"{tag} {_fmt_conf_pct(conf_v)}, ({cx},{cy}), ({Hc},{Sc},{Vc})"
-
-                host.yolo_debug_window.hi_title.setText(
-                    _fmt_box("Highest Conf", host._yolo_hi_conf, host._yolo_hi_center, host._yolo_hi_snap)
-                )
-                host.yolo_debug_window.lo_title.setText(
-                    _fmt_box("Lowest Conf", host._yolo_lo_conf, host._yolo_lo_center, host._yolo_lo_snap)
-                )
-            elif host.yolo_debug_window is not None:
-                host.yolo_debug_window.hi_title.setText("Highest Conf --%, (--,--), (--,--,--)")
-                host.yolo_debug_window.lo_title.setText("Lowest Conf --%, (--,--), (--,--,--)")
-        except Exception:
-            pass
-
     def update_compare_view(self, frame_bgr):
         host = self._host
         try:
             if not bool(getattr(host, "yolo_compare_enabled", False)):
                 return
-            if host.yolo_compare_window is None or not host.yolo_compare_window.isVisible():
+            w = host.yolo_compare_window
+            if w is None or not w.isVisible() or w.isMinimized():
                 return
         except Exception:
             return
         if frame_bgr is None:
             return
+        best_dets = host._yolo_compare_detections_best
+        orig_dets = host._yolo_compare_detections_orig
+        # Panes live in one persistent (2, H, W, 3) buffer (each pane contiguous for the QImage
+        # wrap); a pane without detections shows frame_bgr itself, so it is not copied at all.
         try:
-            left = frame_bgr.copy()
-            right = frame_bgr.copy()
+            buf = host._yolo_compare_buf
+            if buf is None or buf.shape[1:] != frame_bgr.shape:
+                buf = np.empty((2,) + frame_bgr.shape, dtype=np.uint8)
+                host._yolo_compare_buf = buf
+            left = right = frame_bgr
+            if best_dets:
+                left = buf[0]
+                np.copyto(left, frame_bgr)
+            if orig_dets:
+                right = buf[1]
+                np.copyto(right, frame_bgr)
         except Exception:
             return
 
@@ -1042,13 +1097,13 @@ class YoloRuntimeController:
             pass
 
         try:
-            if host._yolo_compare_detections_best:
-                host.overlay.draw_yolo_dual_detections(left, [], host._yolo_compare_detections_best, active_target=None)
+            if best_dets:
+                host.overlay.draw_yolo_dual_detections(left, [], best_dets, active_target=None)
         except Exception:
             pass
         try:
-            if host._yolo_compare_detections_orig:
-                host.overlay.draw_yolo_dual_detections(right, host._yolo_compare_detections_orig, [], active_target=None)
+            if orig_dets:
+                host.overlay.draw_yolo_dual_detections(right, orig_dets, [], active_target=None)
         except Exception:
             pass
         try:
@@ -1098,9 +1153,7 @@ class YoloRuntimeController:
                 pass
         if host.yolo_compare_window is not None:
             try:
-                left_title = f"BEST ({os.path.basename(host.yolo_model_best_path)}, cls 0)"
-                right_title = f"ORIGINAL ({os.path.basename(host.yolo_model_orig_path)}, cls 32)"
-                host.yolo_compare_window.set_titles(left_title, right_title)
+                host.yolo_compare_window.set_titles(*host._yolo_compare_titles)
             except Exception:
                 pass
         print(f"[YOLO] model -> {choice}")
@@ -1165,9 +1218,7 @@ class YoloRuntimeController:
                 else:
                     return
             
-            left_title = f"BEST ({os.path.basename(host.yolo_model_best_path)}, cls 0)"
-            right_title = f"ORIGINAL ({os.path.basename(host.yolo_model_orig_path)}, cls 32)"
-            host.yolo_compare_window.set_titles(left_title, right_title)
+            host.yolo_compare_window.set_titles(*host._yolo_compare_titles)
 
             # Ensure safe positioning (right of debug window)
             try:
@@ -1227,26 +1278,29 @@ class YoloRuntimeController:
         return inter / union
 
     def yolo_train_box_sane(self, x1, y1, x2, y2, w: int, h: int) -> bool:
-        bw = max(0.0, x2 - x1)
-        bh = max(0.0, y2 - y1)
+        bw = x2 - x1
+        bh = y2 - y1
+        # Cheap rejects first (also covers inverted boxes), then division-free ratio tests.
         if bw < 12 or bh < 12:
             return False
         if w <= 0 or h <= 0:
             return False
-        ar = max(bw / bh, bh / bw) if min(bw, bh) > 0 else 999.0
-        if ar > 1.6:
+        mn, mx = (bw, bh) if bw < bh else (bh, bw)
+        if mx > 1.6 * mn:
             return False
-        if (bw * bh) > (0.40 * float(w * h)):
+        # Area at most 40% of the frame (2.5 == 1 / 0.40).
+        if bw * bh * 2.5 > w * h:
             return False
         return True
 
     def yolo_train_update_recent(self, box) -> bool:
         host = self._host
-        host._yolo_training_recent_boxes.append(box)
-        if len(host._yolo_training_recent_boxes) < 3:
+        recent = host._yolo_training_recent_boxes
+        recent.append(box)  # deque(maxlen=3): oldest box drops out on its own.
+        if len(recent) < 3:
             return False
-        b0, b1, b2 = host._yolo_training_recent_boxes
-        return (self.yolo_train_iou(b0, b1) >= 0.5) and (self.yolo_train_iou(b1, b2) >= 0.5)
+        b0, b1, b2 = recent
+        return self.yolo_train_iou(b0, b1) >= 0.5 and self.yolo_train_iou(b1, b2) >= 0.5
 
     def yolo_train_assign_difficulty(self, conf: float) -> str:
         try:
@@ -1261,10 +1315,16 @@ class YoloRuntimeController:
 
     def yolo_train_bucket_allowed(self, difficulty: str) -> bool:
         host = self._host
-        total = int(host.yolo_training_target or 256)
-        t_easy = int(round(total * 0.30))
-        t_med = int(round(total * 0.40))
-        t_hard = max(0, total - t_easy - t_med)
+        target = host.yolo_training_target
+        cached = host._yolo_training_bucket_targets
+        if cached[0] != target:
+            # 30/40/30 split, recomputed only when the target changes.
+            total = int(target or 256)
+            t_easy = int(round(total * 0.30))
+            t_med = int(round(total * 0.40))
+            cached = (target, t_easy, t_med, max(0, total - t_easy - t_med))
+            host._yolo_training_bucket_targets = cached
+        _, t_easy, t_med, t_hard = cached
         if difficulty == "easy":
             return host._yolo_training_easy < t_easy
         if difficulty == "hard":
@@ -1280,10 +1340,11 @@ class YoloRuntimeController:
         else:
             host._yolo_training_med += 1
 
-    def yolo_train_save_sample(self, frame_bgr, *, x1, y1, x2, y2, conf: float, difficulty: str):
+    def yolo_train_save_sample(self, frame_bgr, *, x1, y1, x2, y2, conf: float, difficulty: str) -> bool:
+        """Queue one auto-labeled sample for the writer thread; False if nothing was queued."""
         host = self._host
         if host._yolo_training_dir is None:
-            return
+            return False
         images_dir = os.path.join(host._yolo_training_dir, "images")
         labels_dir = os.path.join(host._yolo_training_dir, "labels")
         meta_dir = os.path.join(host._yolo_training_dir, "meta")
@@ -1304,33 +1365,40 @@ class YoloRuntimeController:
         bw_n = max(0.0, min(1.0, bw / float(w)))
         bh_n = max(0.0, min(1.0, bh / float(h)))
 
-        try:
-            cv2.imwrite(img_path, frame_bgr)
-        except Exception:
-            return
-
-        try:
-            with open(label_path, "w", encoding="utf-8") as f:
-                f.write(f"0 {cx_n:.6f} {cy_n:.6f} {bw_n:.6f} {bh_n:.6f}\n")
-        except Exception:
-            return
-
+        label_line = f"0 {cx_n:.6f} {cy_n:.6f} {bw_n:.6f} {bh_n:.6f}\n"
         meta = {
             "label_source": "yolo_low_conf",
             "yolo_confidence": float(conf),
             "difficulty": difficulty,
             "notes": "auto-labeled via Yolo Vision",
         }
+
+        # Bounded hand-off: if the writer is behind, drop this sample instead of queueing frames.
+        if not self._train_save_slots.acquire(blocking=False):
+            host._yolo_training_status_msg = "Train: writer busy, sample dropped"
+            return False
+        if self._train_save_executor is None:
+            self._train_save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yolo-train-save")
         try:
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(meta, f, indent=2)
+            future = self._train_save_executor.submit(
+                _write_training_sample, img_path, frame_bgr.copy(), label_path, label_line, meta_path, meta
+            )
         except Exception:
-            pass
+            self._train_save_slots.release()
+            return False
+        future.add_done_callback(lambda _f: self._train_save_slots.release())
 
         host._yolo_training_next_index += 1
         host.yolo_training_count += 1
-        host._yolo_training_conf_values.append(float(conf))
+        buf = host._yolo_training_conf_values
+        n = int(host._yolo_training_conf_n)
+        if n >= buf.shape[0]:
+            buf = np.resize(buf, buf.shape[0] * 2)
+            host._yolo_training_conf_values = buf
+        buf[n] = float(conf)
+        host._yolo_training_conf_n = n + 1
         self.yolo_train_note_bucket(difficulty)
+        return True
 
     def yolo_training_prompt(self):
         host = self._host
@@ -1377,7 +1445,7 @@ class YoloRuntimeController:
         # Start training
         host.yolo_training_enabled = True
         host.yolo_training_count = 0
-        host._yolo_training_conf_values = []
+        host._yolo_training_conf_n = 0
         host._yolo_training_easy = 0
         host._yolo_training_med = 0
         host._yolo_training_hard = 0
@@ -1385,6 +1453,7 @@ class YoloRuntimeController:
         host._yolo_training_status_msg = "Change ball position / lighting for variety"
         host._yolo_training_last_prompt_ts = 0.0
         host._yolo_training_prompt_idx = 0
+        host._yolo_train_hist_key = None
 
         host._yolo_training_interval_default = float(getattr(host, "yolo_vision_interval_s", 1.0) or 1.0)
         self.yolo_train_prepare_dataset()
@@ -1407,23 +1476,50 @@ class YoloRuntimeController:
                 return
         except Exception:
             return
+        # Samples only arrive on saves; skip the header/histogram re-render while nothing changed.
+        n = int(host._yolo_training_conf_n)
+        key = (
+            n,
+            int(host._yolo_training_easy),
+            int(host._yolo_training_med),
+            int(host._yolo_training_hard),
+            int(host.yolo_training_target or 256),
+            int(host.yolo_training_count),
+            str(host._yolo_training_dataset_label or ""),
+        )
+        if key == host._yolo_train_hist_key:
+            return
         try:
             host.yolo_train_hist_window.update_histogram(
-                host._yolo_training_conf_values,
-                easy_n=int(host._yolo_training_easy),
-                med_n=int(host._yolo_training_med),
-                hard_n=int(host._yolo_training_hard),
-                total_target=int(host.yolo_training_target or 256),
-                progress=int(host.yolo_training_count),
-                dataset_label=str(host._yolo_training_dataset_label or ""),
+                host._yolo_training_conf_values[:n],
+                easy_n=key[1],
+                med_n=key[2],
+                hard_n=key[3],
+                total_target=key[4],
+                progress=key[5],
+                dataset_label=key[6],
             )
         except Exception:
-            pass
+            return
+        host._yolo_train_hist_key = key
+
+    def _ball_infer_busy(self) -> bool:
+        """True while a Ball-mode inference is still running; a finished one is dropped (stale here)."""
+        future = self._ball_infer_future
+        if future is None:
+            return False
+        if not future.done():
+            return True
+        self._ball_infer_future = None
+        return False
 
     def run_ball_mode(self, frame_bgr):
         host = self._host
         if bool(getattr(host, "yolo_dual_enabled", False)):
-            self._run_dual_inference(frame_bgr)
+            # The dual detectors share model objects with the Ball-mode worker (Ultralytics is not
+            # thread-safe): skip this tick's dual run while that inference is in flight.
+            if not self._ball_infer_busy():
+                self._run_dual_inference(frame_bgr)
             try:
                 host.overlay.draw_yolo_dual_detections(
                     frame_bgr,
@@ -1471,67 +1567,42 @@ class YoloRuntimeController:
         if not isinstance(getattr(host, "_yolo_detections", None), list):
             host._yolo_detections = []
         now_y = time.time()
+        # Pick up a finished background inference; until then the previous detections stay in use.
         yolo_ran = False
-        if (now_y - float(getattr(host, "_yolo_vision_last_ts", 0.0) or 0.0)) >= float(
-            getattr(host, "yolo_vision_interval_s", 0.25) or 0.25
-        ):
-            host._yolo_vision_last_ts = now_y
+        future = self._ball_infer_future
+        if future is not None and future.done():
+            (
+                host._yolo_detections,
+                host._yolo_last_error_msg,
+                host._yolo_last_latency_s,
+                host._yolo_last_frame_shape,
+            ) = future.result()
+            self._ball_infer_future = future = None
             yolo_ran = True
-            try:
-                host._yolo_update_count = int(getattr(host, "_yolo_update_count", 0) or 0) + 1
-            except Exception:
-                host._yolo_update_count = 1
-            host._yolo_detections = []
-            host._yolo_last_error_msg = ""
-            host._yolo_last_latency_s = 0.0
-            try:
-                if frame_bgr is not None:
-                    host._yolo_last_frame_shape = (int(frame_bgr.shape[0]), int(frame_bgr.shape[1]))
-            except Exception:
-                pass
-            try:
-                host._yolo_detections = host.yolo_detector.analyze(frame_bgr)
-                if getattr(host.yolo_detector, "last_error", None):
-                    host._yolo_last_error_msg = str(host.yolo_detector.last_error or "").strip()
-                try:
-                    host._yolo_last_latency_s = float(getattr(host.yolo_detector, "last_latency_s", 0.0) or 0.0)
-                except Exception:
-                    host._yolo_last_latency_s = 0.0
-            except Exception as e:
-                host._yolo_detections = []
-                host._yolo_last_error_msg = f"YOLO exception: {e}"
-                host._yolo_last_latency_s = 0.0
+            host._yolo_update_count += 1
+        if future is None and now_y - host._yolo_vision_last_ts >= host.yolo_vision_interval_s:
+            host._yolo_vision_last_ts = now_y
+            # The pre-draw snapshot is replaced (never drawn on) each tick, so the worker can read it
+            # while this tick draws overlays on frame_bgr.
+            src = host.last_display_frame_bgr
+            if src is None or src is frame_bgr:
+                src = frame_bgr.copy()
+            if self._ball_infer_executor is None:
+                self._ball_infer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yolo-ball-infer")
+            self._ball_infer_future = self._ball_infer_executor.submit(_analyze_ball_frame, host.yolo_detector, src)
 
         ball_center = None
         if host._yolo_detections:
             b0 = host._yolo_detections[0]
             try:
-                cx = int(round(float(getattr(b0, "cx", 0.0))))
-                cy = int(round(float(getattr(b0, "cy", 0.0))))
-                x1 = float(getattr(b0, "x1", 0.0))
-                y1 = float(getattr(b0, "y1", 0.0))
-                x2 = float(getattr(b0, "x2", 0.0))
-                y2 = float(getattr(b0, "y2", 0.0))
+                x1, y1, x2, y2, fcx, fcy, conf0, cls0, label0 = b0.as_tuple()
+                cx = int(round(fcx))
+                cy = int(round(fcy))
                 rr = 0.5 * max(6.0, min(abs(x2 - x1), abs(y2 - y1)))
                 if yolo_ran:
                     host._yolo_last_hit_ts = now_y
-                try:
-                    host._yolo_last_hit_conf = float(getattr(b0, "conf", 0.0) or 0.0)
-                except Exception:
-                    host._yolo_last_hit_conf = 0.0
-                try:
-                    host._yolo_last_hit_box = (
-                        x1,
-                        y1,
-                        x2,
-                        y2,
-                        float(getattr(b0, "cx", 0.0)),
-                        float(getattr(b0, "cy", 0.0)),
-                        str(getattr(b0, "label", "ball") or "ball"),
-                        int(getattr(b0, "cls", -1) or -1),
-                    )
-                except Exception:
-                    host._yolo_last_hit_box = None
+                host._yolo_last_hit_conf = conf0
+                host._yolo_last_hit_box = (x1, y1, x2, y2, fcx, fcy, label0 or "ball", cls0 or -1)
                 try:
                     host._yolo_last_hit_count = int(len(host._yolo_detections))
                 except Exception:
@@ -1570,7 +1641,10 @@ class YoloRuntimeController:
         # Yolo Vision is a test mode (no motion). Clear any stale close-enough banner.
         host._ball_close_enough = False
         if bool(getattr(host, "yolo_dual_enabled", False)):
-            self._run_dual_inference(frame_bgr)
+            # The dual detectors share model objects with the Ball-mode worker (Ultralytics is not
+            # thread-safe): skip this tick's dual run while that inference is in flight.
+            if not self._ball_infer_busy():
+                self._run_dual_inference(frame_bgr)
             try:
                 host.overlay.draw_yolo_dual_detections(
                     frame_bgr,
@@ -1597,7 +1671,7 @@ class YoloRuntimeController:
                             src,
                             (cx, cy),
                             float(rr or 0.0),
-                            interval_s=float(getattr(host, "yolo_vision_interval_s", 1.0) or 1.0),
+                            interval_s=host.yolo_vision_interval_s,
                         )
             except Exception:
                 pass
@@ -1614,26 +1688,19 @@ class YoloRuntimeController:
                 pass
             return frame_bgr, None
         now_y = time.time()
+        # Frame size, read once for the shape bookkeeping and the training bbox sanity check.
+        fh, fw = frame_bgr.shape[0], frame_bgr.shape[1]
         if bool(getattr(host, "yolo_training_enabled", False)):
-            try:
-                lat_s = float(getattr(host, "_yolo_last_latency_s", 0.0) or 0.0)
-            except Exception:
-                lat_s = 0.0
-            adaptive = max(0.25, (lat_s * 1.2) if lat_s > 0 else 0.25)
-            try:
-                host.yolo_vision_interval_s = float(adaptive)
-            except Exception:
-                pass
+            lat_s = host._yolo_last_latency_s
+            host.yolo_vision_interval_s = max(0.25, (lat_s * 1.2) if lat_s > 0 else 0.25)
+        # A Ball-mode inference may still be running on the shared detector (mode just switched):
+        # hold off until it finishes, then drop its result.
+        ball_busy = self._ball_infer_busy()
         yolo_ran = False
-        if (now_y - float(getattr(host, "_yolo_vision_last_ts", 0.0) or 0.0)) >= float(
-            getattr(host, "yolo_vision_interval_s", 0.25) or 0.25
-        ):
+        if not ball_busy and now_y - host._yolo_vision_last_ts >= host.yolo_vision_interval_s:
             host._yolo_vision_last_ts = now_y
             yolo_ran = True
-            try:
-                host._yolo_update_count = int(getattr(host, "_yolo_update_count", 0) or 0) + 1
-            except Exception:
-                host._yolo_update_count = 1
+            host._yolo_update_count += 1
             host._yolo_detections = []
             host._yolo_last_error_msg = ""
             host._yolo_last_latency_s = 0.0
@@ -1647,11 +1714,7 @@ class YoloRuntimeController:
                         self.apply_yolo_model_choice()
             except Exception:
                 pass
-            try:
-                if frame_bgr is not None:
-                    host._yolo_last_frame_shape = (int(frame_bgr.shape[0]), int(frame_bgr.shape[1]))
-            except Exception:
-                pass
+            host._yolo_last_frame_shape = (fh, fw)
             if host.yolo_detector is None:
                 host._yolo_last_error_msg = "YOLO not available (install ultralytics + weights)"
             else:
@@ -1737,16 +1800,11 @@ class YoloRuntimeController:
             if host._yolo_detections:
                 b0 = host._yolo_detections[0]
                 try:
-                    x1 = float(getattr(b0, "x1", 0.0))
-                    y1 = float(getattr(b0, "y1", 0.0))
-                    x2 = float(getattr(b0, "x2", 0.0))
-                    y2 = float(getattr(b0, "y2", 0.0))
-                    conf = float(getattr(b0, "conf", 0.0) or 0.0)
+                    x1, y1, x2, y2, _cx, _cy, conf, _cls, _label = b0.as_tuple()
                 except Exception:
                     x1 = y1 = x2 = y2 = 0.0
                     conf = 0.0
-                h0, w0 = frame_bgr.shape[:2]
-                if not self.yolo_train_box_sane(x1, y1, x2, y2, w0, h0):
+                if not self.yolo_train_box_sane(x1, y1, x2, y2, fw, fh):
                     host._yolo_training_recent_boxes.clear()
                     host._yolo_training_status_msg = "Train: bbox rejected (sanity)"
                 elif not (0.01 <= conf <= 0.99):
@@ -1763,7 +1821,7 @@ class YoloRuntimeController:
                         else:
                             src = host.last_display_frame_bgr if host.last_display_frame_bgr is not None else frame_bgr
                             try:
-                                self.yolo_train_save_sample(
+                                if self.yolo_train_save_sample(
                                     src,
                                     x1=x1,
                                     y1=y1,
@@ -1771,8 +1829,8 @@ class YoloRuntimeController:
                                     y2=y2,
                                     conf=conf,
                                     difficulty=difficulty,
-                                )
-                                host._yolo_training_status_msg = "Train: saved"
+                                ):
+                                    host._yolo_training_status_msg = "Train: saved"
                             except Exception:
                                 host._yolo_training_status_msg = "Train: save failed"
             else:
@@ -1789,32 +1847,14 @@ class YoloRuntimeController:
         if host._yolo_detections:
             b0 = host._yolo_detections[0]
             try:
-                cx = int(round(float(getattr(b0, "cx", 0.0))))
-                cy = int(round(float(getattr(b0, "cy", 0.0))))
-                x1 = float(getattr(b0, "x1", 0.0))
-                y1 = float(getattr(b0, "y1", 0.0))
-                x2 = float(getattr(b0, "x2", 0.0))
-                y2 = float(getattr(b0, "y2", 0.0))
+                x1, y1, x2, y2, fcx, fcy, conf0, cls0, label0 = b0.as_tuple()
+                cx = int(round(fcx))
+                cy = int(round(fcy))
                 rr = 0.5 * max(6.0, min(abs(x2 - x1), abs(y2 - y1)))
                 if yolo_ran:
                     host._yolo_last_hit_ts = now_y
-                try:
-                    host._yolo_last_hit_conf = float(getattr(b0, "conf", 0.0) or 0.0)
-                except Exception:
-                    host._yolo_last_hit_conf = 0.0
-                try:
-                    host._yolo_last_hit_box = (
-                        x1,
-                        y1,
-                        x2,
-                        y2,
-                        float(getattr(b0, "cx", 0.0)),
-                        float(getattr(b0, "cy", 0.0)),
-                        str(getattr(b0, "label", "ball") or "ball"),
-                        int(getattr(b0, "cls", -1) or -1),
-                    )
-                except Exception:
-                    host._yolo_last_hit_box = None
+                host._yolo_last_hit_conf = conf0
+                host._yolo_last_hit_box = (x1, y1, x2, y2, fcx, fcy, label0 or "ball", cls0 or -1)
                 try:
                     host._yolo_last_hit_count = int(len(host._yolo_detections))
                 except Exception:
@@ -1855,7 +1895,7 @@ class YoloRuntimeController:
                 src,
                 ball_center,
                 rr,
-                interval_s=float(getattr(host, "yolo_vision_interval_s", 1.0) or 1.0),
+                interval_s=host.yolo_vision_interval_s,
             )
         except Exception:
             pass